@@ -1,14 +1,24 @@
 #!/usr/bin/env python3
 # parcing.py
 
+import copy
+import functools
 import inspect
 import json
 from enum import Enum
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from types import MappingProxyType
+from typing import Annotated, List, Dict, Any, Literal, Optional, Tuple, Union
 from datetime import datetime
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import AfterValidator, AliasChoices, BaseModel, BeforeValidator, ConfigDict, Discriminator, Field, NaiveDatetime, Tag, TypeAdapter, ValidationError, WrapValidator, model_validator
 from pydantic.fields import FieldInfo  # Вариант 1
+from pydantic.version import VERSION as PYDANTIC_VERSION, check_pydantic_core_version
+
+# Модели рассчитаны на Pydantic v2: валидация идет через собранный pydantic-core
+if not PYDANTIC_VERSION.startswith('2.') or not check_pydantic_core_version():
+    raise ImportError(
+        f"classes.py requires pydantic 2.x with a matching pydantic-core, got pydantic {PYDANTIC_VERSION}"
+    )
 import argparse
 import sys
 import logging
@@ -659,5608 +669,6884 @@ class ResourceCategory(Enum):
         example="consumable"
     )
       
+# ============= Shared Types =============
+
+# Strings from small closed vocabularies (phase states, type codes, units)
+# repeat across every extracted record. Interning them makes equal values
+# share one object, so comparisons and dict lookups hit the identity fast path.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# Field examples live in examples/<ModelName>.json, one file per model,
+# instead of Field(example=...) literals. They are only needed for JSON schema /
+# documentation output, so a file is read on the first schema request rather
+# than at import.
+_EXAMPLES_DIR = Path(__file__).with_name('examples')
+
+# Identical snippets ({"value": 1000, "unit": "USD/kg"}) recur across many
+# models' example files; every frozen container is registered here under its
+# canonical JSON text, so all of them share one object.
+_EXAMPLE_POOL: Dict[str, Any] = {}
+
+def _freeze(value: Any) -> Any:
+    """Read-only, deduplicated copy of a decoded JSON value.
+
+    Dicts become mapping proxies, lists tuples, strings (keys included) are
+    interned and equal containers are shared through _EXAMPLE_POOL.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        frozen = MappingProxyType({sys.intern(k): _freeze(v) for k, v in value.items()})
+    elif isinstance(value, list):
+        frozen = tuple(_freeze(v) for v in value)
+    else:
+        return value
+    key = json.dumps(value, sort_keys=True, ensure_ascii=False)
+    return _EXAMPLE_POOL.setdefault(key, frozen)
+
+def _thaw(value: Any) -> Any:
+    """Fresh, JSON-serializable dict/list copy of a frozen example."""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+# The cached examples are shared by every schema build, so they are kept
+# read-only; each schema gets its own thawed copy.
+@functools.cache
+def _load_examples(model_name: str) -> MappingProxyType:
+    """Load the per-field examples of one model (empty if it has no file)."""
+    path = _EXAMPLES_DIR / f'{model_name}.json'
+    if not path.is_file():
+        return MappingProxyType({})
+    with open(path, 'r', encoding='utf-8') as f:
+        return _freeze(json.load(f))
+
+@functools.cache
+def _model_examples(model: type) -> MappingProxyType:
+    """Examples of a model's fields, including ones inherited from its bases."""
+    examples = {}
+    for base in reversed(model.__mro__):
+        examples.update(_load_examples(base.__name__))
+    return MappingProxyType(examples)
+
+def _inject_examples(schema: Dict[str, Any], model: type) -> None:
+    """json_schema_extra hook: add sidecar examples to the model's properties."""
+    examples = _model_examples(model)
+    for name, prop in schema.get('properties', {}).items():
+        if name in examples:
+            prop['example'] = _thaw(examples[name])
+
+# Recurring optional field shapes share one annotation object each, carrying
+# their default, so pydantic resolves them once instead of per field and class
+# bodies do not repeat the Optional[...] + default boilerplate.
+OptionalStr = Annotated[Optional[str], Field(default=None)]
+StrListField = Annotated[Optional[List[str]], Field(default_factory=list)]
+# Для записей, где список строк обычно пуст: все экземпляры делят один пустой кортеж
+StrTupleField = Annotated[Optional[Tuple[str, ...]], Field(default=())]
+# То же для справочных списков из закрытых словарей (материалы, СИЗ, стандарты)
+VocabTupleField = Annotated[Optional[Tuple[InternedStr, ...]], Field(default=())]
+DictField = Annotated[Optional[Dict[str, Any]], Field(default_factory=dict)]
+ListOfDictsField = Annotated[Optional[List[Dict[str, Any]]], Field(default_factory=list)]
+
+class ColumnarBatch:
+    """Column-wise (struct-of-arrays) store for many records of one model.
+
+    Each model field becomes one list, so aggregations over a field walk a
+    single contiguous list instead of touching every record object.
+    """
+    model: type = BaseModel
+
+    def __init__(self, records: Any = ()):
+        self.columns: Dict[str, List[Any]] = {name: [] for name in self.model.model_fields}
+        self.extend(records)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+
+    def append(self, record: BaseModel) -> None:
+        for name, column in self.columns.items():
+            column.append(getattr(record, name))
+
+    def extend(self, records: Any) -> None:
+        for record in records:
+            self.append(record)
+
+    def column(self, name: str) -> List[Any]:
+        return self.columns[name]
+
+    def quantity_values(self, path: str, key: Optional[str] = None) -> List[Optional[float]]:
+        """Numbers of a Quantity field across the batch, None where absent.
+
+        `path` is a column name, optionally followed by sub-model attributes
+        ("cost_analysis.total_impact"); `key` picks one entry of a keyed
+        Quantity map (capital_costs / total_installed_cost,
+        cost_analysis.direct_costs / labor).
+        """
+        name, *attrs = path.split('.')
+        out = []
+        for value in self.columns[name]:
+            for attr in attrs:
+                value = getattr(value, attr, None)
+            if key is not None:
+                value = value.get(key) if value else None
+            out.append(getattr(value, 'value', None))
+        return out
+
+    def iter_rows(self):
+        """Yield records rebuilt from the columns (without re-validation)."""
+        names = list(self.columns)
+        for values in zip(*self.columns.values()):
+            yield self.model.model_construct(**dict(zip(names, values)))
+
+def columnar(model: type) -> type:
+    """Class decorator: attach a `<Model>Batch` columnar store as `Model.Batch`."""
+    model.Batch = type(f'{model.__name__}Batch', (ColumnarBatch,), {'model': model})
+    return model
+
+def tagged_union(key: str, variants: Dict[str, type], fallback: type) -> Any:
+    """Build a discriminated union of `variants` keyed by the `key` field.
+
+    Validation picks the variant from the tag in one lookup instead of trying
+    each member in turn; records with an unknown or missing tag go to the
+    generic `fallback` model.
+    """
+    def discriminate(value: Any) -> str:
+        tag = value.get(key) if isinstance(value, dict) else getattr(value, key, None)
+        return tag if tag in variants else 'other'
+
+    members = [Annotated[model, Tag(tag)] for tag, model in variants.items()]
+    members.append(Annotated[fallback, Tag('other')])
+    return Annotated[Union[tuple(members)], Discriminator(discriminate)]
+
+class Quantity(BaseModel):
+    """Numeric value with its unit of measurement"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="allow", json_schema_extra=_inject_examples)
+
+    value: float = Field(
+        description="Numeric value"
+    )
+    unit: Optional[InternedStr] = Field(
+        default=None,
+        description="Unit of measurement"
+    )
+
+class Limits(BaseModel):
+    """Normal value, limits or target of a parameter"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="allow", json_schema_extra=_inject_examples)
+
+    normal: Optional[float] = Field(
+        default=None,
+        description="Normal value"
+    )
+    min: Optional[float] = Field(
+        default=None,
+        description="Lower limit"
+    )
+    max: Optional[float] = Field(
+        default=None,
+        description="Upper limit"
+    )
+    target: Optional[float] = Field(
+        default=None,
+        description="Target value"
+    )
+    value: Optional[float] = Field(
+        default=None,
+        description="Fixed required value"
+    )
+    average: Optional[float] = Field(
+        default=None,
+        description="Average value"
+    )
+    unit: Optional[InternedStr] = Field(
+        default=None,
+        description="Unit of measurement"
+    )
+
+# Keyed measurements (name -> value with unit: cost elements, KPIs, impacts).
+# One annotation object for all such fields, so the shape is resolved once.
+QuantityMap = Annotated[Optional[Dict[InternedStr, Quantity]], Field(default=None)]
+# Keyed performance indicators of Maintenance, Economics and EnergyEfficiency
+PerformanceMetrics = QuantityMap
+# Keyed operating values that are either a measured quantity or a range
+QuantityOrLimits = Annotated[Union[Quantity, Limits], Field(union_mode="left_to_right")]
+# Specification entry: quantity, limits, plain number or code, tried in that order
+SpecValue = Annotated[Union[Quantity, Limits, float, InternedStr], Field(union_mode="left_to_right")]
+
+def split_quantity(data: Any, field: str) -> Any:
+    """Flatten `field` given as {"value", "unit"} into `field` and `<field>_unit`.
+
+    For use in mode="before" validators of models that keep a numeric field
+    next to its unit; an explicit `<field>_unit` wins over the nested unit.
+    """
+    if isinstance(data, dict) and isinstance(data.get(field), dict):
+        quantity = data[field]
+        unit_field = f"{field}_unit"
+        data = {
+            **data,
+            field: quantity.get("value"),
+            unit_field: data.get(unit_field) or quantity.get("unit"),
+        }
+    return data
+
 # ============= Base Models =============
  
 class Parameter(BaseModel):
     """Model for equipment parameters"""
+    model_config = ConfigDict(json_schema_extra=_inject_examples)
+
     name: str = Field(
-        description="Name of the parameter",
-        example="operating_pressure"
+        description="Name of the parameter"
     )
     value: Union[float, str, Dict[str, Any]] = Field(
-        description="Parameter value in various formats",
-        example=10.5
+        description="Parameter value in various formats"
     )
     unit: Optional[str] = Field(
         default=None,
-        description="Unit of measurement",
-        example="MPa"
+        description="Unit of measurement"
     )
     description: Optional[str] = Field(
         default=None,
-        description="Parameter description",
-        example="Maximum allowable operating pressure"
+        description="Parameter description"
     )
-    dynamic_properties: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Dynamic properties extracted from documentation",
-        example=[{
-            "name": "pressure_limit",
-            "value": 12.0,
-            "unit": "MPa"
-        }]
+    dynamic_properties: ListOfDictsField = Field(
+        description="Dynamic properties extracted from documentation"
     )
 
 class Instrument(BaseModel):
     """Model for instrumentation"""
+    model_config = ConfigDict(json_schema_extra=_inject_examples)
+
     tag: str = Field(
-        description="Instrument tag number",
-        example="PT-101"
+        description="Instrument tag number"
     )
     type: Optional[str] = Field(
         default=None,
-        description="Type of instrument",
-        example="pressure_transmitter"
+        description="Type of instrument"
     )
     function: Optional[str] = Field(
         default=None,
-        description="Instrument function",
-        example="pressure_monitoring"
+        description="Instrument function"
     )
     alarm_points: Optional[Dict[str, float]] = Field(
         default=None,
-        description="Alarm setpoints",
-        example={"high": 11.0, "low": 9.0}
+        description="Alarm setpoints"
     )
     interlock_points: Optional[Dict[str, Union[float, str, None]]] = Field(
         default_factory=dict,
-        description="Interlock setpoints",
-        example={"shutdown": 12.0}
+        description="Interlock setpoints"
     )
-    dynamic_properties: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Dynamic properties extracted from documentation",
-        example=[{
-            "name": "calibration_range",
-            "value": {"min": 0, "max": 15},
-            "unit": "MPa"
-        }]
+    dynamic_properties: ListOfDictsField = Field(
+        description="Dynamic properties extracted from documentation"
     )
 
 class Connection(BaseModel):
     """Model for physical, logical and semantic connections between process elements"""
+    model_config = ConfigDict(json_schema_extra=_inject_examples)
+
     from_id: str = Field(
-        description="Source identifier (equipment, stream, parameter, or logical entity)",
-        example="P-101"
+        description="Source identifier (equipment, stream, parameter, or logical entity)"
     )
     to_id: str = Field(
-        description="Destination identifier (equipment, stream, parameter, or logical entity)",
-        example="E-102"
+        description="Destination identifier (equipment, stream, parameter, or logical entity)"
     )
     connection_type: Optional[str] = Field(
         default=None,
-        description="Type of connection or relationship between entities",
-        example="process_flow"  # physical, logical, control, safety relationship
+        description="Type of connection or relationship between entities"  # process_flow, physical, logical, control, safety relationship
     )
     medium: Optional[str] = Field(
         default=None,
-        description="Physical medium or logical relationship type",
-        example="liquid_hydrocarbon"
+        description="Physical medium or logical relationship type"
     )
     description: Optional[str] = Field(
         default=None,
-        description="Detailed description of the connection or relationship",
-        example="Main process feed line from pump P-101 to heat exchanger E-102 with high pressure interlock"
+        description="Detailed description of the connection or relationship"
     )
-    relationship_properties: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Properties defining the relationship between entities",
-        example={
-            "relationship_type": "control_dependency",
-            "criticality": "high",
-            "response_time": {"value": 2, "unit": "seconds"},
-            "failure_impact": "process_shutdown"
-        }
+    relationship_properties: DictField = Field(
+        description="Properties defining the relationship between entities"
     )
-    logical_conditions: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Logical conditions and rules governing the connection",
-        example=[
-            {
-                "condition": "pressure > 10 bar",
-                "action": "close_inlet_valve",
-                "priority": "emergency",
-                "delay": {"value": 0, "unit": "seconds"}
-            }
-        ]
+    logical_conditions: ListOfDictsField = Field(
+        description="Logical conditions and rules governing the connection"
     )
-    physical_specifications: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Physical specifications if applicable",
-        example={
-            "line_size": {"value": 6, "unit": "inches"},
-            "material": "316L SS",
-            "design_pressure": {"value": 10, "unit": "barg"},
-            "design_temperature": {"value": 150, "unit": "°C"}
-        }
+    physical_specifications: DictField = Field(
+        description="Physical specifications if applicable"
     )
-    control_logic: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Control logic and automation rules",
-        example={
-            "control_type": "cascade",
-            "master_controller": "FIC-101",
-            "slave_controller": "TIC-101",
-            "fallback_mode": "fail_safe"
-        }
+    control_logic: DictField = Field(
+        description="Control logic and automation rules"
     )
-    safety_implications: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Safety implications and requirements",
-        example={
-            "sil_level": "SIL 2",
-            "risk_level": "high",
-            "failure_mode": "fail_close",
-            "safety_function": "pressure_protection"
-        }
+    safety_implications: DictField = Field(
+        description="Safety implications and requirements"
     )
-    operational_states: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Valid operational states and transitions",
-        example=[
-            {
-                "state": "normal_operation",
-                "conditions": ["all_permissives_ok", "no_alarms"],
-                "allowed_transitions": ["shutdown", "maintenance"]
-            }
-        ]
+    operational_states: ListOfDictsField = Field(
+        description="Valid operational states and transitions"
     )
-    dependencies: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Dependencies and relationships with other system elements",
-        example=[
-            {
-                "entity_id": "TIC-101",
-                "relationship": "provides_control_input",
-                "criticality": "high"
-            }
-        ]
+    dependencies: ListOfDictsField = Field(
+        description="Dependencies and relationships with other system elements"
     )
-    dynamic_properties: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Dynamic properties of the connection or relationship",
-        example=[
-            {
-                "name": "reliability_index",
-                "value": 0.99,
-                "calculation_date": "2024-01-20"
-            }
-        ]
+    dynamic_properties: ListOfDictsField = Field(
+        description="Dynamic properties of the connection or relationship"
     )
 
 class Event(BaseModel):
     """Model for process events, operational changes, and incidents"""
+    model_config = ConfigDict(json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Unique event identifier",
-        example="EV-2024-001"  # Event number 001 in 2024
+        description="Unique event identifier"
     )
     type: str = Field(
-        description="Type of process or operational event",
-        example="process_upset"  # startup, shutdown, emergency, normal_operation_change
+        description="Type of process or operational event"  # process_upset, startup, shutdown, emergency, normal_operation_change
     )
     description: Optional[str] = Field(
         default=None,
-        description="Detailed description of the event",
-        example="Sudden pressure drop in reactor feed system causing process upset and emergency shutdown initiation"
+        description="Detailed description of the event"
     )
-    timestamp: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Timing details of the event",
-        example={
-            "start_time": "2024-01-15T14:30:00",
-            "end_time": "2024-01-15T16:45:00",
-            "duration": {"value": 2.25, "unit": "hours"},
-            "detection_time": "2024-01-15T14:30:00",
-            "response_time": "2024-01-15T14:32:00"
-        }
+    timestamp: DictField = Field(
+        description="Timing details of the event"
     )
-    severity: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Event severity classification",
-        example={
-            "level": "high",
-            "safety_impact": "moderate",
-            "production_impact": "significant",
-            "equipment_impact": "minor",
-            "environmental_impact": "none"
-        }
+    severity: DictField = Field(
+        description="Event severity classification"
     )
-    conditions: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Process conditions during the event",
-        example={
-            "pressure": {"value": 2.5, "unit": "barg", "normal": 10.0},
-            "temperature": {"value": 150, "unit": "°C", "normal": 180},
-            "flow_rate": {"value": 0, "unit": "m3/h", "normal": 100},
-            "level": {"value": 85, "unit": "percent", "normal": 50}
-        }
+    conditions: DictField = Field(
+        description="Process conditions during the event"
     )
-    equipment_involved: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Equipment affected by or involved in the event",
-        example=[
-            {
-                "id": "P-101",
-                "type": "centrifugal_pump",
-                "role": "primary_involved",
-                "status": "tripped",
-                "damage_assessment": "none"
-            },
-            {
-                "id": "R-101",
-                "type": "reactor",
-                "role": "secondary_affected",
-                "status": "emergency_shutdown",
-                "damage_assessment": "none"
-            }
-        ]
+    equipment_involved: ListOfDictsField = Field(
+        description="Equipment affected by or involved in the event"
     )
-    parameters: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Critical parameters monitored during the event",
-        example=[
-            {
-                "name": "reactor_pressure",
-                "trend": "rapid_decrease",
-                "min_value": {"value": 2.5, "unit": "barg"},
-                "max_value": {"value": 10.0, "unit": "barg"},
-                "normal_range": {"min": 9.5, "max": 10.5, "unit": "barg"}
-            }
-        ]
+    parameters: ListOfDictsField = Field(
+        description="Critical parameters monitored during the event"
     )
-    root_cause: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Root cause analysis of the event",
-        example={
-            "primary_cause": "pump_mechanical_seal_failure",
-            "contributing_factors": [
-                "seal_wear",
-                "inadequate_lubrication",
-                "vibration"
-            ],
-            "verification_method": "visual_inspection",
-            "confidence_level": "high"
-        }
+    root_cause: DictField = Field(
+        description="Root cause analysis of the event"
     )
-    actions_taken: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Actions taken in response to the event",
-        example=[
-            {
-                "time": "2024-01-15T14:32:00",
-                "action": "emergency_shutdown_initiated",
-                "operator": "John Smith",
-                "result": "successful"
-            },
-            {
-                "time": "2024-01-15T14:35:00",
-                "action": "backup_pump_started",
-                "operator": "John Smith",
-                "result": "successful"
-            }
-        ]
+    actions_taken: ListOfDictsField = Field(
+        description="Actions taken in response to the event"
     )
-    consequences: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Impact and consequences of the event",
-        example={
-            "production_loss": {"value": 50, "unit": "tons"},
-            "downtime": {"value": 2.25, "unit": "hours"},
-            "equipment_damage": "none",
-            "environmental_release": "none",
-            "safety_incidents": "none"
-        }
+    consequences: DictField = Field(
+        description="Impact and consequences of the event"
     )
-    notifications: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Notifications and communications during the event",
-        example=[
-            {
-                "time": "2024-01-15T14:33:00",
-                "type": "emergency_notification",
-                "recipients": ["shift_supervisor", "maintenance"],
-                "message": "Emergency shutdown due to pump failure"
-            }
-        ]
+    notifications: ListOfDictsField = Field(
+        description="Notifications and communications during the event"
     )
-    corrective_actions: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Corrective actions to prevent recurrence",
-        example=[
-            {
-                "action": "replace_mechanical_seal",
-                "priority": "high",
-                "status": "completed",
-                "completion_date": "2024-01-15T18:00:00",
-                "verification": "post_maintenance_test"
-            },
-            {
-                "action": "update_preventive_maintenance_schedule",
-                "priority": "medium",
-                "status": "in_progress",
-                "due_date": "2024-01-22"
-            }
-        ]
+    corrective_actions: ListOfDictsField = Field(
+        description="Corrective actions to prevent recurrence"
     )
-    documentation: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Related documentation and records",
-        example=[
-            {
-                "type": "incident_report",
-                "number": "IR-2024-001",
-                "title": "Pump Seal Failure Incident",
-                "date": "2024-01-15"
-            },
-            {
-                "type": "work_order",
-                "number": "WO-2024-123",
-                "description": "Emergency Pump Repair",
-                "status": "completed"
-            }
-        ]
+    documentation: ListOfDictsField = Field(
+        description="Related documentation and records"
     )
-    lessons_learned: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Lessons learned and recommendations",
-        example=[
-            {
-                "category": "maintenance",
-                "finding": "Inadequate seal inspection frequency",
-                "recommendation": "Increase inspection frequency to monthly",
-                "implementation_status": "approved"
-            },
-            {
-                "category": "monitoring",
-                "finding": "Early warning signs missed",
-                "recommendation": "Implement vibration monitoring",
-                "implementation_status": "under_review"
-            }
-        ]
+    lessons_learned: ListOfDictsField = Field(
+        description="Lessons learned and recommendations"
     )
 
 class Risk(BaseModel):
     """Model for process and operational risk assessment"""
+    model_config = ConfigDict(json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Unique risk identifier",
-        example="RISK-2024-001"  # Risk assessment record 001
+        description="Unique risk identifier"
     )
     type: str = Field(
-        description="Type of risk being assessed",
-        example="process_safety"  # operational, environmental, mechanical_integrity
+        description="Type of risk being assessed"  # process_safety, operational, environmental, mechanical_integrity
     )
     severity: str = Field(
-        description="Severity level of the risk",
-        example="high"  # low, medium, critical
+        description="Severity level of the risk"  # high, low, medium, critical
     )
     description: Optional[str] = Field(
         default=None,
-        description="Detailed description of the risk scenario",
-        example="Potential loss of containment in high-pressure reactor system due to mechanical seal failure"
+        description="Detailed description of the risk scenario"
     )
-    hazard_identification: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Hazard identification details",
-        example={
-            "hazard_type": "pressure_containment",
-            "source": "reactor_seal",
-            "potential_causes": [
-                "seal_degradation",
-                "excessive_vibration",
-                "pressure_excursion"
-            ],
-            "detection_methods": [
-                "pressure_monitoring",
-                "seal_pot_level",
-                "vibration_analysis"
-            ]
-        }
+    hazard_identification: DictField = Field(
+        description="Hazard identification details"
     )
-    risk_assessment: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Risk assessment details",
-        example={
-            "likelihood": {
-                "rating": "medium",
-                "frequency": {"value": 1, "unit": "per_year"},
-                "confidence_level": {"value": 80, "unit": "percent"}
-            },
-            "consequences": {
-                "safety": {
-                    "severity": "high",
-                    "potential_impacts": ["personnel_injury", "equipment_damage"]
-                },
-                "environmental": {
-                    "severity": "medium",
-                    "potential_impacts": ["local_contamination"]
-                },
-                "economic": {
-                    "severity": "high",
-                    "estimated_cost": {"value": 1000000, "unit": "USD"}
-                }
-            },
-            "risk_level": "high",
-            "risk_matrix_position": {"likelihood": 3, "consequence": 4}
-        }
+    risk_assessment: DictField = Field(
+        description="Risk assessment details"
     )
-    affected_systems: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Systems and equipment affected by the risk",
-        example=[
-            {
-                "system_id": "R-101",
-                "system_type": "reactor",
-                "vulnerability": "high",
-                "critical_parameters": ["pressure", "temperature"]
-            },
-            {
-                "system_id": "P-101",
-                "system_type": "pump",
-                "vulnerability": "medium",
-                "critical_parameters": ["seal_pressure", "vibration"]
-            }
-        ]
+    affected_systems: ListOfDictsField = Field(
+        description="Systems and equipment affected by the risk"
     )
-    existing_safeguards: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Existing risk control measures",
-        example=[
-            {
-                "type": "engineering_control",
-                "description": "High pressure shutdown system",
-                "effectiveness": "high",
-                "reliability": {"value": 99.9, "unit": "percent"},
-                "testing_frequency": "monthly"
-            },
-            {
-                "type": "procedural_control",
-                "description": "Regular seal inspection program",
-                "effectiveness": "medium",
-                "frequency": "weekly"
-            }
-        ]
+    existing_safeguards: ListOfDictsField = Field(
+        description="Existing risk control measures"
     )
-    mitigation_measures: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Recommended risk mitigation measures",
-        example=[
-            {
-                "measure": "install_dual_mechanical_seal",
-                "type": "engineering",
-                "priority": "high",
-                "estimated_cost": {"value": 50000, "unit": "USD"},
-                "implementation_timeline": {"value": 3, "unit": "months"},
-                "expected_risk_reduction": {"value": 70, "unit": "percent"}
-            }
-        ]
+    mitigation_measures: ListOfDictsField = Field(
+        description="Recommended risk mitigation measures"
     )
-    monitoring_requirements: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Risk monitoring and review requirements",
-        example={
-            "parameters": [
-                {
-                    "name": "seal_pressure",
-                    "normal_range": {"min": 5, "max": 10, "unit": "barg"},
-                    "alarm_settings": {"low": 4, "high": 11, "unit": "barg"},
-                    "monitoring_frequency": "continuous"
-                }
-            ],
-            "inspections": [
-                {
-                    "type": "visual_inspection",
-                    "frequency": "daily",
-                    "responsibility": "operations"
-                }
-            ],
-            "review_frequency": {"value": 6, "unit": "months"}
-        }
+    monitoring_requirements: DictField = Field(
+        description="Risk monitoring and review requirements"
     )
-    emergency_response: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Emergency response procedures",
-        example={
-            "initial_response": [
-                "activate_emergency_shutdown",
-                "evacuate_area",
-                "notify_emergency_response_team"
-            ],
-            "communication_protocol": {
-                "primary_contact": "shift_supervisor",
-                "emergency_numbers": ["internal_emergency", "fire_department"]
-            },
-            "response_resources": [
-                "fire_fighting_equipment",
-                "spill_containment_kit"
-            ]
-        }
+    emergency_response: DictField = Field(
+        description="Emergency response procedures"
     )
-    regulatory_compliance: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Regulatory requirements and compliance",
-        example={
-            "applicable_regulations": [
-                "OSHA_PSM",
-                "EPA_RMP"
-            ],
-            "compliance_requirements": [
-                "hazard_assessment",
-                "management_of_change",
-                "incident_investigation"
-            ],
-            "reporting_obligations": {
-                "frequency": "annual",
-                "authorities": ["regulatory_agency", "corporate_safety"]
-            }
-        }
+    regulatory_compliance: DictField = Field(
+        description="Regulatory requirements and compliance"
     )
-    historical_incidents: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Related historical incidents",
-        example=[
-            {
-                "date": "2023-06-15",
-                "description": "Minor seal leak detected during inspection",
-                "consequences": "No injury or environmental impact",
-                "corrective_actions": "Seal replacement",
-                "lessons_learned": "Improve preventive maintenance frequency"
-            }
-        ]
+    historical_incidents: ListOfDictsField = Field(
+        description="Related historical incidents"
     )
-    review_status: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Risk assessment review status",
-        example={
-            "last_review": "2024-01-15",
-            "reviewed_by": "Process Safety Team",
-            "next_review_due": "2024-07-15",
-            "review_findings": "Additional monitoring recommended",
-            "action_items": [
-                {
-                    "item": "Update inspection procedure",
-                    "status": "in_progress",
-                    "due_date": "2024-02-15"
-                }
-            ]
-        }
+    review_status: DictField = Field(
+        description="Risk assessment review status"
     )
 
+@columnar
 class Action(BaseModel):
     """Model for actions"""
+    model_config = ConfigDict(defer_build=True, json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Unique action identifier",
-        example="ACT-001"
+        description="Unique action identifier"
     )
-    type: Optional[str] = Field(
+    type: Optional[InternedStr] = Field(
         default=None,
-        description="Type of action",
-        example="emergency_procedure"
+        description="Type of action"
     )
-    description: Optional[str] = Field(
-        default=None,
-        description="Action description",
-        example="Emergency shutdown procedure"
+    description: OptionalStr = Field(
+        description="Action description"
     )
-    steps: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Sequential steps of the action",
-        example=["Stop feed pump", "Close main valve"]
+    steps: StrListField = Field(
+        description="Sequential steps of the action"
     )
-    required_parameters: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Parameters to be monitored/controlled",
-        example=["pressure", "temperature"]
+    required_parameters: StrListField = Field(
+        description="Parameters to be monitored/controlled"
     )
-    equipment_involved: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Equipment involved in the action",
-        example=["P-101", "V-102"]
+    equipment_involved: StrListField = Field(
+        description="Equipment involved in the action"
     )
-    personnel: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Required personnel",
-        example=["Operator", "Supervisor"]
+    personnel: StrListField = Field(
+        description="Required personnel"
     )
-    timeframe: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Time-related requirements",
-        example={"duration": "30 minutes", "frequency": "daily"}
+    timeframe: DictField = Field(
+        description="Time-related requirements"
     )
-    source_text: Optional[str] = Field(
-        default=None,
-        description="Source text from documentation",
-        example="In case of emergency, immediately stop the feed pump"
+    source_text: OptionalStr = Field(
+        description="Source text from documentation"
     )
     confidence: Optional[float] = Field(
         default=1.0,
         ge=0.0,
         le=1.0,
-        description="Confidence score of extraction",
-        example=0.95
+        description="Confidence score of extraction"
     )
-    language: Optional[str] = Field(
+    language: OptionalStr = Field(
+        description="Language of source text"
+    )
+    dynamic_properties: ListOfDictsField = Field(
+        description="Dynamic properties extracted from documentation"
+    )
+
+    @classmethod
+    def validate_many(cls, records: List[Dict[str, Any]]):
+        """Validate many raw actions in one call; see validate_records()."""
+        return validate_records(cls, records)
+
+class RelationshipNature(BaseModel):
+    """Nature and characteristics of a process relationship"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    category: Optional[InternedStr] = Field(
+        default=None,
+        description="Relationship category"
+    )
+    criticality: Optional[InternedStr] = Field(
+        default=None,
+        description="Criticality of the relationship"
+    )
+    bidirectional: Optional[bool] = Field(
+        default=None,
+        description="Whether the relationship acts in both directions"
+    )
+    strength: Optional[InternedStr] = Field(
+        default=None,
+        description="Strength of the coupling"
+    )
+    variability: Optional[InternedStr] = Field(
+        default=None,
+        description="Variability of the relationship over time"
+    )
+
+class OverrideCondition(BaseModel):
+    """Condition that overrides normal control behaviour"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    parameter: str = Field(
+        description="Monitored parameter"
+    )
+    limit: Optional[Quantity] = Field(
         default=None,
-        description="Language of source text",
-        example="RU"
+        description="Limit that triggers the override"
     )
-    dynamic_properties: Optional[List[Dict[str, Any]]] = Field(
+    action: OptionalStr = Field(
+        description="Action taken when the limit is reached"
+    )
+
+class ControlAspects(BaseModel):
+    """Control relationships and dependencies"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    control_type: Optional[InternedStr] = Field(
+        default=None,
+        description="Control scheme type"
+    )
+    master_controller: OptionalStr = Field(
+        description="Master controller tag"
+    )
+    slave_controller: OptionalStr = Field(
+        description="Slave controller tag"
+    )
+    override_conditions: List[OverrideCondition] = Field(
         default_factory=list,
-        description="Dynamic properties extracted from documentation",
-        example=[{"name": "last_revision", "value": "2024-01-01"}]
+        description="Override conditions"
     )
 
+@columnar
 class ProcessRelationship(BaseModel):
     """Model for relationships and dependencies between process elements"""
+    model_config = ConfigDict(defer_build=True, json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Unique relationship identifier",
-        example="REL-2024-001"  # Relationship identifier 001 in 2024
+        description="Unique relationship identifier"
     )
     from_entity: str = Field(
-        description="Source entity identifier in the relationship",
-        example="R-101"  # Source entity (e.g., Reactor 101)
+        description="Source entity identifier in the relationship"
     )
     to_entity: str = Field(
-        description="Target entity identifier in the relationship",
-        example="E-102"  # Target entity (e.g., Heat Exchanger 102)
+        description="Target entity identifier in the relationship"
     )
-    relationship_type: str = Field(
-        description="Type of relationship between entities",
-        example="heat_integration"  # process_flow, control_dependency, safety_interlock
+    relationship_type: InternedStr = Field(
+        description="Type of relationship between entities"  # heat_integration, process_flow, control_dependency, safety_interlock
     )
-    description: Optional[str] = Field(
+    description: OptionalStr = Field(
+        description="Detailed description of the relationship"
+    )
+    nature: Optional[RelationshipNature] = Field(
         default=None,
-        description="Detailed description of the relationship",
-        example="Reactor effluent heat recovery to feed preheating with minimum approach temperature control"
+        description="Nature and characteristics of the relationship"
     )
-    nature: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Nature and characteristics of the relationship",
-        example={
-            "category": "process_integration",
-            "criticality": "high",
-            "bidirectional": True,
-            "strength": "strong",
-            "variability": "dynamic"
-        }
+    operational_parameters: ListOfDictsField = Field(
+        description="Operating parameters governing the relationship"
     )
-    operational_parameters: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Operating parameters governing the relationship",
-        example=[
-            {
-                "parameter": "temperature_approach",
-                "normal_value": {"value": 20, "unit": "°C"},
-                "minimum": {"value": 15, "unit": "°C"},
-                "maximum": {"value": 30, "unit": "°C"},
-                "criticality": "high"
-            },
-            {
-                "parameter": "heat_duty",
-                "normal_value": {"value": 5000, "unit": "kW"},
-                "range": {"min": 4000, "max": 6000, "unit": "kW"},
-                "monitoring": "continuous"
-            }
-        ]
+    control_aspects: Optional[ControlAspects] = Field(
+        default=None,
+        description="Control relationships and dependencies"
     )
-    control_aspects: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Control relationships and dependencies",
-        example={
-            "control_type": "cascade",
-            "master_controller": "TIC-101",
-            "slave_controller": "FIC-102",
-            "override_conditions": [
-                {
-                    "parameter": "min_approach_temperature",
-                    "limit": {"value": 15, "unit": "°C"},
-                    "action": "reduce_throughput"
-                }
-            ]
-        }
+    safety_implications: ListOfDictsField = Field(
+        description="Safety implications of the relationship"
     )
-    safety_implications: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Safety implications of the relationship",
-        example=[
-            {
-                "scenario": "loss_of_heat_integration",
-                "consequence": "reactor_feed_temperature_drop",
-                "severity": "medium",
-                "safeguards": [
-                    "backup_heating_system",
-                    "automatic_throughput_reduction"
-                ]
-            }
-        ]
+    optimization_objectives: ListOfDictsField = Field(
+        description="Optimization objectives for the relationship"
     )
-    optimization_objectives: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Optimization objectives for the relationship",
-        example=[
-            {
-                "objective": "maximize_heat_recovery",
-                "constraint": "minimum_approach_temperature",
-                "priority": "high",
-                "measurement": "energy_savings",
-                "target": {"value": 5500, "unit": "kW"}
-            }
-        ]
+    dependencies: ListOfDictsField = Field(
+        description="Dependencies and related relationships"
     )
-    dependencies: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Dependencies and related relationships",
-        example=[
-            {
-                "entity_id": "P-101",
-                "relationship": "flow_provider",
-                "criticality": "high",
-                "impact_on_relationship": "direct"
-            },
-            {
-                "entity_id": "FIC-101",
-                "relationship": "flow_control",
-                "criticality": "medium",
-                "impact_on_relationship": "indirect"
-            }
-        ]
+    constraints: ListOfDictsField = Field(
+        description="Operational constraints on the relationship"
     )
-    constraints: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Operational constraints on the relationship",
-        example=[
-            {
-                "type": "temperature_constraint",
-                "description": "Minimum approach temperature",
-                "value": {"min": 15, "unit": "°C"},
-                "enforcement": "hard_constraint",
-                "violation_action": "reduce_throughput"
-            }
-        ]
+    performance_metrics: DictField = Field(
+        description="Performance indicators for the relationship"
     )
-    performance_metrics: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Performance indicators for the relationship",
-        example={
-            "energy_efficiency": {
-                "current": {"value": 85, "unit": "percent"},
-                "target": {"value": 90, "unit": "percent"},
-                "monitoring": "continuous"
-            },
-            "stability": {
-                "measure": "variance",
-                "value": {"value": 2.5, "unit": "percent"},
-                "acceptable_range": {"max": 5, "unit": "percent"}
-            }
-        }
+    maintenance_implications: ListOfDictsField = Field(
+        description="Maintenance considerations for the relationship"
     )
-    maintenance_implications: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Maintenance considerations for the relationship",
-        example=[
-            {
-                "aspect": "heat_exchanger_cleaning",
-                "frequency": {"value": 6, "unit": "months"},
-                "impact": "reduced_heat_transfer",
-                "mitigation": "scheduled_cleaning",
-                "coordination_required": ["production_planning", "maintenance"]
-            }
-        ]
+    dynamic_behavior: DictField = Field(
+        description="Dynamic characteristics of the relationship"
     )
-    dynamic_behavior: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Dynamic characteristics of the relationship",
-        example={
-            "response_time": {"value": 30, "unit": "minutes"},
-            "stability": "stable",
-            "oscillatory_tendency": "low",
-            "disturbance_sensitivity": "medium"
-        }
+
+class SideQuantities(BaseModel):
+    """Quantity given separately for shell and tube sides"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    shell_side: Optional[Quantity] = Field(
+        default=None,
+        description="Shell side value"
+    )
+    tube_side: Optional[Quantity] = Field(
+        default=None,
+        description="Tube side value"
     )
 
-class Equipment(BaseModel):
-    """Model for process equipment specification and characteristics"""
-    id: str = Field(
-        description="Unique equipment identifier in the process system",
-        example="HE-101"  # Heat Exchanger 101
+class SideConditions(BaseModel):
+    """Operating conditions on one side of the equipment"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    fluid: OptionalStr = Field(
+        description="Process fluid"
     )
-    name: Optional[str] = Field(
+    flow_rate: Optional[Quantity] = Field(
         default=None,
-        description="Descriptive name of the equipment",
-        example="Feed/Effluent Heat Exchanger"
+        description="Flow rate"
     )
-    type: Optional[str] = Field(
+    inlet_temperature: Optional[Quantity] = Field(
         default=None,
-        description="Type of process equipment",
-        example="shell_and_tube_heat_exchanger"  # centrifugal_pump, distillation_column
+        description="Inlet temperature"
     )
-    service: Optional[str] = Field(
+    outlet_temperature: Optional[Quantity] = Field(
         default=None,
-        description="Primary service or function of the equipment",
-        example="Process feed preheating using reactor effluent"
+        description="Outlet temperature"
     )
-    design_parameters: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Key design parameters and specifications",
-        example={
-            "heat_transfer_area": {"value": 500, "unit": "m2"},
-            "design_pressure": {
-                "shell_side": {"value": 10, "unit": "barg"},
-                "tube_side": {"value": 20, "unit": "barg"}
-            },
-            "design_temperature": {
-                "shell_side": {"value": 200, "unit": "°C"},
-                "tube_side": {"value": 300, "unit": "°C"}
-            },
-            "material_of_construction": {
-                "shell": "carbon_steel",
-                "tubes": "316L_stainless_steel",
-                "tube_sheet": "316L_stainless_steel"
-            }
-        }
+    operating_pressure: Optional[Quantity] = Field(
+        default=None,
+        description="Operating pressure"
     )
-    operating_parameters: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Normal operating parameters",
-        example={
-            "shell_side": {
-                "fluid": "hot_reactor_effluent",
-                "flow_rate": {"value": 100, "unit": "m3/h"},
-                "inlet_temperature": {"value": 280, "unit": "°C"},
-                "outlet_temperature": {"value": 160, "unit": "°C"},
-                "operating_pressure": {"value": 8, "unit": "barg"}
-            },
-            "tube_side": {
-                "fluid": "cold_process_feed",
-                "flow_rate": {"value": 80, "unit": "m3/h"},
-                "inlet_temperature": {"value": 120, "unit": "°C"},
-                "outlet_temperature": {"value": 240, "unit": "°C"},
-                "operating_pressure": {"value": 15, "unit": "barg"}
-            }
-        }
+
+class DesignParameters(BaseModel):
+    """Key design parameters of equipment"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    heat_transfer_area: Optional[Quantity] = Field(
+        default=None,
+        description="Heat transfer area"
     )
-    performance_parameters: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Key performance indicators",
-        example={
-            "heat_duty": {"value": 5000, "unit": "kW"},
-            "heat_transfer_coefficient": {"value": 750, "unit": "W/m2K"},
-            "pressure_drop": {
-                "shell_side": {"value": 0.5, "unit": "bar"},
-                "tube_side": {"value": 0.8, "unit": "bar"}
-            },
-            "effectiveness": {"value": 0.85, "unit": "ratio"}
-        }
+    design_pressure: Optional[SideQuantities] = Field(
+        default=None,
+        description="Design pressure per side"
     )
-    mechanical_design: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Mechanical design specifications",
-        example={
-            "shell_diameter": {"value": 1000, "unit": "mm"},
-            "tube_details": {
-                "outer_diameter": {"value": 25, "unit": "mm"},
-                "wall_thickness": {"value": 2.5, "unit": "mm"},
-                "length": {"value": 6, "unit": "m"},
-                "number": 500,
-                "layout": "triangular",
-                "pitch": {"value": 31.25, "unit": "mm"}
-            },
-            "number_of_passes": {
-                "shell": 1,
-                "tube": 4
-            },
-            "baffle_details": {
-                "type": "single_segmental",
-                "cut": {"value": 25, "unit": "percent"},
-                "spacing": {"value": 500, "unit": "mm"}
-            }
-        }
+    design_temperature: Optional[SideQuantities] = Field(
+        default=None,
+        description="Design temperature per side"
     )
-    instruments: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Associated instrumentation",
-        example=[
-            {
-                "tag": "TI-1001",
-                "type": "temperature_indicator",
-                "location": "shell_inlet",
-                "range": {"min": 0, "max": 400, "unit": "°C"}
-            },
-            {
-                "tag": "PI-1001",
-                "type": "pressure_indicator",
-                "location": "tube_inlet",
-                "range": {"min": 0, "max": 25, "unit": "barg"}
-            }
-        ]
+    material_of_construction: Optional[Dict[str, str]] = Field(
+        default=None,
+        description="Materials of construction per part"
     )
-    connections: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Process and utility connections",
-        example=[
-            {
-                "id": "shell_inlet",
-                "type": "process",
-                "size": {"value": 8, "unit": "inches"},
-                "rating": "ANSI_150",
-                "location": "shell_end"
-            },
-            {
-                "id": "tube_inlet",
-                "type": "process",
-                "size": {"value": 6, "unit": "inches"},
-                "rating": "ANSI_300",
-                "location": "channel_end"
-            }
-        ]
+
+class OperatingParameters(BaseModel):
+    """Normal operating parameters of equipment"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    shell_side: Optional[SideConditions] = Field(
+        default=None,
+        description="Shell side conditions"
     )
-    maintenance_requirements: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Maintenance specifications and requirements",
-        example=[
-            {
-                "task": "tube_bundle_cleaning",
-                "frequency": {"value": 12, "unit": "months"},
-                "procedure": "chemical_cleaning",
-                "acceptance_criteria": "pressure_drop_within_10_percent_of_design"
-            },
-            {
-                "task": "thickness_monitoring",
-                "frequency": {"value": 6, "unit": "months"},
-                "locations": ["shell_inlet", "tube_sheet"],
-                "method": "ultrasonic_testing"
-            }
-        ]
-    )
-    safety_features: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Safety features and protection devices",
-        example=[
-            {
-                "type": "pressure_relief_valve",
-                "tag": "PSV-1001",
-                "location": "shell_side",
-                "set_pressure": {"value": 11, "unit": "barg"},
-                "capacity": {"value": 150, "unit": "m3/h"}
-            }
-        ]
-    )
-    documentation: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Associated technical documentation",
-        example=[
-            {
-                "type": "datasheet",
-                "number": "DS-HE101-001",
-                "revision": "2",
-                "date": "2024-01-15"
-            },
-            {
-                "type": "drawing",
-                "number": "DWG-HE101-001",
-                "revision": "1",
-                "date": "2024-01-15"
-            }
-        ]
-    )
-    vendor_information: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Equipment vendor and manufacturing information",
-        example={
-            "manufacturer": "Heat Transfer Solutions Inc.",
-            "model_number": "STS-500-4",
-            "serial_number": "12345",
-            "manufacturing_date": "2023-06-15",
-            "warranty_period": {"value": 24, "unit": "months"}
-        }
-    )
-    cost_information: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Cost and economic information",
-        example={
-            "purchase_cost": {"value": 250000, "unit": "USD"},
-            "installation_cost": {"value": 75000, "unit": "USD"},
-            "annual_maintenance_cost": {"value": 15000, "unit": "USD"},
-            "replacement_value": {"value": 350000, "unit": "USD"}
-        }
-    )
-
-class ComponentProperty(BaseModel):
-    """Model for component properties in a flow"""
-    name: str = Field(
-        description="Component name",
-        example="methane"
-    )
-    concentration: Union[float, Dict[str, float]] = Field(
-        default=0.0,  # Добавили default для float
-        description="Component concentration or range",
-        example={"min": 0.85, "max": 0.95}
-    )
-    unit: str = Field(
-        description="Concentration unit",
-        example="mol%"
-    )
-    description: Optional[str] = Field(
+    tube_side: Optional[SideConditions] = Field(
         default=None,
-        description="Additional description",
-        example="Main component"
+        description="Tube side conditions"
     )
 
-class PhysicalProperty(BaseModel):
-    """Model for physical properties of a flow"""
-    name: str = Field(
-        description="Property name",
-        example="density"
+class PerformanceParameters(BaseModel):
+    """Key performance indicators of equipment"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    heat_duty: Optional[Quantity] = Field(
+        default=None,
+        description="Heat duty"
     )
-    value: Union[float, Dict[str, float]] = Field(
-        default=0.0,  # Добавили только default для валидации
-        description="Property value or range",
-        example={"min": 800, "max": 850}
+    heat_transfer_coefficient: Optional[Quantity] = Field(
+        default=None,
+        description="Overall heat transfer coefficient"
     )
-    unit: str = Field(
-        description="Property unit",
-        example="kg/m3"
+    pressure_drop: Optional[SideQuantities] = Field(
+        default=None,
+        description="Pressure drop per side"
     )
-    description: Optional[str] = Field(
+    effectiveness: Optional[Quantity] = Field(
         default=None,
-        description="Additional description",
-        example="At operating conditions"
+        description="Thermal effectiveness"
     )
 
-class Flow(BaseModel):
-    """Model for process flows and stream specifications"""
+@columnar
+class Equipment(BaseModel):
+    """Model for process equipment specification and characteristics"""
+    model_config = ConfigDict(defer_build=True, json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Unique process flow identifier",
-        example="F-101"  # Flow/Stream 101
+        description="Unique equipment identifier in the process system"
     )
-    name: Optional[str] = Field(
-        default=None,
-        description="Descriptive name of the process flow",
-        example="Reactor Feed Stream"
+    name: OptionalStr = Field(
+        description="Descriptive name of the equipment"
     )
-    type: str = Field(
-        description="Type of process flow or stream",
-        example="process_feed"  # product, intermediate, utility, waste
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Type of process equipment"  # shell_and_tube_heat_exchanger, centrifugal_pump, distillation_column
     )
-    phase_state: str = Field(
-        description="Physical state of the flow",
-        example="liquid"  # vapor, two_phase, supercritical
+    service: OptionalStr = Field(
+        description="Primary service or function of the equipment"
     )
-    from_equipment: Optional[str] = Field(
+    design_parameters: Optional[DesignParameters] = Field(
         default=None,
-        description="Source equipment identifier",
-        example="P-101"  # Pump 101
+        description="Key design parameters and specifications"
     )
-    to_equipment: Optional[str] = Field(
+    operating_parameters: Optional[OperatingParameters] = Field(
         default=None,
-        description="Destination equipment identifier",
-        example="R-101"  # Reactor 101
+        description="Normal operating parameters"
     )
-    components: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Chemical composition of the flow",
-        example=[
-            {
-                "name": "n-hexane",
-                "formula": "C6H14",
-                "concentration": {"value": 85.0, "unit": "mol%"},
-                "phase": "liquid",
-                "is_key_component": True
-            },
-            {
-                "name": "n-heptane",
-                "formula": "C7H16",
-                "concentration": {"value": 15.0, "unit": "mol%"},
-                "phase": "liquid",
-                "is_key_component": False
-            }
-        ]
+    performance_parameters: Optional[PerformanceParameters] = Field(
+        default=None,
+        description="Key performance indicators"
     )
-    physical_properties: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Physical properties of the flow",
-        example=[
-            {
-                "property": "density",
-                "value": 680.0,
-                "unit": "kg/m3",
-                "conditions": {
-                    "temperature": {"value": 25, "unit": "°C"},
-                    "pressure": {"value": 1, "unit": "atm"}
-                }
-            },
-            {
-                "property": "viscosity",
-                "value": 0.45,
-                "unit": "cP",
-                "conditions": {
-                    "temperature": {"value": 25, "unit": "°C"}
-                }
-            },
-            {
-                "property": "thermal_conductivity",
-                "value": 0.13,
-                "unit": "W/m·K",
-                "conditions": {
-                    "temperature": {"value": 25, "unit": "°C"}
-                }
-            }
-        ]
+    mechanical_design: DictField = Field(
+        description="Mechanical design specifications"
     )
-    operating_conditions: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Operating conditions of the flow",
-        example={
-            "pressure": {
-                "value": 10.0,
-                "unit": "barg",
-                "min": 8.0,
-                "max": 12.0,
-                "design": 15.0
-            },
-            "temperature": {
-                "value": 80.0,
-                "unit": "°C",
-                "min": 75.0,
-                "max": 85.0,
-                "design": 100.0
-            },
-            "flow_rate": {
-                "value": 100.0,
-                "unit": "m3/h",
-                "min": 80.0,
-                "max": 120.0,
-                "design": 125.0
-            }
-        }
+    instruments: ListOfDictsField = Field(
+        description="Associated instrumentation"
     )
-    design_parameters: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Design parameters for the flow",
-        example={
-            "line_size": {"value": 6, "unit": "inches"},
-            "material": "carbon_steel",
-            "insulation": {
-                "type": "mineral_wool",
-                "thickness": {"value": 50, "unit": "mm"}
-            },
-            "design_velocity": {"value": 2.5, "unit": "m/s"}
-        }
+    connections: ListOfDictsField = Field(
+        description="Process and utility connections"
     )
-    quality_requirements: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Quality specifications and requirements",
-        example={
-            "contaminants": {
-                "water": {"max": 50, "unit": "ppm"},
-                "sulfur": {"max": 10, "unit": "ppm"}
-            },
-            "physical_properties": {
-                "reid_vapor_pressure": {"max": 0.7, "unit": "bar"},
-                "flash_point": {"min": 35, "unit": "°C"}
-            }
-        }
+    maintenance_requirements: ListOfDictsField = Field(
+        description="Maintenance specifications and requirements"
     )
-    instrumentation: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Flow measurement and monitoring instruments",
-        example=[
-            {
-                "tag": "FT-101",
-                "type": "flow_transmitter",
-                "technology": "coriolis",
-                "range": {"min": 0, "max": 150, "unit": "m3/h"},
-                "accuracy": {"value": 0.5, "unit": "percent"}
-            },
-            {
-                "tag": "TT-101",
-                "type": "temperature_transmitter",
-                "range": {"min": 0, "max": 150, "unit": "°C"}
-            }
-        ]
+    safety_features: ListOfDictsField = Field(
+        description="Safety features and protection devices"
     )
-    safety_requirements: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Safety considerations and requirements",
-        example={
-            "hazard_classification": "flammable_liquid",
-            "flash_point": {"value": 35, "unit": "°C"},
-            "auto_ignition_temperature": {"value": 225, "unit": "°C"},
-            "protective_measures": [
-                "earthing_required",
-                "explosion_proof_equipment"
-            ]
-        }
+    documentation: ListOfDictsField = Field(
+        description="Associated technical documentation"
     )
-    energy_content: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Energy characteristics of the flow",
-        example={
-            "heating_value": {"value": 45000, "unit": "kJ/kg"},
-            "specific_heat": {"value": 2.2, "unit": "kJ/kg·K"},
-            "enthalpy": {"value": 250, "unit": "kJ/kg"}
-        }
+    vendor_information: DictField = Field(
+        description="Equipment vendor and manufacturing information"
     )
-    economic_value: Optional[Dict[str, Any]] = Field(
+    cost_information: Dict[str, Quantity] = Field(
         default_factory=dict,
-        description="Economic characteristics of the flow",
-        example={
-            "unit_cost": {"value": 500, "unit": "USD/ton"},
-            "annual_value": {"value": 5000000, "unit": "USD/year"},
-            "quality_premium": {"value": 25, "unit": "USD/ton"}
-        }
+        description="Cost and economic information"
     )
 
-class Corrosion(BaseModel):
-    """Model for tracking and analyzing corrosion in process equipment"""
-    id: str = Field(
-        description="Unique corrosion case identifier",
-        example="COR-2024-HE101-01"
-    )
-    type: str = Field(
-        description="Type of corrosion mechanism",
-        example="pitting_corrosion"  # uniform_corrosion, stress_corrosion_cracking, galvanic_corrosion
+class ScalarValue(BaseModel):
+    """Single numeric value of a property"""
+    model_config = ConfigDict(defer_build=True, json_schema_extra=_inject_examples)
+
+    kind: Literal["scalar"] = Field(
+        default="scalar",
+        description="Discriminator tag"
     )
-    location: Optional[str] = Field(
-        default=None,
-        description="Specific location of corrosion in equipment",
-        example="Heat exchanger tube sheet, inlet side, tubes 15-20 in outer ring"
+    value: float = Field(
+        default=0.0,
+        description="Numeric value"
     )
-    equipment_id: str = Field(
-        description="Identifier of affected equipment",
-        example="HE-101"
+
+class RangeValue(BaseModel):
+    """Numeric range of a property"""
+    model_config = ConfigDict(defer_build=True, extra="forbid", json_schema_extra=_inject_examples)
+
+    kind: Literal["range"] = Field(
+        default="range",
+        description="Discriminator tag"
     )
-    description: Optional[str] = Field(
+    min: Optional[float] = Field(
         default=None,
-        description="Detailed description of corrosion issue",
-        example="Localized pitting corrosion observed on 316L stainless steel tube sheet, concentrated near seawater inlet"
+        description="Lower bound of the range"
     )
-    rate: Optional[float] = Field(
+    max: Optional[float] = Field(
         default=None,
-        description="Measured corrosion rate",
-        example=0.5  # mm/year
+        description="Upper bound of the range"
     )
-    rate_unit: Optional[str] = Field(
-        default=None,
-        description="Unit of corrosion rate measurement",
-        example="mm/year"
+
+def _tag_range_or_scalar(value: Any) -> Any:
+    """Attach the `kind` tag to legacy untagged inputs.
+
+    Numbers, numeric strings and {"value": x} dicts are scalars; dicts with
+    min and/or max are ranges. Anything else is passed through untagged and
+    rejected by the discriminator instead of being silently coerced.
+    """
+    if isinstance(value, (int, float, str)) and not isinstance(value, bool):
+        try:
+            return {"kind": "scalar", "value": float(value)}
+        except ValueError:
+            return value
+    if isinstance(value, dict) and "kind" not in value:
+        if "value" in value:
+            return {"kind": "scalar", **value}
+        if "min" in value or "max" in value:
+            return {"kind": "range", **value}
+    return value
+
+# Tagged scalar-or-range value: validation dispatches on `kind` in one lookup
+# instead of trying each union member in turn.
+RangeOrScalar = Annotated[
+    Union[ScalarValue, RangeValue],
+    Field(discriminator="kind"),
+    BeforeValidator(_tag_range_or_scalar),
+]
+
+class ComponentProperty(BaseModel):
+    """Model for component properties in a flow"""
+    model_config = ConfigDict(defer_build=True, json_schema_extra=_inject_examples)
+
+    name: str = Field(
+        description="Component name"
     )
-    severity_assessment: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Assessment of corrosion severity and impact",
-        example={
-            "level": "high",
-            "wall_thickness_remaining": {"value": 4.5, "unit": "mm"},
-            "minimum_required_thickness": {"value": 3.8, "unit": "mm"},
-            "estimated_remaining_life": {"value": 2, "unit": "years"},
-            "risk_level": "significant",
-            "immediate_action_required": True
-        }
+    concentration: RangeOrScalar = Field(
+        default_factory=ScalarValue,
+        description="Component concentration or range"
     )
-    monitoring_data: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Corrosion monitoring measurements and observations",
-        example=[
-            {
-                "date": "2024-01-15",
-                "method": "ultrasonic_thickness",
-                "location": "TS-point-1",
-                "reading": {"value": 4.5, "unit": "mm"},
-                "baseline": {"value": 6.0, "unit": "mm"},
-                "inspector": "John Smith"
-            },
-            {
-                "date": "2024-01-15",
-                "method": "visual_inspection",
-                "findings": "Multiple pits observed, max depth 1.5mm",
-                "photos": ["COR-HE101-P001", "COR-HE101-P002"]
-            }
-        ]
+    unit: InternedStr = Field(
+        description="Concentration unit"
     )
-    root_cause_analysis: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Analysis of corrosion root causes",
-        example={
-            "primary_causes": [
-                "chloride_concentration_exceeds_limits",
-                "local_flow_turbulence",
-                "temperature_above_design"
-            ],
-            "contributing_factors": [
-                "inadequate_chemical_treatment",
-                "periodic_stagnant_conditions"
-            ],
-            "verification_tests": [
-                "water_analysis",
-                "metallurgical_examination"
-            ]
-        }
+    description: OptionalStr = Field(
+        description="Additional description"
     )
-    environmental_conditions: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Environmental conditions contributing to corrosion",
-        example={
-            "process_fluid": "seawater",
-            "temperature": {"value": 65, "unit": "°C"},
-            "pressure": {"value": 4, "unit": "barg"},
-            "flow_velocity": {"value": 1.5, "unit": "m/s"},
-            "pH": 6.5,
-            "chlorides": {"value": 19000, "unit": "ppm"},
-            "oxygen_content": {"value": 7, "unit": "ppb"}
-        }
+
+class PhysicalProperty(BaseModel):
+    """Model for physical properties of a flow"""
+    model_config = ConfigDict(defer_build=True, json_schema_extra=_inject_examples)
+
+    name: str = Field(
+        description="Property name"
     )
-    material_data: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Material specifications and properties",
-        example={
-            "material": "316L stainless steel",
-            "composition": {
-                "Cr": "16-18%",
-                "Ni": "10-14%",
-                "Mo": "2-3%"
-            },
-            "heat_treatment": "solution_annealed",
-            "surface_condition": "pickled_and_passivated"
-        }
+    value: RangeOrScalar = Field(
+        default_factory=ScalarValue,
+        description="Property value or range"
     )
-    mitigation_measures: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Implemented and planned corrosion mitigation measures",
-        example=[
-            {
-                "type": "chemical_treatment",
-                "description": "Increased inhibitor dosage",
-                "implementation_date": "2024-01-20",
-                "effectiveness": "under_evaluation"
-            },
-            {
-                "type": "operational_change",
-                "description": "Reduced operating temperature",
-                "implementation_date": "2024-01-15",
-                "effectiveness": "positive"
-            }
-        ]
+    unit: InternedStr = Field(
+        description="Property unit"
     )
-    inspection_requirements: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Inspection and monitoring requirements",
-        example={
-            "methods": ["UT_thickness", "visual_inspection", "pit_depth_measurement"],
-            "frequency": "monthly",
-            "critical_locations": ["tube_sheet_inlet", "first_pass_tubes"],
-            "acceptance_criteria": {
-                "minimum_thickness": {"value": 3.8, "unit": "mm"},
-                "maximum_pit_depth": {"value": 2.0, "unit": "mm"}
-            }
-        }
+    description: OptionalStr = Field(
+        description="Additional description"
     )
-    repair_history: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="History of repairs and interventions",
-        example=[
-            {
-                "date": "2023-07-15",
-                "type": "weld_overlay",
-                "location": "tube_sheet_face",
-                "contractor": "Specialty Welding Inc",
-                "work_reference": "WO-2023-156",
-                "post_repair_inspection": "passed"
-            }
-        ]
+
+class OperatingCondition(Quantity):
+    """Operating value of a parameter with its limits"""
+    min: Optional[float] = Field(
+        default=None,
+        description="Minimum operating value"
     )
-    economic_impact: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Economic impact assessment",
-        example={
-            "monitoring_costs": {"value": 5000, "unit": "USD/year"},
-            "repair_costs": {"value": 25000, "unit": "USD"},
-            "production_loss": {"value": 50000, "unit": "USD"},
-            "estimated_replacement_cost": {"value": 150000, "unit": "USD"}
-        }
+    max: Optional[float] = Field(
+        default=None,
+        description="Maximum operating value"
     )
-    recommendations: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Recommendations for corrosion management",
-        example=[
-            {
-                "priority": "high",
-                "action": "Replace tube sheet with higher grade alloy",
-                "estimated_cost": {"value": 75000, "unit": "USD"},
-                "implementation_timeline": "Next shutdown",
-                "expected_benefit": "Extended equipment life by 10 years"
-            }
-        ]
+    design: Optional[float] = Field(
+        default=None,
+        description="Design value"
     )
 
-class Fouling(BaseModel):
-    """Model for tracking and analyzing fouling in process equipment"""
+@columnar
+class Flow(BaseModel):
+    """Model for process flows and stream specifications"""
+    model_config = ConfigDict(defer_build=True, json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Unique fouling case identifier",
-        example="FOUL-2024-HE101-01"  # Fouling case 01 for Heat Exchanger 101 in 2024
+        description="Unique process flow identifier"
     )
-    type: str = Field(
-        description="Type of fouling mechanism",
-        example="crystallization_fouling"  # particulate_fouling, chemical_reaction_fouling, biological_fouling
+    name: OptionalStr = Field(
+        description="Descriptive name of the process flow"
     )
-    location: Optional[str] = Field(
-        default=None,
-        description="Specific location of fouling in equipment",
-        example="Tube-side inlet passes, first 1 meter of tubes in lower bundle"
+    type: InternedStr = Field(
+        description="Type of process flow or stream"  # process_feed, product, intermediate, utility, waste
     )
-    equipment_id: str = Field(
-        description="Identifier of affected equipment",
-        example="HE-101"  # Heat Exchanger 101
+    phase_state: InternedStr = Field(
+        description="Physical state of the flow"  # liquid, vapor, two_phase, supercritical
     )
-    description: Optional[str] = Field(
-        default=None,
-        description="Detailed description of fouling issue",
-        example="Calcium carbonate scale formation on tube inner surfaces, predominantly in inlet passes"
+    from_equipment: OptionalStr = Field(
+        description="Source equipment identifier"
     )
-    severity_assessment: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Assessment of fouling severity and impact",
-        example={
-            "level": "moderate",
-            "heat_transfer_reduction": {"value": 25, "unit": "percent"},
-            "pressure_drop_increase": {"value": 35, "unit": "percent"},
-            "estimated_thickness": {"value": 2.5, "unit": "mm"},
-            "affected_area": {"value": 30, "unit": "percent"}
-        }
+    to_equipment: OptionalStr = Field(
+        description="Destination equipment identifier"
     )
-    monitoring_data: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Fouling monitoring measurements and observations",
-        example=[
-            {
-                "date": "2024-01-15",
-                "parameter": "heat_transfer_coefficient",
-                "value": {"current": 750, "clean": 1000, "unit": "W/m²K"},
-                "fouling_factor": {"value": 0.0003, "unit": "m²K/W"}
-            },
-            {
-                "date": "2024-01-15",
-                "parameter": "pressure_drop",
-                "value": {"current": 1.2, "clean": 0.8, "unit": "bar"},
-                "increase": {"value": 50, "unit": "percent"}
-            }
-        ]
+    components: ListOfDictsField = Field(
+        description="Chemical composition of the flow"
     )
-    composition: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Chemical composition of fouling deposits",
-        example=[
-            {
-                "compound": "calcium_carbonate",
-                "formula": "CaCO3",
-                "concentration": {"value": 65, "unit": "weight_percent"},
-                "form": "crystalline"
-            },
-            {
-                "compound": "iron_oxide",
-                "formula": "Fe2O3",
-                "concentration": {"value": 15, "unit": "weight_percent"},
-                "form": "amorphous"
-            }
-        ]
+    physical_properties: ListOfDictsField = Field(
+        description="Physical properties of the flow"
     )
-    operating_conditions: Optional[Dict[str, Any]] = Field(
+    operating_conditions: Dict[str, OperatingCondition] = Field(
         default_factory=dict,
-        description="Operating conditions contributing to fouling",
-        example={
-            "temperature": {
-                "bulk": {"value": 75, "unit": "°C"},
-                "wall": {"value": 95, "unit": "°C"},
-                "critical_value": 85
-            },
-            "flow_velocity": {"value": 1.5, "unit": "m/s"},
-            "reynolds_number": 15000,
-            "supersaturation_ratio": 2.5
-        }
+        description="Operating conditions of the flow"
     )
-    rate: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Fouling rate characteristics",
-        example={
-            "thickness_growth": {"value": 0.1, "unit": "mm/month"},
-            "thermal_resistance_increase": {"value": 0.0001, "unit": "m²K/W/month"},
-            "pressure_drop_increase": {"value": 0.1, "unit": "bar/month"},
-            "pattern": "asymptotic"  # linear, falling, accelerating
-        }
+    design_parameters: DictField = Field(
+        description="Design parameters for the flow"
     )
-    cleaning_methods: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Applicable cleaning methods and their effectiveness",
-        example=[
-            {
-                "method": "chemical_cleaning",
-                "chemical": "hydrochloric_acid",
-                "concentration": {"value": 5, "unit": "percent"},
-                "temperature": {"value": 40, "unit": "°C"},
-                "duration": {"value": 6, "unit": "hours"},
-                "effectiveness": {"value": 95, "unit": "percent"}
-            },
-            {
-                "method": "mechanical_cleaning",
-                "technique": "hydroblasting",
-                "pressure": {"value": 1000, "unit": "bar"},
-                "effectiveness": {"value": 90, "unit": "percent"}
-            }
-        ]
+    quality_requirements: DictField = Field(
+        description="Quality specifications and requirements"
     )
-    prevention_measures: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Fouling prevention and mitigation measures",
-        example=[
-            {
-                "measure": "antiscalant_dosing",
-                "chemical": "phosphonate_based",
-                "dosage": {"value": 5, "unit": "ppm"},
-                "effectiveness": "high"
-            },
-            {
-                "measure": "flow_velocity_control",
-                "minimum": {"value": 1.2, "unit": "m/s"},
-                "target": {"value": 1.5, "unit": "m/s"},
-                "effectiveness": "moderate"
-            }
-        ]
+    instrumentation: ListOfDictsField = Field(
+        description="Flow measurement and monitoring instruments"
     )
-    economic_impact: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Economic impact assessment",
-        example={
-            "energy_loss": {"value": 50000, "unit": "USD/year"},
-            "cleaning_cost": {"value": 15000, "unit": "USD/event"},
-            "production_loss": {"value": 25000, "unit": "USD/event"},
-            "total_annual_impact": {"value": 120000, "unit": "USD/year"}
-        }
+    safety_requirements: DictField = Field(
+        description="Safety considerations and requirements"
     )
-    cleaning_history: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="History of cleaning operations",
-        example=[
-            {
-                "date": "2023-07-15",
-                "method": "chemical_cleaning",
-                "effectiveness": {"value": 95, "unit": "percent"},
-                "cost": {"value": 15000, "unit": "USD"},
-                "downtime": {"value": 24, "unit": "hours"}
-            }
-        ]
+    energy_content: Dict[str, Quantity] = Field(
+        default_factory=dict,
+        description="Energy characteristics of the flow"
     )
-    recommendations: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Recommendations for fouling management",
-        example=[
-            {
-                "category": "prevention",
-                "action": "install_online_monitoring",
-                "priority": "high",
-                "cost": {"value": 25000, "unit": "USD"},
-                "benefit": "Early detection and intervention"
-            },
-            {
-                "category": "operation",
-                "action": "increase_flow_velocity",
-                "priority": "medium",
-                "cost": {"value": 0, "unit": "USD"},
-                "benefit": "Reduce deposition rate"
-            }
-        ]
+    economic_value: Dict[str, Quantity] = Field(
+        default_factory=dict,
+        description="Economic characteristics of the flow"
     )
 
-class CoolingSystem(BaseModel):
-    """Model for industrial cooling water systems and cooling circuits"""
-    id: str = Field(
-        description="Unique cooling system identifier",
-        example="CWS-101"
-    )
-    type: str = Field(
-        description="Type of cooling system configuration",
-        example="closed_loop"  # open_loop, once_through, hybrid
+class Recommendation(BaseModel):
+    """Recommended action for managing an equipment degradation issue"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    action: str = Field(
+        description="Recommended action"
     )
-    description: Optional[str] = Field(
+    priority: Optional[Literal["low", "medium", "high"]] = Field(
         default=None,
-        description="Detailed description of cooling system and its purpose",
-        example="Closed-loop cooling water system serving process heat exchangers in Unit 100"
+        description="Priority of the action"
     )
-    equipment_served: Optional[List[str]] = Field(
-        default_factory=list,
-        description="List of equipment IDs served by this cooling system",
-        example=["E-101", "E-102", "R-101-jacket"]
+    category: Optional[InternedStr] = Field(
+        default=None,
+        description="Category of the action"
     )
-    water_parameters: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Critical cooling water parameters and specifications",
-        example=[
-            {
-                "parameter": "supply_temperature",
-                "normal": 30,
-                "max": 35,
-                "unit": "°C",
-                "monitoring": "continuous"
-            },
-            {
-                "parameter": "return_temperature",
-                "normal": 40,
-                "max": 45,
-                "unit": "°C",
-                "monitoring": "continuous"
-            },
-            {
-                "parameter": "pressure",
-                "normal": 4,
-                "min": 3,
-                "max": 6,
-                "unit": "barg"
-            }
-        ]
+    estimated_cost: Optional[Quantity] = Field(
+        default=None,
+        description="Estimated cost of the action"
     )
-    water_treatment: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Water treatment system specifications and requirements",
-        example={
-            "chemicals": [
-                {
-                    "name": "corrosion_inhibitor",
-                    "dosage": 100,
-                    "unit": "ppm",
-                    "control": "automatic"
-                },
-                {
-                    "name": "biocide",
-                    "dosage": 5,
-                    "unit": "ppm",
-                    "frequency": "weekly"
-                }
-            ],
-            "monitoring_parameters": [
-                "pH",
-                "conductivity",
-                "chlorides",
-                "bacterial_count"
-            ]
-        }
+    cost: Optional[Quantity] = Field(
+        default=None,
+        description="Cost of the action"
     )
-    cooling_tower: Optional[Dict[str, Any]] = Field(
-        default=None,
-        description="Cooling tower specifications and operating parameters",
-        example={
-            "type": "induced_draft",
-            "capacity": {"value": 1000, "unit": "m3/h"},
-            "design_parameters": {
-                "wet_bulb": {"value": 28, "unit": "°C"},
-                "approach": {"value": 5, "unit": "°C"},
-                "range": {"value": 10, "unit": "°C"}
-            },
-            "fan_details": {
-                "quantity": 2,
-                "power": {"value": 75, "unit": "kW"},
-                "control": "variable_speed"
-            }
-        }
+    implementation_timeline: OptionalStr = Field(
+        description="When the action should be implemented"
     )
-    pumps: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Cooling water circulation pump specifications",
-        example=[
-            {
-                "id": "P-101",
-                "type": "centrifugal",
-                "service": "main_circulation",
-                "capacity": {"value": 1000, "unit": "m3/h"},
-                "head": {"value": 40, "unit": "m"},
-                "power": {"value": 132, "unit": "kW"},
-                "configuration": "duty"
-            },
-            {
-                "id": "P-102",
-                "type": "centrifugal",
-                "service": "main_circulation",
-                "configuration": "standby"
-            }
-        ]
+    expected_benefit: OptionalStr = Field(
+        description="Expected benefit of the action"
     )
-    heat_exchangers: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Heat exchangers in the cooling system",
-        example=[
-            {
-                "id": "E-101",
-                "service": "process_cooling",
-                "duty": {"value": 5000, "unit": "kW"},
-                "design_temperatures": {
-                    "cw_inlet": {"value": 30, "unit": "°C"},
-                    "cw_outlet": {"value": 40, "unit": "°C"}
-                }
-            }
-        ]
+    benefit: OptionalStr = Field(
+        description="Benefit of the action"
     )
-    operational_limits: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="System operational limits and constraints",
-        example={
-            "max_system_pressure": {"value": 6, "unit": "barg"},
-            "min_flow_rate": {"value": 500, "unit": "m3/h"},
-            "max_return_temperature": {"value": 45, "unit": "°C"},
-            "water_quality_limits": {
-                "pH": {"min": 7.0, "max": 8.5},
-                "conductivity": {"max": 2500, "unit": "µS/cm"},
-                "chlorides": {"max": 200, "unit": "ppm"}
-            }
-        }
+
+class CorrosionSeverity(BaseModel):
+    """Assessment of corrosion severity and impact"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    level: Optional[Literal["low", "moderate", "high", "critical"]] = Field(
+        default=None,
+        description="Severity level"
     )
-    quality_parameters: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Water quality monitoring parameters",
-        example=[
-            {
-                "parameter": "pH",
-                "normal_range": {"min": 7.0, "max": 8.5},
-                "monitoring_frequency": "continuous",
-                "control_method": "acid_dosing"
-            },
-            {
-                "parameter": "corrosion_rate",
-                "target": {"max": 0.1, "unit": "mm/year"},
-                "monitoring_frequency": "monthly"
-            }
-        ]
+    wall_thickness_remaining: Optional[Quantity] = Field(
+        default=None,
+        description="Remaining wall thickness"
     )
-    makeup_parameters: Optional[Dict[str, Any]] = Field(
-        default=None,
-        description="Makeup water specifications and requirements",
-        example={
-            "source": "demineralized_water",
-            "average_rate": {"value": 10, "unit": "m3/h"},
-            "quality_requirements": {
-                "conductivity": {"max": 10, "unit": "µS/cm"},
-                "silica": {"max": 0.1, "unit": "ppm"}
-            },
-            "control": "automatic_level_control"
-        }
+    minimum_required_thickness: Optional[Quantity] = Field(
+        default=None,
+        description="Minimum required wall thickness"
     )
-    blowdown_parameters: Optional[Dict[str, Any]] = Field(
+    estimated_remaining_life: Optional[Quantity] = Field(
         default=None,
-        description="Blowdown specifications and control parameters",
-        example={
-            "control_basis": "conductivity",
-            "setpoint": {"value": 2000, "unit": "µS/cm"},
-            "average_rate": {"value": 5, "unit": "m3/h"},
-            "disposal": "neutralization_pit"
-        }
+        description="Estimated remaining life"
     )
-    energy_efficiency: Optional[Dict[str, Any]] = Field(
+    risk_level: Optional[InternedStr] = Field(
         default=None,
-        description="Energy efficiency parameters and monitoring",
-        example={
-            "specific_power": {"value": 0.15, "unit": "kW/RT"},
-            "efficiency_indicators": {
-                "approach_temperature": {"target": 5, "unit": "°C"},
-                "cycles_of_concentration": {"target": 6}
-            }
-        }
+        description="Risk level"
     )
-    maintenance_requirements: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Maintenance requirements and schedules",
-        example=[
-            {
-                "item": "cooling_tower_fill",
-                "frequency": "annual",
-                "type": "inspection_cleaning",
-                "procedure": "CT-MAINT-001"
-            },
-            {
-                "item": "water_quality",
-                "frequency": "daily",
-                "type": "monitoring",
-                "parameters": ["pH", "conductivity", "chlorine"]
-            }
-        ]
+    immediate_action_required: Optional[bool] = Field(
+        default=None,
+        description="Whether immediate action is required"
     )
 
-class MaintenanceTask(BaseModel):
-    """Model for individual maintenance tasks"""
-    id: str = Field(
-        description="Unique task identifier",
-        example="TASK-001"
-    )
-    description: Optional[str] = Field(
+class CorrosionReading(BaseModel):
+    """Single corrosion monitoring measurement or observation"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    date: Optional[datetime] = Field(
         default=None,
-        description="Task description",
-        example="Pump bearing inspection and lubrication"
+        description="Date of the measurement"
     )
-    duration: Optional[float] = Field(
+    method: Optional[InternedStr] = Field(
         default=None,
-        description="Task duration",
-        example=2.5
+        description="Monitoring method"
     )
-    duration_unit: Optional[str] = Field(
-        default=None,
-        description="Duration unit",
-        example="hours"
+    location: OptionalStr = Field(
+        description="Measurement location"
     )
-    required_personnel: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Required personnel",
-        example=["mechanic", "supervisor"]
+    reading: Optional[Quantity] = Field(
+        default=None,
+        description="Measured value"
     )
-    tools_equipment: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Required tools and equipment",
-        example=["grease gun", "bearing puller"]
+    baseline: Optional[Quantity] = Field(
+        default=None,
+        description="Baseline value"
     )
-    safety_requirements: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Safety requirements",
-        example=["safety glasses", "gloves"]
+    inspector: OptionalStr = Field(
+        description="Person who performed the inspection"
     )
-    steps: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Task steps",
-        example=["Stop equipment", "Lock out power"]
+    findings: OptionalStr = Field(
+        description="Observed findings"
     )
-    acceptance_criteria: Optional[List[str]] = Field(
-        default=None,
-        description="Acceptance criteria",
-        example=["No unusual noise", "Normal temperature"]
+    photos: StrListField = Field(
+        description="Photo references"
     )
 
-class MaintenanceSchedule(BaseModel):
-    """Model for maintenance scheduling"""
-    frequency: Optional[float] = Field(
-        default=None,
-        description="Maintenance frequency",
-        example=30
+class ThicknessReading(BaseModel):
+    """Ultrasonic wall thickness measurement"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    method: Literal["ultrasonic_thickness"] = Field(
+        default="ultrasonic_thickness",
+        description="Monitoring method"
     )
-    frequency_unit: Optional[str] = Field(
+    date: Optional[datetime] = Field(
         default=None,
-        description="Frequency unit",
-        example="days"
+        description="Date of the measurement"
     )
-    last_performed: Optional[datetime] = Field(
-        default=None,
-        description="Last maintenance date",
-        example="2024-01-15T10:00:00"
+    location: OptionalStr = Field(
+        description="Measurement location"
     )
-    next_due: Optional[datetime] = Field(
+    reading: Optional[Quantity] = Field(
         default=None,
-        description="Next maintenance due date",
-        example="2024-02-15T10:00:00"
+        description="Measured thickness"
     )
-    flexibility: Optional[Dict[str, Any]] = Field(
+    baseline: Optional[Quantity] = Field(
         default=None,
-        description="Schedule flexibility",
-        example={"early": "5 days", "late": "3 days"}
+        description="Baseline thickness"
+    )
+    inspector: OptionalStr = Field(
+        description="Person who performed the inspection"
     )
 
-class Maintenance(BaseModel):
-    """Model for maintenance activities and maintenance management"""
-    id: str = Field(
-        description="Unique maintenance activity identifier",
-        example="MAINT-2024-HE101-01"  # Maintenance activity 01 for Heat Exchanger 101 in 2024
+class VisualReading(BaseModel):
+    """Visual inspection observation"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    method: Literal["visual_inspection"] = Field(
+        default="visual_inspection",
+        description="Monitoring method"
     )
-    type: str = Field(
-        description="Type of maintenance activity",
-        example="preventive_maintenance"  # corrective_maintenance, predictive_maintenance, condition_based
+    date: Optional[datetime] = Field(
+        default=None,
+        description="Date of the inspection"
     )
-    category: str = Field(
-        description="Category of maintenance work",
-        example="mechanical"  # electrical, instrumentation, civil, inspection
+    findings: OptionalStr = Field(
+        description="Observed findings"
     )
-    equipment_id: str = Field(
-        description="Equipment identifier for maintenance target",
-        example="HE-101"  # Heat Exchanger 101
+    photos: StrListField = Field(
+        description="Photo references"
     )
-    description: Optional[str] = Field(
-        default=None,
-        description="Detailed description of maintenance activity",
-        example="Annual preventive maintenance of shell and tube heat exchanger including tube bundle cleaning and inspection"
+    inspector: OptionalStr = Field(
+        description="Person who performed the inspection"
     )
-    schedule: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Maintenance scheduling information",
-        example={
-            "planned_start": "2024-03-15T08:00:00",
-            "planned_end": "2024-03-17T16:00:00",
-            "duration": {"value": 20, "unit": "hours"},
-            "frequency": {"value": 12, "unit": "months"},
-            "last_performed": "2023-03-15",
-            "next_due": "2024-03-15"
-        }
-    )
-    tasks: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Detailed maintenance tasks to be performed",
-        example=[
-            {
-                "task_id": "T001",
-                "description": "Remove tube bundle",
-                "duration": {"value": 4, "unit": "hours"},
-                "required_skills": ["mechanical_technician"],
-                "tools_required": ["bundle_puller", "crane"],
-                "safety_requirements": ["confined_space_permit", "lifting_permit"]
-            },
-            {
-                "task_id": "T002",
-                "description": "High pressure water cleaning of tubes",
-                "duration": {"value": 8, "unit": "hours"},
-                "required_skills": ["cleaning_specialist"],
-                "tools_required": ["hydroblasting_unit"],
-                "safety_requirements": ["high_pressure_work_permit"]
-            }
-        ]
-    )
-    resources: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Resources required for maintenance",
-        example={
-            "personnel": [
-                {"role": "mechanical_technician", "quantity": 2, "hours": 16},
-                {"role": "supervisor", "quantity": 1, "hours": 4}
-            ],
-            "equipment": [
-                {"item": "mobile_crane", "duration": {"value": 4, "unit": "hours"}},
-                {"item": "hydroblasting_unit", "duration": {"value": 8, "unit": "hours"}}
-            ],
-            "materials": [
-                {"item": "gaskets", "quantity": 2, "specification": "spiral_wound_316L"},
-                {"item": "cleaning_chemicals", "quantity": {"value": 100, "unit": "liters"}}
-            ]
-        }
+
+CorrosionMonitoringEntry = tagged_union("method", {
+    "ultrasonic_thickness": ThicknessReading,
+    "visual_inspection": VisualReading,
+}, fallback=CorrosionReading)
+
+class RootCauseAnalysis(BaseModel):
+    """Analysis of corrosion root causes"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    primary_causes: StrListField = Field(
+        description="Primary causes"
     )
-    procedures: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Reference procedures and work instructions",
-        example=[
-            {
-                "document_id": "SOP-HE-001",
-                "title": "Heat Exchanger Bundle Removal",
-                "revision": "Rev.3",
-                "type": "standard_operating_procedure"
-            },
-            {
-                "document_id": "WI-HE-002",
-                "title": "Tube Bundle Cleaning Procedure",
-                "revision": "Rev.2",
-                "type": "work_instruction"
-            }
-        ]
+    contributing_factors: StrListField = Field(
+        description="Contributing factors"
     )
-    safety_requirements: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Safety requirements and precautions",
-        example=[
-            {
-                "requirement": "confined_space_entry",
-                "permit_type": "hot_work",
-                "ppe": ["breathing_apparatus", "safety_harness"],
-                "monitoring": ["oxygen_level", "toxic_gases"]
-            },
-            {
-                "requirement": "isolation",
-                "type": "lock_out_tag_out",
-                "points": ["inlet_valve", "outlet_valve"],
-                "verification": "pressure_test"
-            }
-        ]
+    verification_tests: StrListField = Field(
+        description="Tests used to verify the causes"
     )
-    quality_checks: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Quality control and acceptance criteria",
-        example=[
-            {
-                "check": "tube_thickness",
-                "method": "ultrasonic_testing",
-                "acceptance_criteria": {"min": 2.5, "unit": "mm"},
-                "sampling": "100%"
-            },
-            {
-                "check": "pressure_test",
-                "method": "hydrostatic_test",
-                "acceptance_criteria": {"value": 15, "unit": "barg"},
-                "hold_time": {"value": 1, "unit": "hour"}
-            }
-        ]
+
+class CorrosionEnvironment(BaseModel):
+    """Environmental conditions contributing to corrosion"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    process_fluid: OptionalStr = Field(
+        description="Process fluid"
     )
-    cost_tracking: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Cost tracking and budget information",
-        example={
-            "budget": {"value": 25000, "unit": "USD"},
-            "actual_costs": {
-                "labor": {"value": 12000, "unit": "USD"},
-                "materials": {"value": 5000, "unit": "USD"},
-                "equipment": {"value": 3000, "unit": "USD"},
-                "contractors": {"value": 4000, "unit": "USD"}
-            },
-            "variance": {"value": 1000, "unit": "USD"}
-        }
+    temperature: Optional[Quantity] = Field(
+        default=None,
+        description="Temperature"
     )
-    history: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Historical maintenance records",
-        example=[
-            {
-                "date": "2023-03-15",
-                "type": "preventive_maintenance",
-                "findings": "Normal wear and tear",
-                "work_performed": "Standard cleaning and inspection",
-                "cost": {"value": 23000, "unit": "USD"}
-            }
-        ]
+    pressure: Optional[Quantity] = Field(
+        default=None,
+        description="Pressure"
     )
-    performance_metrics: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Maintenance performance indicators",
-        example={
-            "mean_time_between_failures": {"value": 365, "unit": "days"},
-            "mean_time_to_repair": {"value": 24, "unit": "hours"},
-            "maintenance_effectiveness": {"value": 95, "unit": "percent"},
-            "schedule_compliance": {"value": 90, "unit": "percent"}
-        }
+    flow_velocity: Optional[Quantity] = Field(
+        default=None,
+        description="Flow velocity"
     )
-
-class CleaningMethod(BaseModel):
-    """Model for industrial cleaning methods and procedures"""
-    type: str = Field(
-        description="Type of cleaning method used in industrial equipment",
-        example="chemical_cleaning"
+    pH: Optional[float] = Field(
+        default=None,
+        description="pH value"
     )
-    duration: float = Field(  # Только добавили тип float
-        description="Expected duration of the cleaning procedure",
-        example=4.5,  # hours
-        default=0.0  # Добавили default для валидации
+    chlorides: Optional[Quantity] = Field(
+        default=None,
+        description="Chloride content"
     )
-    description: str = Field(
-        description="Detailed description of the cleaning method and its application",
-        example="Acid cleaning procedure using 5% hydrochloric acid solution for removal of calcium carbonate deposits in heat exchanger tubes"
-    )
-    chemicals: Optional[List[Dict[str, Any]]] = Field(
-        default=None,
-        description="Chemical agents used in the cleaning process with their specifications",
-        example=[
-            {
-                "name": "hydrochloric_acid",
-                "concentration": "5%",
-                "quantity": "1000 liters",
-                "supplier": "ChemCorp Ltd",
-                "safety_class": "Corrosive"
-            },
-            {
-                "name": "inhibitor_a12",
-                "concentration": "0.1%",
-                "quantity": "10 liters",
-                "purpose": "Corrosion protection"
-            }
-        ]
+    oxygen_content: Optional[Quantity] = Field(
+        default=None,
+        description="Dissolved oxygen content"
     )
-    parameters: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Critical process parameters for the cleaning method",
-        example=[
-            {
-                "name": "temperature",
-                "value": 40,
-                "unit": "°C",
-                "critical_max": 50,
-                "notes": "Monitor continuously"
-            },
-            {
-                "name": "circulation_rate",
-                "value": 100,
-                "unit": "m3/h",
-                "minimum": 80,
-                "notes": "Maintain turbulent flow"
-            },
-            {
-                "name": "pH",
-                "value": 2,
-                "acceptable_range": {"min": 1, "max": 3},
-                "monitoring_frequency": "30 minutes"
-            }
-        ]
+
+class MaterialData(BaseModel):
+    """Material specifications and properties"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    material: OptionalStr = Field(
+        description="Material designation"
     )
-    duration_unit: str = Field(
-        description="Unit of measurement for cleaning duration",
-        example="hours"  # Other examples: days, minutes
+    composition: Optional[Dict[str, str]] = Field(
+        default_factory=dict,
+        description="Chemical composition per element"
     )
-    restrictions: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Operating restrictions and limitations during cleaning",
-        example=[
-            "Maximum temperature must not exceed 50°C to prevent damage to gaskets",
-            "pH must be maintained between 1-3 throughout the cleaning process",
-            "Continuous ventilation required in confined spaces",
-            "Not suitable for titanium equipment parts"
-        ]
+    heat_treatment: OptionalStr = Field(
+        description="Heat treatment condition"
     )
-    safety_measures: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Required safety measures and precautions during cleaning",
-        example=[
-            "Full chemical resistant PPE including face shield required",
-            "Continuous hydrogen gas monitoring in confined spaces",
-            "Emergency shower and eyewash station must be readily available",
-            "Acid proof gloves and rubber boots mandatory",
-            "Two-way radio communication required between operators"
-        ]
+    surface_condition: OptionalStr = Field(
+        description="Surface condition"
     )
 
-class CleaningProcedure(BaseModel):
-    """Model for detailed industrial cleaning procedures and protocols"""
-    id: str = Field(
-        description="Unique identifier for the cleaning procedure",
-        example="CLEAN-2024-001"
+class MitigationMeasure(BaseModel):
+    """Implemented or planned corrosion mitigation measure"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Type of measure"
     )
-    equipment_id: str = Field(
-        description="Identifier of equipment requiring cleaning",
-        example="HE-101"  # Heat Exchanger 101
+    description: OptionalStr = Field(
+        description="Description of the measure"
     )
-    description: Optional[str] = Field(
+    implementation_date: Optional[datetime] = Field(
         default=None,
-        description="Comprehensive description of the cleaning procedure",
-        example="Two-stage chemical cleaning procedure for shell and tube heat exchanger HE-101 including alkaline and acid cleaning steps"
+        description="Implementation date"
     )
-    cleaning_methods: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Sequence of cleaning methods to be applied",
-        example=[
-            {
-                "step": 1,
-                "type": "alkaline_cleaning",
-                "description": "Initial degreasing with 3% NaOH solution",
-                "duration": "2 hours",
-                "temperature": "60°C"
-            },
-            {
-                "step": 2,
-                "type": "acid_cleaning",
-                "description": "Scale removal with 5% HCl solution",
-                "duration": "4 hours",
-                "temperature": "40°C"
-            }
-        ]
+    effectiveness: Optional[InternedStr] = Field(
+        default=None,
+        description="Observed effectiveness"
     )
-    trigger_conditions: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Conditions that trigger the need for cleaning",
-        example=[
-            "Pressure drop increase > 25% above baseline",
-            "Heat transfer coefficient decrease > 20%",
-            "Visual inspection shows significant fouling",
-            "After 6 months of continuous operation"
-        ]
+
+class InspectionRequirements(BaseModel):
+    """Inspection and monitoring requirements"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    methods: StrListField = Field(
+        description="Inspection methods"
     )
-    acceptance_criteria: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Criteria for successful cleaning completion",
-        example=[
-            "Pressure drop restored to within 10% of design value",
-            "Heat transfer coefficient restored to > 85% of design value",
-            "Visual inspection shows no visible deposits",
-            "Neutralization confirmed by pH measurement",
-            "Equipment integrity verified by NDT inspection"
-        ]
+    frequency: Optional[InternedStr] = Field(
+        default=None,
+        description="Inspection frequency"
     )
-    operational_limits: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Operating limitations during cleaning process",
-        example={
-            "max_pressure": {"value": 5, "unit": "barg"},
-            "max_temperature": {"value": 65, "unit": "°C"},
-            "min_flow_rate": {"value": 50, "unit": "m3/h"},
-            "pH_limits": {"min": 2, "max": 12}
-        }
+    critical_locations: StrListField = Field(
+        description="Critical locations to inspect"
     )
-    preparation_steps: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Required preparation steps before cleaning",
-        example=[
-            "1. Isolate equipment using double block and bleed",
-            "2. Drain and vent system completely",
-            "3. Install temporary cleaning connections",
-            "4. Verify all gaskets are compatible with cleaning chemicals",
-            "5. Set up temporary waste collection system"
-        ]
+    acceptance_criteria: Optional[Dict[str, Quantity]] = Field(
+        default_factory=dict,
+        description="Acceptance criteria per parameter"
     )
-    required_materials: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Materials and chemicals required for cleaning",
-        example=[
-            {
-                "name": "Sodium hydroxide",
-                "concentration": "3%",
-                "quantity": 2000,
-                "unit": "liters",
-                "specification": "Technical grade"
-            },
-            {
-                "name": "Hydrochloric acid",
-                "concentration": "5%",
-                "quantity": 3000,
-                "unit": "liters",
-                "specification": "Industrial grade"
-            }
-        ]
+
+class RepairRecord(BaseModel):
+    """Record of a repair or intervention"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    date: Optional[datetime] = Field(
+        default=None,
+        description="Repair date"
     )
-    safety_requirements: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Safety requirements and precautions",
-        example=[
-            "Continuous gas monitoring for confined space entry",
-            "Chemical resistant PPE including full face protection",
-            "Emergency shower and eyewash station must be operational",
-            "Minimum two person team required",
-            "Emergency response team on standby"
-        ]
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Type of repair"
     )
-    environmental_measures: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Environmental protection measures",
-        example=[
-            "pH neutralization before disposal",
-            "Heavy metals monitoring in waste stream",
-            "Proper segregation of chemical waste",
-            "Use of closed loop cleaning system",
-            "Air emissions monitoring during cleaning"
-        ]
+    location: OptionalStr = Field(
+        description="Repair location"
     )
-    waste_handling: Optional[Dict[str, Any]] = Field(
-        default=None,
-        description="Waste handling and disposal requirements",
-        example={
-            "waste_type": "Hazardous chemical waste",
-            "estimated_volume": 5000,
-            "unit": "liters",
-            "disposal_method": "Licensed chemical waste contractor",
-            "neutralization_requirements": "pH adjustment to 6-8",
-            "special_handling": "Separate heavy metal containing streams"
-        }
+    contractor: OptionalStr = Field(
+        description="Contractor who performed the repair"
     )
-    cleaning_history: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Historical cleaning records",
-        example=[
-            {
-                "date": "2024-01-15",
-                "type": "Chemical cleaning",
-                "effectiveness": "Good",
-                "contractor": "Industrial Cleaning Services Ltd",
-                "cost": 25000,
-                "findings": "Heavy scale deposits removed successfully"
-            }
-        ]
+    work_reference: OptionalStr = Field(
+        description="Work order reference"
     )
-    effectiveness_metrics: Optional[Dict[str, Any]] = Field(
+    post_repair_inspection: Optional[InternedStr] = Field(
         default=None,
-        description="Metrics for measuring cleaning effectiveness",
-        example={
-            "pressure_drop_improvement": "85%",
-            "heat_transfer_improvement": "90%",
-            "cleaning_time": "6 hours",
-            "chemical_consumption": "Within planned limits",
-            "cost_effectiveness": "High"
-        }
+        description="Result of the post-repair inspection"
     )
 
-class Economics(BaseModel):
-    """Model for economic metrics and financial analysis of process equipment and operations"""
+class Corrosion(BaseModel):
+    """Model for tracking and analyzing corrosion in process equipment"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Unique economic metric identifier",
-        example="ECON-2024-HE101"
+        description="Unique corrosion case identifier"
     )
-    equipment_id: Optional[str] = Field(
+    type: Literal["pitting_corrosion", "uniform_corrosion", "stress_corrosion_cracking", "galvanic_corrosion"] = Field(
+        description="Type of corrosion mechanism"
+    )
+    location: Optional[str] = Field(
         default=None,
-        description="Equipment identifier for specific equipment analysis",
-        example="HE-101"  # Heat Exchanger 101
+        description="Specific location of corrosion in equipment"
     )
-    metric_type: str = Field(
-        description="Type of economic metric being tracked",
-        example="operating_cost"  # capital_cost, maintenance_cost, energy_cost, total_cost_of_ownership
+    equipment_id: str = Field(
+        description="Identifier of affected equipment"
     )
-    period: Optional[str] = Field(
+    description: Optional[str] = Field(
         default=None,
-        description="Time period for economic analysis",
-        example="2024-Q1"  # annual, monthly, quarterly
+        description="Detailed description of corrosion issue"
     )
-    capital_costs: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Capital investment and fixed costs",
-        example={
-            "equipment_cost": {"value": 250000, "unit": "USD"},
-            "installation_cost": {"value": 75000, "unit": "USD"},
-            "engineering_cost": {"value": 25000, "unit": "USD"},
-            "commissioning_cost": {"value": 15000, "unit": "USD"},
-            "total_installed_cost": {"value": 365000, "unit": "USD"}
-        }
+    rate: Optional[float] = Field(
+        default=None,
+        description="Measured corrosion rate"  # mm/year
     )
-    operating_costs: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Operating and variable costs",
-        example={
-            "energy_consumption": {
-                "electricity": {"value": 50000, "unit": "USD/year"},
-                "steam": {"value": 30000, "unit": "USD/year"}
-            },
-            "raw_materials": {"value": 100000, "unit": "USD/year"},
-            "utilities": {"value": 25000, "unit": "USD/year"},
-            "labor": {"value": 40000, "unit": "USD/year"}
-        }
+    rate_unit: Optional[str] = Field(
+        default=None,
+        description="Unit of corrosion rate measurement"
     )
-    maintenance_costs: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Maintenance and repair costs",
-        example={
-            "routine_maintenance": {"value": 15000, "unit": "USD/year"},
-            "preventive_maintenance": {"value": 25000, "unit": "USD/year"},
-            "repairs": {"value": 10000, "unit": "USD/year"},
-            "spare_parts": {"value": 8000, "unit": "USD/year"}
-        }
+    severity_assessment: Optional[CorrosionSeverity] = Field(
+        default=None,
+        description="Assessment of corrosion severity and impact"
     )
-    performance_metrics: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Economic performance indicators",
-        example={
-            "availability": {"value": 0.95, "unit": "ratio"},
-            "production_rate": {"value": 1000, "unit": "tons/day"},
-            "specific_energy_consumption": {"value": 0.5, "unit": "kWh/ton"},
-            "product_quality": {"value": 0.98, "unit": "ratio"}
-        }
+    monitoring_data: Optional[List[CorrosionMonitoringEntry]] = Field(
+        default=None,
+        description="Corrosion monitoring measurements and observations"
     )
-    lifecycle_analysis: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Lifecycle cost analysis",
-        example={
-            "expected_lifetime": {"value": 20, "unit": "years"},
-            "depreciation_period": {"value": 10, "unit": "years"},
-            "salvage_value": {"value": 25000, "unit": "USD"},
-            "total_lifecycle_cost": {"value": 1500000, "unit": "USD"}
-        }
+    root_cause_analysis: Optional[RootCauseAnalysis] = Field(
+        default=None,
+        description="Analysis of corrosion root causes"
     )
-    efficiency_metrics: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Economic efficiency indicators",
-        example={
-            "cost_per_unit": {"value": 25, "unit": "USD/ton"},
-            "energy_cost_ratio": {"value": 0.15, "unit": "ratio"},
-            "maintenance_cost_ratio": {"value": 0.08, "unit": "ratio"},
-            "return_on_investment": {"value": 0.25, "unit": "ratio"}
-        }
+    environmental_conditions: Optional[CorrosionEnvironment] = Field(
+        default=None,
+        description="Environmental conditions contributing to corrosion"
     )
-    cost_drivers: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Major cost contributing factors",
-        example=[
-            {
-                "driver": "energy_consumption",
-                "contribution": {"value": 0.35, "unit": "ratio"},
-                "trend": "increasing",
-                "control_measures": ["efficiency_improvement", "load_optimization"]
-            },
-            {
-                "driver": "maintenance",
-                "contribution": {"value": 0.20, "unit": "ratio"},
-                "trend": "stable",
-                "control_measures": ["predictive_maintenance", "reliability_improvement"]
-            }
-        ]
+    material_data: Optional[MaterialData] = Field(
+        default=None,
+        description="Material specifications and properties"
     )
-    optimization_opportunities: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Identified cost optimization opportunities",
-        example=[
-            {
-                "opportunity": "energy_efficiency",
-                "potential_savings": {"value": 15000, "unit": "USD/year"},
-                "implementation_cost": {"value": 25000, "unit": "USD"},
-                "payback_period": {"value": 1.7, "unit": "years"},
-                "status": "evaluation"
-            }
-        ]
+    mitigation_measures: Optional[List[MitigationMeasure]] = Field(
+        default=None,
+        description="Implemented and planned corrosion mitigation measures"
     )
-    financial_risks: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Identified financial risks and mitigation measures",
-        example=[
-            {
-                "risk": "energy_price_volatility",
-                "impact": "high",
-                "probability": "medium",
-                "mitigation_measures": ["long_term_contracts", "efficiency_improvements"],
-                "contingency": {"value": 20000, "unit": "USD/year"}
-            }
-        ]
+    inspection_requirements: Optional[InspectionRequirements] = Field(
+        default=None,
+        description="Inspection and monitoring requirements"
     )
-    budget_tracking: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Budget versus actual cost tracking",
-        example={
-            "period": "2024-Q1",
-            "budget": {"value": 100000, "unit": "USD"},
-            "actual": {"value": 95000, "unit": "USD"},
-            "variance": {"value": -5000, "unit": "USD"},
-            "variance_explanation": "Lower than expected maintenance costs"
-        }
+    repair_history: Optional[List[RepairRecord]] = Field(
+        default=None,
+        description="History of repairs and interventions"
     )
-    benchmarking: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Cost benchmarking against industry standards",
-        example=[
-            {
-                "metric": "operating_cost_per_ton",
-                "actual": {"value": 25, "unit": "USD/ton"},
-                "industry_average": {"value": 28, "unit": "USD/ton"},
-                "percentile": 75,
-                "comments": "Better than industry average"
-            }
-        ]
+    economic_impact: Optional[Dict[str, Quantity]] = Field(
+        default=None,
+        description="Economic impact assessment"
+    )
+    recommendations: Optional[List[Recommendation]] = Field(
+        default=None,
+        description="Recommendations for corrosion management"
     )
 
-class EnergyEfficiency(BaseModel):
-    """Model for tracking and analyzing energy efficiency in process equipment and systems"""
-    id: str = Field(
-        description="Unique energy efficiency record identifier",
-        example="EE-2024-HE101"
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> 'Corrosion':
+        """Parse and validate a raw JSON document in one pydantic-core pass.
+
+        For a JSON array of records use CorrosionList.validate_json(raw).
+        """
+        return cls.model_validate_json(raw)
+
+class FoulingSeverity(BaseModel):
+    """Assessment of fouling severity and impact"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    level: Optional[Literal["low", "moderate", "high", "critical"]] = Field(
+        default=None,
+        description="Severity level"
     )
-    equipment_id: Optional[str] = Field(
+    heat_transfer_reduction: Optional[Quantity] = Field(
         default=None,
-        description="Equipment identifier for specific equipment analysis",
-        example="HE-101"  # Heat Exchanger 101
+        description="Reduction of heat transfer"
     )
-    energy_type: str = Field(
-        description="Type of energy consumption being monitored",
-        example="thermal"  # electrical, mechanical, combined
+    pressure_drop_increase: Optional[Quantity] = Field(
+        default=None,
+        description="Increase of pressure drop"
     )
-    consumption: Optional[float] = Field(
+    estimated_thickness: Optional[Quantity] = Field(
         default=None,
-        description="Measured energy consumption value",
-        example=1500.5  # kW or appropriate unit
+        description="Estimated deposit thickness"
     )
-    consumption_unit: Optional[str] = Field(
+    affected_area: Optional[Quantity] = Field(
         default=None,
-        description="Unit of energy consumption measurement",
-        example="kW"  # kWh, MJ, GJ
+        description="Share of the affected area"
     )
-    performance_metrics: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Key energy performance indicators",
-        example={
-            "thermal_efficiency": {"value": 0.82, "unit": "ratio"},
-            "heat_recovery": {"value": 75, "unit": "percent"},
-            "specific_energy_consumption": {"value": 2.5, "unit": "kWh/ton"},
-            "energy_intensity": {"value": 3.2, "unit": "GJ/ton_product"}
-        }
+
+class ReferenceComparison(BaseModel):
+    """Current value of a parameter compared to its clean-condition or design value"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    current: Optional[float] = Field(
+        default=None,
+        description="Current value"
     )
-    operating_parameters: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Current operating parameters affecting energy efficiency",
-        example={
-            "flow_rate": {"value": 100, "unit": "m3/h"},
-            "inlet_temperature": {"value": 80, "unit": "°C"},
-            "outlet_temperature": {"value": 120, "unit": "°C"},
-            "pressure_drop": {"value": 0.5, "unit": "bar"},
-            "fouling_factor": {"value": 0.0002, "unit": "m2K/W"}
-        }
+    clean: Optional[float] = Field(
+        default=None,
+        description="Value in clean condition"
     )
-    design_parameters: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Design energy efficiency parameters",
-        example={
-            "design_efficiency": {"value": 0.85, "unit": "ratio"},
-            "design_duty": {"value": 2000, "unit": "kW"},
-            "minimum_approach": {"value": 10, "unit": "°C"},
-            "maximum_pressure_drop": {"value": 0.7, "unit": "bar"}
-        }
+    design: Optional[float] = Field(
+        default=None,
+        description="Design value"
     )
-    energy_losses: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Identified energy loss sources and quantities",
-        example=[
-            {
-                "source": "heat_loss_to_ambient",
-                "value": {"amount": 50, "unit": "kW"},
-                "percentage": 2.5,
-                "mitigation": "improve_insulation"
-            },
-            {
-                "source": "fouling",
-                "value": {"amount": 100, "unit": "kW"},
-                "percentage": 5.0,
-                "mitigation": "cleaning_required"
-            }
-        ]
+    unit: Optional[InternedStr] = Field(
+        default=None,
+        description="Unit of measurement"
     )
-    monitoring_data: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Energy efficiency monitoring measurements",
-        example=[
-            {
-                "timestamp": "2024-01-15T10:00:00",
-                "parameter": "heat_transfer_coefficient",
-                "value": {"current": 750, "design": 850, "unit": "W/m2K"},
-                "efficiency_impact": {"value": -5, "unit": "percent"}
-            }
-        ]
+
+class FoulingReading(BaseModel):
+    """Single fouling monitoring measurement"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    date: Optional[datetime] = Field(
+        default=None,
+        description="Date of the measurement"
     )
-    improvement_opportunities: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Identified energy efficiency improvement opportunities",
-        example=[
-            {
-                "opportunity": "heat_recovery_optimization",
-                "potential_saving": {"value": 200, "unit": "kW"},
-                "investment_required": {"value": 50000, "unit": "USD"},
-                "payback_period": {"value": 1.5, "unit": "years"},
-                "implementation_status": "evaluation"
-            }
-        ]
+    parameter: Optional[InternedStr] = Field(
+        default=None,
+        description="Monitored parameter"
     )
-    maintenance_impact: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Impact of maintenance activities on energy efficiency",
-        example={
-            "last_cleaning": "2024-01-01",
-            "efficiency_improvement": {"value": 5, "unit": "percent"},
-            "energy_saving": {"value": 100, "unit": "kW"},
-            "next_maintenance_due": "2024-07-01"
-        }
+    value: Optional[ReferenceComparison] = Field(
+        default=None,
+        description="Current and clean values"
     )
-    economic_analysis: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Economic aspects of energy efficiency",
-        example={
-            "energy_cost": {"value": 0.1, "unit": "USD/kWh"},
-            "annual_consumption": {"value": 13140, "unit": "MWh"},
-            "annual_cost": {"value": 1314000, "unit": "USD"},
-            "potential_savings": {"value": 131400, "unit": "USD/year"}
-        }
+    fouling_factor: Optional[Quantity] = Field(
+        default=None,
+        description="Calculated fouling factor"
     )
-    benchmarking: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Energy efficiency benchmarking data",
-        example={
-            "industry_average": {"value": 3.5, "unit": "GJ/ton"},
-            "best_practice": {"value": 2.8, "unit": "GJ/ton"},
-            "current_performance": {"value": 3.2, "unit": "GJ/ton"},
-            "ranking_percentile": 65
-        }
+    increase: Optional[Quantity] = Field(
+        default=None,
+        description="Increase relative to clean condition"
     )
-    optimization_controls: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Energy efficiency control and optimization measures",
-        example=[
-            {
-                "control_type": "advanced_process_control",
-                "variables": ["flow_rate", "temperature"],
-                "objective": "minimize_energy_consumption",
-                "constraints": ["product_quality", "safety_limits"],
-                "savings_achieved": {"value": 3, "unit": "percent"}
-            }
-        ]
+
+class HeatTransferReading(BaseModel):
+    """Heat transfer coefficient compared to clean condition"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    parameter: Literal["heat_transfer_coefficient"] = Field(
+        default="heat_transfer_coefficient",
+        description="Monitored parameter"
     )
-    environmental_impact: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Environmental impact of energy consumption",
-        example={
-            "co2_emissions": {"value": 5000, "unit": "tons/year"},
-            "carbon_intensity": {"value": 0.4, "unit": "kgCO2/kWh"},
-            "reduction_target": {"value": 10, "unit": "percent"},
-            "green_energy_ratio": {"value": 0.15, "unit": "ratio"}
-        }
+    date: Optional[datetime] = Field(
+        default=None,
+        description="Date of the measurement"
     )
-    
-class Downtime(BaseModel):
-    """Model for tracking and analyzing equipment and process downtimes"""
-    id: str = Field(
-        description="Unique downtime event identifier",
-        example="DT-2024-P101-01"
+    value: Optional[ReferenceComparison] = Field(
+        default=None,
+        description="Current and clean values"
     )
-    equipment_id: str = Field(
-        description="Equipment identifier affected by downtime",
-        example="P-101"  # Pump 101
+    fouling_factor: Optional[Quantity] = Field(
+        default=None,
+        description="Calculated fouling factor"
     )
-    type: str = Field(
-        description="Type of downtime event",
-        example="planned_maintenance"  # unplanned_failure, emergency_shutdown, operational_delay
+
+class PressureDropReading(BaseModel):
+    """Pressure drop compared to clean condition"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    parameter: Literal["pressure_drop"] = Field(
+        default="pressure_drop",
+        description="Monitored parameter"
     )
-    description: Optional[str] = Field(
+    date: Optional[datetime] = Field(
         default=None,
-        description="Detailed description of downtime event",
-        example="Scheduled maintenance shutdown for pump bearing replacement and mechanical seal inspection"
+        description="Date of the measurement"
     )
-    duration: Optional[float] = Field(
+    value: Optional[ReferenceComparison] = Field(
         default=None,
-        description="Duration of downtime",
-        example=8.5  # hours
+        description="Current and clean values"
     )
-    duration_unit: Optional[str] = Field(
+    increase: Optional[Quantity] = Field(
         default=None,
-        description="Unit of duration measurement",
-        example="hours"  # days, minutes
+        description="Increase relative to clean condition"
     )
-    timing: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Timing details of the downtime event",
-        example={
-            "start_time": "2024-01-15T08:00:00",
-            "end_time": "2024-01-15T16:30:00",
-            "planned_duration": {"value": 8, "unit": "hours"},
-            "actual_duration": {"value": 8.5, "unit": "hours"},
-            "deviation": {"value": 0.5, "unit": "hours"}
-        }
+
+FoulingMonitoringEntry = tagged_union("parameter", {
+    "heat_transfer_coefficient": HeatTransferReading,
+    "pressure_drop": PressureDropReading,
+}, fallback=FoulingReading)
+
+class DepositComponent(BaseModel):
+    """Chemical component of a fouling deposit"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    compound: str = Field(
+        description="Compound name"
     )
-    root_cause: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Root cause analysis of the downtime",
-        example={
-            "primary_cause": "bearing_wear",
-            "contributing_factors": [
-                "inadequate_lubrication",
-                "misalignment",
-                "excessive_vibration"
-            ],
-            "detection_method": "vibration_monitoring",
-            "verification": "bearing_inspection_report"
-        }
+    formula: OptionalStr = Field(
+        description="Chemical formula"
     )
-    impact_assessment: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Assessment of downtime impact",
-        example={
-            "production_loss": {
-                "quantity": {"value": 100, "unit": "tons"},
-                "cost": {"value": 50000, "unit": "USD"}
-            },
-            "quality_impact": "none",
-            "customer_impact": "minimal",
-            "environmental_impact": "none",
-            "safety_impact": "none"
-        }
+    concentration: Optional[Quantity] = Field(
+        default=None,
+        description="Concentration in the deposit"
     )
-    affected_systems: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Systems affected by the downtime",
-        example=[
-            {
-                "system_id": "UNIT-100",
-                "impact_level": "direct",
-                "status": "reduced_capacity"
-            },
-            {
-                "system_id": "UNIT-200",
-                "impact_level": "indirect",
-                "status": "normal_operation"
-            }
-        ]
+    form: Optional[InternedStr] = Field(
+        default=None,
+        description="Physical form"
     )
-    mitigation_actions: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Actions taken to mitigate downtime impact",
-        example=[
-            {
-                "action": "temporary_bypass_established",
-                "timing": "2024-01-15T08:30:00",
-                "effectiveness": "partial",
-                "details": "Temporary connection to backup pump"
-            },
-            {
-                "action": "production_rate_increased",
-                "timing": "2024-01-15T16:30:00",
-                "effectiveness": "full",
-                "details": "Increased throughput to recover lost production"
-            }
-        ]
+
+class WallTemperature(BaseModel):
+    """Bulk and wall temperatures with the critical value"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    bulk: Optional[Quantity] = Field(
+        default=None,
+        description="Bulk fluid temperature"
     )
-    maintenance_details: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Details of maintenance activities during downtime",
-        example={
-            "work_order": "WO-2024-156",
-            "maintenance_type": "preventive",
-            "tasks_completed": [
-                "bearing_replacement",
-                "shaft_alignment",
-                "seal_inspection"
-            ],
-            "spare_parts_used": [
-                {"item": "bearing_set", "quantity": 1, "part_number": "BRG-123"},
-                {"item": "mechanical_seal", "quantity": 1, "part_number": "MS-456"}
-            ],
-            "personnel_involved": [
-                {"role": "mechanic", "hours": 6},
-                {"role": "supervisor", "hours": 2}
-            ]
-        }
+    wall: Optional[Quantity] = Field(
+        default=None,
+        description="Wall temperature"
     )
-    cost_analysis: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Financial impact analysis of downtime",
-        example={
-            "direct_costs": {
-                "labor": {"value": 1500, "unit": "USD"},
-                "materials": {"value": 3500, "unit": "USD"},
-                "contractors": {"value": 0, "unit": "USD"}
-            },
-            "indirect_costs": {
-                "production_loss": {"value": 50000, "unit": "USD"},
-                "startup_costs": {"value": 1000, "unit": "USD"}
-            },
-            "total_impact": {"value": 56000, "unit": "USD"}
-        }
+    critical_value: Optional[float] = Field(
+        default=None,
+        description="Critical temperature for fouling"
     )
-    lessons_learned: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Lessons learned and recommendations",
-        example=[
-            {
-                "category": "preventive_maintenance",
-                "finding": "Bearing inspection frequency inadequate",
-                "recommendation": "Increase inspection frequency to monthly",
-                "priority": "high",
-                "status": "implemented"
-            },
-            {
-                "category": "spare_parts",
-                "finding": "Critical spares not available",
-                "recommendation": "Update spare parts inventory policy",
-                "priority": "medium",
-                "status": "pending"
-            }
-        ]
+
+class FoulingConditions(BaseModel):
+    """Operating conditions contributing to fouling"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    temperature: Optional[WallTemperature] = Field(
+        default=None,
+        description="Temperatures"
     )
-    documentation: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Related documentation and records",
-        example=[
-            {
-                "type": "work_order",
-                "reference": "WO-2024-156",
-                "description": "Pump maintenance work order"
-            },
-            {
-                "type": "inspection_report",
-                "reference": "IR-2024-089",
-                "description": "Post-maintenance inspection report"
-            }
-        ]
+    flow_velocity: Optional[Quantity] = Field(
+        default=None,
+        description="Flow velocity"
+    )
+    reynolds_number: Optional[float] = Field(
+        default=None,
+        description="Reynolds number"
+    )
+    supersaturation_ratio: Optional[float] = Field(
+        default=None,
+        description="Supersaturation ratio"
     )
 
-class Bypass(BaseModel):
-    """Model for bypass lines in process equipment and systems"""
-    id: str = Field(
-        description="Unique bypass line identifier in the system",
-        example="BYP-001"
+class FoulingRate(BaseModel):
+    """Fouling rate characteristics"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    thickness_growth: Optional[Quantity] = Field(
+        default=None,
+        description="Deposit thickness growth rate"
     )
-    type: str = Field(
-        description="Type of bypass line (e.g., process, maintenance, safety, startup)",
-        example="process_bypass"
+    thermal_resistance_increase: Optional[Quantity] = Field(
+        default=None,
+        description="Thermal resistance growth rate"
     )
-    from_equipment: str = Field(
-        description="Equipment identifier where bypass line starts",
-        example="E-101-shell-inlet"
+    pressure_drop_increase: Optional[Quantity] = Field(
+        default=None,
+        description="Pressure drop growth rate"
     )
-    to_equipment: str = Field(
-        description="Equipment identifier where bypass line ends",
-        example="E-101-shell-outlet"
+    pattern: Optional[InternedStr] = Field(
+        default=None,
+        description="Growth pattern"  # asymptotic, linear, falling, accelerating
     )
-    description: Optional[str] = Field(
+
+class CleaningOption(BaseModel):
+    """Applicable cleaning method and its effectiveness"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    method: InternedStr = Field(
+        description="Cleaning method"
+    )
+    chemical: OptionalStr = Field(
+        description="Cleaning chemical"
+    )
+    technique: OptionalStr = Field(
+        description="Mechanical cleaning technique"
+    )
+    concentration: Optional[Quantity] = Field(
         default=None,
-        description="Detailed description of bypass line purpose and characteristics",
-        example="Process bypass line for shell-and-tube heat exchanger E-101 maintenance operations"
+        description="Chemical concentration"
     )
-    purpose: Optional[str] = Field(
+    temperature: Optional[Quantity] = Field(
         default=None,
-        description="Primary purpose and function of the bypass line in the process",
-        example="Allow maintenance of heat exchanger while maintaining process flow continuity"
+        description="Cleaning temperature"
     )
-    operation_conditions: Optional[List[str]] = Field(
-        default_factory=list,
-        description="List of operating conditions and limitations for bypass usage",
-        example=[
-            "Maximum allowable flow rate: 50 m3/h",
-            "Maximum operating pressure: 10 barg",
-            "Maximum temperature differential: 50°C"
-        ]
+    pressure: Optional[Quantity] = Field(
+        default=None,
+        description="Cleaning pressure"
     )
-    restrictions: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Usage restrictions and limitations for the bypass line",
-        example=[
-            "Not to be used for continuous operation exceeding 48 hours",
-            "Requires supervisor approval for activation",
-            "Not suitable for two-phase flow service"
-        ]
+    duration: Optional[Quantity] = Field(
+        default=None,
+        description="Cleaning duration"
     )
-    safety_requirements: Optional[List[str]] = Field(
-        default_factory=list,
-        description="Safety requirements and precautions for bypass operation",
-        example=[
-            "Double block and bleed isolation required before activation",
-            "Pressure test at 15 barg required after maintenance",
-            "Continuous monitoring of differential pressure required during operation"
-        ]
+    effectiveness: Optional[Quantity] = Field(
+        default=None,
+        description="Cleaning effectiveness"
     )
-    parameters: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Technical parameters and design characteristics of the bypass",
-        example=[
-            {
-                "name": "design_pressure",
-                "value": 15,
-                "unit": "barg",
-                "notes": "Maximum allowable working pressure"
-            },
-            {
-                "name": "line_size",
-                "value": 4,
-                "unit": "inches",
-                "notes": "Nominal pipe diameter"
-            }
-        ]
+
+class ChemicalCleaningOption(BaseModel):
+    """Chemical cleaning method and its effectiveness"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    method: Literal["chemical_cleaning"] = Field(
+        default="chemical_cleaning",
+        description="Cleaning method"
     )
-    valves: Optional[List[str]] = Field(
-        default_factory=list,
-        description="List of valve identifiers associated with the bypass line",
-        example=[
-            "XV-1012A - Inlet block valve",
-            "XV-1012B - Outlet block valve",
-            "PCV-1013 - Pressure control valve"
-        ]
+    chemical: OptionalStr = Field(
+        description="Cleaning chemical"
     )
-    interlocks: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Safety and operational interlocks for bypass operation",
-        example=[
-            {
-                "type": "pressure_high",
-                "setpoint": 12,
-                "unit": "barg",
-                "action": "close_bypass_valves",
-                "priority": "high"
-            },
-            {
-                "type": "flow_low",
-                "setpoint": 10,
-                "unit": "m3/h",
-                "action": "alarm_only",
-                "priority": "medium"
-            }
-        ]
+    concentration: Optional[Quantity] = Field(
+        default=None,
+        description="Chemical concentration"
     )
-    source_text: Optional[str] = Field(
+    temperature: Optional[Quantity] = Field(
         default=None,
-        description="Original text from technical documentation describing the bypass",
-        example="Bypass line BYP-001 provides alternative flow path during E-101 maintenance, equipped with double block and bleed arrangement"
+        description="Cleaning temperature"
     )
-    language: Optional[str] = Field(
+    duration: Optional[Quantity] = Field(
         default=None,
-        description="Language of the source documentation and descriptions",
-        example="EN"
+        description="Cleaning duration"
     )
-    dynamic_properties: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Additional dynamic properties and characteristics extracted from documentation",
-        example=[
-            {
-                "name": "last_inspection_date",
-                "value": "2024-01-15",
-                "inspector": "John Smith"
-            },
-            {
-                "name": "maintenance_status",
-                "value": "operational",
-                "last_updated": "2024-01-20"
-            }
-        ]
+    effectiveness: Optional[Quantity] = Field(
+        default=None,
+        description="Cleaning effectiveness"
     )
 
-class ResourcePrice(BaseModel):
-    """Model for resource pricing and cost tracking"""
-    id: str = Field(
-        description="Unique resource price record identifier",
-        example="RP-2024-CAT-001"  # Resource Price record for Catalyst
+class MechanicalCleaningOption(BaseModel):
+    """Mechanical cleaning method and its effectiveness"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    method: Literal["mechanical_cleaning"] = Field(
+        default="mechanical_cleaning",
+        description="Cleaning method"
     )
-    resource_id: str = Field(
-        description="Reference to the resource being priced",
-        example="RES-2024-CAT-001"  # Reference to specific catalyst
+    technique: OptionalStr = Field(
+        description="Mechanical cleaning technique"
     )
-    type: str = Field(
-        description="Type of pricing arrangement",
-        example="contract_price"  # spot_price, index_linked, formula_based
+    pressure: Optional[Quantity] = Field(
+        default=None,
+        description="Cleaning pressure"
     )
-    price_components: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Breakdown of price components",
-        example={
-            "base_price": {
-                "value": 1000,
-                "unit": "USD/kg",
-                "basis": "platinum_content"
-            },
-            "premium": {
-                "value": 100,
-                "unit": "USD/kg",
-                "basis": "quality_grade"
-            },
-            "transportation": {
-                "value": 50,
-                "unit": "USD/kg",
-                "basis": "delivery_terms"
-            },
-            "taxes": {
-                "value": 115,
-                "unit": "USD/kg",
-                "type": "value_added_tax"
-            }
-        }
+    effectiveness: Optional[Quantity] = Field(
+        default=None,
+        description="Cleaning effectiveness"
     )
-    validity_period: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Price validity period",
-        example={
-            "start_date": "2024-01-01T00:00:00",
-            "end_date": "2024-12-31T23:59:59",
-            "duration": {"value": 12, "unit": "months"},
-            "review_frequency": "quarterly"
-        }
+
+CleaningOptionEntry = tagged_union("method", {
+    "chemical_cleaning": ChemicalCleaningOption,
+    "mechanical_cleaning": MechanicalCleaningOption,
+}, fallback=CleaningOption)
+
+class PreventionMeasure(BaseModel):
+    """Fouling prevention or mitigation measure"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    measure: str = Field(
+        description="Prevention measure"
     )
-    price_formula: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Formula for price calculation",
-        example={
-            "base_component": "LME_platinum_price",
-            "multiplier": 1.2,
-            "adjustments": [
-                {
-                    "factor": "quality_premium",
-                    "value": 0.1,
-                    "application": "multiplicative"
-                },
-                {
-                    "factor": "volume_discount",
-                    "value": 0.05,
-                    "application": "subtractive"
-                }
-            ],
-            "currency_basis": "USD"
-        }
+    chemical: OptionalStr = Field(
+        description="Dosed chemical"
     )
-    volume_tiers: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Volume-based pricing tiers",
-        example=[
-            {
-                "tier": 1,
-                "volume_range": {"min": 0, "max": 1000, "unit": "kg"},
-                "price": {"value": 1000, "unit": "USD/kg"},
-                "discount": {"value": 0, "unit": "percent"}
-            },
-            {
-                "tier": 2,
-                "volume_range": {"min": 1001, "max": 5000, "unit": "kg"},
-                "price": {"value": 950, "unit": "USD/kg"},
-                "discount": {"value": 5, "unit": "percent"}
-            }
-        ]
+    dosage: Optional[Quantity] = Field(
+        default=None,
+        description="Chemical dosage"
     )
-    price_adjustments: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Conditions for price adjustments",
-        example=[
-            {
-                "trigger": "market_index_change",
-                "threshold": {"value": 5, "unit": "percent"},
-                "adjustment_mechanism": "proportional",
-                "notice_period": {"value": 30, "unit": "days"}
-            },
-            {
-                "trigger": "exchange_rate_fluctuation",
-                "threshold": {"value": 3, "unit": "percent"},
-                "adjustment_mechanism": "monthly_average",
-                "currency_pair": "USD/EUR"
-            }
-        ]
+    minimum: Optional[Quantity] = Field(
+        default=None,
+        description="Minimum controlled value"
     )
-    payment_terms: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Payment and billing terms",
-        example={
-            "payment_deadline": {"value": 30, "unit": "days"},
-            "early_payment_discount": {"value": 2, "unit": "percent"},
-            "late_payment_penalty": {"value": 1.5, "unit": "percent_monthly"},
-            "billing_frequency": "monthly",
-            "payment_method": "bank_transfer"
-        }
+    target: Optional[Quantity] = Field(
+        default=None,
+        description="Target controlled value"
     )
-    market_references: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Market reference prices and indices",
-        example=[
-            {
-                "index": "platinum_spot_price",
-                "source": "LME",
-                "frequency": "daily",
-                "correlation": {"value": 0.85, "unit": "ratio"}
-            },
-            {
-                "index": "chemical_price_index",
-                "source": "IHS_Markit",
-                "frequency": "monthly",
-                "weight": {"value": 0.3, "unit": "ratio"}
-            }
-        ]
+    effectiveness: Optional[InternedStr] = Field(
+        default=None,
+        description="Effectiveness of the measure"
     )
-    historical_prices: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Historical price data",
-        example=[
-            {
-                "date": "2023-12-01",
-                "price": {"value": 980, "unit": "USD/kg"},
-                "volume": {"value": 1000, "unit": "kg"},
-                "market_conditions": "normal"
-            },
-            {
-                "date": "2023-11-01",
-                "price": {"value": 950, "unit": "USD/kg"},
-                "volume": {"value": 1200, "unit": "kg"},
-                "market_conditions": "oversupply"
-            }
-        ]
+
+class CleaningRecord(BaseModel):
+    """Record of a performed cleaning operation"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    date: Optional[datetime] = Field(
+        default=None,
+        description="Cleaning date"
     )
-    price_forecast: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Price forecasts and projections",
-        example={
-            "short_term": {
-                "horizon": {"value": 3, "unit": "months"},
-                "expected_price": {"value": 1050, "unit": "USD/kg"},
-                "confidence_interval": {"min": 1000, "max": 1100, "unit": "USD/kg"}
-            },
-            "long_term": {
-                "horizon": {"value": 12, "unit": "months"},
-                "trend": "increasing",
-                "annual_growth": {"value": 3, "unit": "percent"}
-            }
-        }
+    method: Optional[InternedStr] = Field(
+        default=None,
+        description="Cleaning method"
     )
-    risk_assessment: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Price risk assessment",
-        example={
-            "volatility": {"value": 15, "unit": "percent_annual"},
-            "key_risk_factors": [
-                "raw_material_prices",
-                "market_demand",
-                "supply_chain_disruptions"
-            ],
-            "hedging_strategy": "fixed_price_contracts",
-            "contingency_plans": ["alternative_suppliers", "inventory_management"]
-        }
+    effectiveness: Optional[Quantity] = Field(
+        default=None,
+        description="Achieved effectiveness"
+    )
+    cost: Optional[Quantity] = Field(
+        default=None,
+        description="Cleaning cost"
+    )
+    downtime: Optional[Quantity] = Field(
+        default=None,
+        description="Resulting downtime"
     )
 
-class Resource(BaseModel):
-    """Model for process resources and utilities management"""
+class Fouling(BaseModel):
+    """Model for tracking and analyzing fouling in process equipment"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Unique resource identifier",
-        example="RES-2024-CAT-001"  # Resource: Catalyst batch 001
-    )
-    name: str = Field(
-        description="Resource name or designation",
-        example="Platinum-Rhenium Reforming Catalyst"
+        description="Unique fouling case identifier"
     )
-    category: str = Field(
-        description="Resource category or type",
-        example="process_catalyst"  # utility, chemical, consumable
+    type: Literal["crystallization_fouling", "particulate_fouling", "chemical_reaction_fouling", "biological_fouling"] = Field(
+        description="Type of fouling mechanism"
     )
-    description: Optional[str] = Field(
+    location: Optional[str] = Field(
         default=None,
-        description="Detailed description of the resource",
-        example="Bi-metallic reforming catalyst containing 0.3% Pt and 0.3% Re on alumina support"
+        description="Specific location of fouling in equipment"
     )
-    specifications: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Technical specifications and properties",
-        example={
-            "composition": {
-                "platinum": {"value": 0.3, "unit": "wt%"},
-                "rhenium": {"value": 0.3, "unit": "wt%"},
-                "support": "gamma_alumina"
-            },
-            "physical_properties": {
-                "particle_size": {"value": 1.6, "unit": "mm"},
-                "surface_area": {"value": 200, "unit": "m2/g"},
-                "bulk_density": {"value": 0.7, "unit": "g/cm3"}
-            },
-            "performance_properties": {
-                "activity": {"minimum": 95, "unit": "percent"},
-                "selectivity": {"minimum": 90, "unit": "percent"},
-                "stability": {"minimum": 12, "unit": "months"}
-            }
-        }
+    equipment_id: str = Field(
+        description="Identifier of affected equipment"
     )
-    quality_requirements: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Quality requirements and acceptance criteria",
-        example={
-            "chemical_purity": {
-                "chlorides": {"max": 100, "unit": "ppm"},
-                "sulfur": {"max": 50, "unit": "ppm"},
-                "moisture": {"max": 0.5, "unit": "wt%"}
-            },
-            "physical_quality": {
-                "crush_strength": {"min": 2.0, "unit": "kg"},
-                "attrition_loss": {"max": 1.0, "unit": "wt%"},
-                "uniformity": {"within": 10, "unit": "percent"}
-            }
-        }
+    description: Optional[str] = Field(
+        default=None,
+        description="Detailed description of fouling issue"
     )
-    consumption_data: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Consumption patterns and rates",
-        example={
-            "normal_rate": {"value": 0.1, "unit": "kg/day"},
-            "peak_rate": {"value": 0.15, "unit": "kg/day"},
-            "annual_consumption": {"value": 36.5, "unit": "kg/year"},
-            "lifetime": {"value": 2, "unit": "years"},
-            "replacement_criteria": [
-                "activity_below_80_percent",
-                "selectivity_below_85_percent"
-            ]
-        }
+    severity_assessment: Optional[FoulingSeverity] = Field(
+        default=None,
+        description="Assessment of fouling severity and impact"
     )
-    inventory_management: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Inventory control parameters",
-        example={
-            "minimum_stock": {"value": 1000, "unit": "kg"},
-            "maximum_stock": {"value": 5000, "unit": "kg"},
-            "reorder_point": {"value": 2000, "unit": "kg"},
-            "order_quantity": {"value": 3000, "unit": "kg"},
-            "lead_time": {"value": 90, "unit": "days"}
-        }
+    monitoring_data: Optional[List[FoulingMonitoringEntry]] = Field(
+        default=None,
+        description="Fouling monitoring measurements and observations"
     )
-    storage_requirements: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Storage conditions and requirements",
-        example={
-            "temperature": {"range": {"min": 10, "max": 30}, "unit": "°C"},
-            "humidity": {"max": 60, "unit": "percent"},
-            "container_type": "sealed_steel_drums",
-            "stack_height": {"max": 2, "unit": "drums"},
-            "segregation": "away_from_oxidizers",
-            "special_conditions": [
-                "keep_dry",
-                "protect_from_direct_sunlight"
-            ]
-        }
+    composition: Optional[List[DepositComponent]] = Field(
+        default=None,
+        description="Chemical composition of fouling deposits"
     )
-    handling_requirements: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Handling and safety requirements",
-        example={
-            "ppe_required": [
-                "dust_mask",
-                "chemical_resistant_gloves",
-                "safety_glasses"
-            ],
-            "special_equipment": [
-                "drum_handler",
-                "vacuum_loader"
-            ],
-            "procedures": [
-                "avoid_dust_generation",
-                "use_inert_gas_purge"
-            ],
-            "safety_precautions": [
-                "ground_equipment",
-                "monitor_oxygen_levels"
-            ]
-        }
+    operating_conditions: Optional[FoulingConditions] = Field(
+        default=None,
+        description="Operating conditions contributing to fouling"
     )
-    suppliers: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Approved suppliers and vendor information",
-        example=[
-            {
-                "name": "Catalyst Technologies Inc.",
-                "qualification_status": "approved",
-                "contract_number": "CT-2024-001",
-                "lead_time": {"value": 90, "unit": "days"},
-                "minimum_order": {"value": 1000, "unit": "kg"},
-                "quality_certification": ["ISO_9001", "ISO_14001"]
-            }
-        ]
+    rate: Optional[FoulingRate] = Field(
+        default=None,
+        description="Fouling rate characteristics"
     )
-    cost_information: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Cost and economic information",
-        example={
-            "unit_cost": {"value": 1000, "unit": "USD/kg"},
-            "delivery_cost": {"value": 50, "unit": "USD/kg"},
-            "disposal_cost": {"value": 200, "unit": "USD/kg"},
-            "total_lifecycle_cost": {"value": 1250, "unit": "USD/kg"},
-            "cost_drivers": [
-                "precious_metal_content",
-                "transportation_requirements"
-            ]
-        }
+    cleaning_methods: Optional[List[CleaningOptionEntry]] = Field(
+        default=None,
+        description="Applicable cleaning methods and their effectiveness"
     )
-    documentation: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Required documentation and certificates",
-        example=[
-            {
-                "type": "material_safety_data_sheet",
-                "number": "MSDS-2024-001",
-                "revision": "Rev.2",
-                "validity": "2024-2026"
-            },
-            {
-                "type": "certificate_of_analysis",
-                "frequency": "per_batch",
-                "retention_period": {"value": 5, "unit": "years"}
-            }
-        ]
+    prevention_measures: Optional[List[PreventionMeasure]] = Field(
+        default=None,
+        description="Fouling prevention and mitigation measures"
     )
-
-class ResourceConsumption(BaseModel):
-    """Model for tracking and analyzing resource consumption patterns"""
-    id: str = Field(
-        description="Unique resource consumption record identifier",
-        example="RC-2024-CAT-001"  # Resource Consumption record for Catalyst
+    economic_impact: Optional[Dict[str, Quantity]] = Field(
+        default=None,
+        description="Economic impact assessment"
     )
-    resource_id: str = Field(
-        description="Reference to the resource being consumed",
-        example="RES-2024-CAT-001"  # Reference to specific catalyst
+    cleaning_history: Optional[List[CleaningRecord]] = Field(
+        default=None,
+        description="History of cleaning operations"
     )
-    equipment_id: Optional[str] = Field(
+    recommendations: Optional[List[Recommendation]] = Field(
         default=None,
-        description="Equipment or unit consuming the resource",
-        example="R-101"  # Reactor 101
+        description="Recommendations for fouling management"
     )
-    period: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Time period for consumption measurement",
-        example={
-            "start_date": "2024-01-01T00:00:00",
-            "end_date": "2024-01-31T23:59:59",
-            "duration": {"value": 31, "unit": "days"},
-            "type": "monthly_consumption"
-        }
+
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> 'Fouling':
+        """Parse and validate a raw JSON document in one pydantic-core pass.
+
+        For a JSON array of records use FoulingList.validate_json(raw).
+        """
+        return cls.model_validate_json(raw)
+
+class WaterParameter(Limits):
+    """Cooling water parameter with its normal value and limits"""
+    parameter: str = Field(
+        description="Parameter name"
     )
-    consumption_data: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Actual consumption measurements",
-        example={
-            "quantity": {"value": 100, "unit": "kg"},
-            "rate": {"value": 3.23, "unit": "kg/day"},
-            "cumulative": {"value": 1200, "unit": "kg"},
-            "specific_consumption": {"value": 0.5, "unit": "kg/ton_product"}
-        }
+    monitoring: Optional[InternedStr] = Field(
+        default=None,
+        description="Monitoring mode"
     )
-    operating_conditions: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Process conditions during consumption",
-        example={
-            "temperature": {"average": 500, "unit": "°C"},
-            "pressure": {"average": 15, "unit": "barg"},
-            "throughput": {"average": 100, "unit": "tons/day"},
-            "severity": {"value": 0.85, "unit": "ratio"}
-        }
+
+class TreatmentChemical(BaseModel):
+    """Water treatment chemical and its dosing"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    name: str = Field(
+        description="Chemical name"
     )
-    performance_metrics: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Performance indicators related to consumption",
-        example={
-            "efficiency": {"value": 95, "unit": "percent"},
-            "utilization": {"value": 90, "unit": "percent"},
-            "yield_impact": {"value": 0.98, "unit": "ratio"},
-            "quality_impact": {"value": "within_specs"}
-        }
+    dosage: Optional[float] = Field(
+        default=None,
+        description="Dosage"
     )
-    cost_analysis: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Economic analysis of consumption",
-        example={
-            "unit_cost": {"value": 1000, "unit": "USD/kg"},
-            "total_cost": {"value": 100000, "unit": "USD"},
-            "cost_per_unit_production": {"value": 5, "unit": "USD/ton_product"},
-            "budget_variance": {"value": -2000, "unit": "USD"}
-        }
+    unit: Optional[InternedStr] = Field(
+        default=None,
+        description="Dosage unit"
     )
-    inventory_impact: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Impact on inventory levels",
-        example={
-            "opening_stock": {"value": 5000, "unit": "kg"},
-            "closing_stock": {"value": 4900, "unit": "kg"},
-            "minimum_level": {"value": 1000, "unit": "kg"},
-            "reorder_point": {"value": 2000, "unit": "kg"},
-            "stock_status": "adequate"
-        }
+    control: Optional[InternedStr] = Field(
+        default=None,
+        description="Dosing control mode"
     )
-    consumption_pattern: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Analysis of consumption patterns",
-        example={
-            "trend": "stable",  # increasing, decreasing, cyclical
-            "variability": {"value": 5, "unit": "percent"},
-            "seasonality": "none",
-            "peak_factors": ["high_throughput", "severe_conditions"],
-            "pattern_type": "continuous"  # batch, intermittent
-        }
+    frequency: Optional[InternedStr] = Field(
+        default=None,
+        description="Dosing frequency"
     )
-    quality_parameters: Optional[List[Dict[str, Any]]] = Field(
+
+class WaterTreatment(BaseModel):
+    """Water treatment system specification"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    chemicals: List[TreatmentChemical] = Field(
         default_factory=list,
-        description="Quality aspects affecting consumption",
-        example=[
-            {
-                "parameter": "activity",
-                "initial": {"value": 100, "unit": "percent"},
-                "final": {"value": 95, "unit": "percent"},
-                "decline_rate": {"value": 0.16, "unit": "percent/day"}
-            },
-            {
-                "parameter": "selectivity",
-                "initial": {"value": 98, "unit": "percent"},
-                "final": {"value": 96, "unit": "percent"},
-                "impact": "minimal"
-            }
-        ]
+        description="Dosed chemicals"
     )
-    optimization_opportunities: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Identified consumption optimization opportunities",
-        example=[
-            {
-                "opportunity": "operating_temperature_optimization",
-                "potential_saving": {"value": 5, "unit": "percent"},
-                "implementation_cost": {"value": 10000, "unit": "USD"},
-                "payback_period": {"value": 6, "unit": "months"}
-            }
-        ]
+    monitoring_parameters: StrListField = Field(
+        description="Monitored water parameters"
     )
-    environmental_impact: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Environmental aspects of consumption",
-        example={
-            "waste_generation": {"value": 10, "unit": "kg"},
-            "emissions": {"value": 50, "unit": "kg_CO2e"},
-            "resource_efficiency": {"value": 0.95, "unit": "ratio"},
-            "environmental_cost": {"value": 1000, "unit": "USD"}
-        }
+
+class FanDetails(BaseModel):
+    """Cooling tower fan details"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    quantity: Optional[int] = Field(
+        default=None,
+        description="Number of fans"
     )
-    forecasting: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Consumption forecasts and predictions",
-        example={
-            "next_period": {"value": 105, "unit": "kg"},
-            "annual_forecast": {"value": 1200, "unit": "kg"},
-            "replacement_date": "2024-12-31",
-            "confidence_level": {"value": 90, "unit": "percent"}
-        }
+    power: Optional[Quantity] = Field(
+        default=None,
+        description="Fan power"
     )
-    documentation: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Related consumption documentation",
-        example=[
-            {
-                "type": "consumption_report",
-                "number": "CR-2024-001",
-                "date": "2024-01-31",
-                "retention_period": {"value": 5, "unit": "years"}
-            }
-        ]
+    control: Optional[InternedStr] = Field(
+        default=None,
+        description="Fan control mode"
     )
 
-class WasteComponent(BaseModel):
-    """Model for waste components"""
-    name: str = Field(
-        description="Component name",
-        example="Sulfur compounds"
+class CoolingTower(BaseModel):
+    """Cooling tower specification and operating parameters"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Cooling tower type"
     )
-    concentration: Union[float, Dict[str, float]] = Field(
-        default=0.0,  # Добавили только default для валидации
-        description="Component concentration or range",
-        example={"min": 0.1, "max": 0.5}
+    capacity: Optional[Quantity] = Field(
+        default=None,
+        description="Circulation capacity"
     )
-    unit: str = Field(
-        description="Concentration unit",
-        example="wt%"
+    design_parameters: Optional[Dict[str, Quantity]] = Field(
+        default_factory=dict,
+        description="Design parameters (wet bulb, approach, range)"
     )
-    description: Optional[str] = Field(
+    fan_details: Optional[FanDetails] = Field(
         default=None,
-        description="Component description",
-        example="Sulfur compounds from catalyst deactivation"
+        description="Fan details"
     )
 
-class WasteNorm(BaseModel):
-    """Model for waste generation norms"""
-    value: float = Field(
-        default=0.0,  # Добавили default
-        description="Norm value",
-        example=2.5
+class PumpSpec(BaseModel):
+    """Cooling water circulation pump"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    id: str = Field(
+        description="Pump tag"
     )
-    unit: str = Field(
-        description="Norm unit",
-        example="kg/ton product"
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Pump type"
     )
-    basis: str = Field(
-        description="Norm basis",
-        example="per ton of product"
+    service: Optional[InternedStr] = Field(
+        default=None,
+        description="Pump service"
     )
-    type: str = Field(
-        default="project",
-        description="Norm type",
-        example="project"
+    capacity: Optional[Quantity] = Field(
+        default=None,
+        description="Capacity"
     )
-    date: Optional[datetime] = Field(
+    head: Optional[Quantity] = Field(
         default=None,
-        description="Norm effective date",
-        example="2024-01-01T00:00:00"
+        description="Head"
     )
-    notes: Optional[str] = Field(
+    power: Optional[Quantity] = Field(
+        default=None,
+        description="Motor power"
+    )
+    configuration: Optional[Literal["duty", "standby"]] = Field(
         default=None,
-        description="Additional notes",
-        example="Based on design capacity"
+        description="Duty or standby"
     )
 
-class ProcessWaste(BaseModel):
-    """Model for process waste streams and waste management"""
+class CooledExchanger(BaseModel):
+    """Heat exchanger served by the cooling system"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Unique waste stream identifier",
-        example="WS-2024-UNIT100-01"  # Waste Stream 01 from Unit 100
+        description="Heat exchanger tag"
     )
-    name: Optional[str] = Field(
+    service: Optional[InternedStr] = Field(
         default=None,
-        description="Descriptive name of waste stream",
-        example="Spent Catalyst Waste"
+        description="Service"
     )
-    type: str = Field(
-        description="Type of process waste",
-        example="spent_catalyst"  # chemical_waste, biological_waste, hazardous_waste
+    duty: Optional[Quantity] = Field(
+        default=None,
+        description="Heat duty"
     )
-    source: Optional[Dict[str, Any]] = Field(
+    design_temperatures: Optional[Dict[str, Quantity]] = Field(
         default_factory=dict,
-        description="Origin and source of waste",
-        example={
-            "equipment_id": "R-101",
-            "process_stage": "catalytic_reaction",
-            "generation_point": "reactor_bed",
-            "generation_mechanism": "catalyst_deactivation"
-        }
+        description="Cooling water design temperatures"
     )
-    classification: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Waste classification and categorization",
-        example={
-            "hazard_class": "hazardous",
-            "regulatory_category": "spent_industrial_catalyst",
-            "disposal_category": "special_waste",
-            "environmental_risk": "moderate",
-            "handling_requirements": "specialized_contractor"
-        }
+
+class CoolingLimits(BaseModel):
+    """Cooling system operational limits"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    max_system_pressure: Optional[Quantity] = Field(
+        default=None,
+        description="Maximum system pressure"
     )
-    composition: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Chemical composition of waste",
-        example=[
-            {
-                "component": "platinum",
-                "concentration": {"value": 0.3, "unit": "wt%"},
-                "form": "metal_on_support",
-                "recoverable": True
-            },
-            {
-                "component": "coke",
-                "concentration": {"value": 15, "unit": "wt%"},
-                "form": "carbonaceous_deposit",
-                "recoverable": False
-            }
-        ]
+    min_flow_rate: Optional[Quantity] = Field(
+        default=None,
+        description="Minimum flow rate"
     )
-    physical_properties: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Physical properties of waste",
-        example={
-            "phase": "solid",
-            "particle_size": {"value": 2, "unit": "mm"},
-            "bulk_density": {"value": 800, "unit": "kg/m3"},
-            "moisture_content": {"value": 2, "unit": "wt%"}
-        }
+    max_return_temperature: Optional[Quantity] = Field(
+        default=None,
+        description="Maximum return temperature"
     )
-    generation_rate: Optional[Dict[str, Any]] = Field(
+    water_quality_limits: Optional[Dict[str, Limits]] = Field(
         default_factory=dict,
-        description="Waste generation characteristics",
-        example={
-            "normal_rate": {"value": 1000, "unit": "kg/month"},
-            "peak_rate": {"value": 5000, "unit": "kg/month"},
-            "variability": "batch",
-            "frequency": "quarterly",
-            "factors_affecting_rate": [
-                "catalyst_cycle_length",
-                "operating_severity"
-            ]
-        }
+        description="Water quality limits per parameter"
     )
-    handling_requirements: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Waste handling and storage requirements",
-        example={
-            "ppe_requirements": [
-                "chemical_resistant_gloves",
-                "dust_mask",
-                "safety_glasses"
-            ],
-            "storage_conditions": {
-                "container_type": "sealed_drums",
-                "temperature": {"max": 30, "unit": "°C"},
-                "humidity": {"max": 60, "unit": "percent"},
-                "segregation": "away_from_oxidizers"
-            },
-            "special_precautions": [
-                "avoid_moisture_contact",
-                "prevent_dust_formation"
-            ]
-        }
+
+class QualityParameter(BaseModel):
+    """Monitored water quality parameter"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    parameter: str = Field(
+        description="Parameter name"
     )
-    disposal_method: str = Field(
-        description="Primary method of waste disposal or treatment",
-        example="metal_recovery"  # incineration, landfill, biological_treatment
+    normal_range: Optional[Limits] = Field(
+        default=None,
+        description="Normal range"
     )
-    treatment_process: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Waste treatment process details",
-        example={
-            "method": "hydrometallurgical_recovery",
-            "steps": [
-                "acid_leaching",
-                "metal_precipitation",
-                "filtration"
-            ],
-            "efficiency": {"value": 95, "unit": "percent"},
-            "residuals": [
-                {
-                    "type": "spent_acid",
-                    "quantity": {"value": 2, "unit": "m3/ton"},
-                    "disposal": "neutralization"
-                }
-            ]
-        }
+    target: Optional[Limits] = Field(
+        default=None,
+        description="Target value or limit"
     )
-    regulatory_compliance: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Regulatory requirements and compliance",
-        example={
-            "permits_required": ["hazardous_waste_transport", "treatment_facility"],
-            "reporting_requirements": ["quarterly_generation_report", "annual_summary"],
-            "applicable_regulations": ["RCRA", "local_environmental_code"],
-            "monitoring_requirements": ["composition_analysis", "leachate_testing"]
-        }
+    monitoring_frequency: Optional[InternedStr] = Field(
+        default=None,
+        description="Monitoring frequency"
     )
-    environmental_impact: Optional[Dict[str, Any]] = Field(
+    control_method: OptionalStr = Field(
+        description="Control method"
+    )
+
+class MakeupWater(BaseModel):
+    """Makeup water specification"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    source: OptionalStr = Field(
+        description="Makeup water source"
+    )
+    average_rate: Optional[Quantity] = Field(
+        default=None,
+        description="Average makeup rate"
+    )
+    quality_requirements: Optional[Dict[str, Limits]] = Field(
         default_factory=dict,
-        description="Environmental impact assessment",
-        example={
-            "air_emissions": {"significance": "low", "components": ["dust"]},
-            "water_impact": {"significance": "medium", "concerns": ["heavy_metals"]},
-            "soil_impact": {"significance": "low", "mitigation": "contained_storage"},
-            "resource_depletion": {"significance": "high", "recovery_potential": "yes"}
-        }
+        description="Quality requirements per parameter"
+    )
+    control: Optional[InternedStr] = Field(
+        default=None,
+        description="Makeup control mode"
+    )
+
+class Blowdown(BaseModel):
+    """Blowdown specification and control"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    control_basis: Optional[InternedStr] = Field(
+        default=None,
+        description="Controlled parameter"
+    )
+    setpoint: Optional[Quantity] = Field(
+        default=None,
+        description="Blowdown setpoint"
+    )
+    average_rate: Optional[Quantity] = Field(
+        default=None,
+        description="Average blowdown rate"
+    )
+    disposal: OptionalStr = Field(
+        description="Blowdown disposal route"
+    )
+
+class CoolingEfficiency(BaseModel):
+    """Cooling system energy efficiency parameters"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    specific_power: Optional[Quantity] = Field(
+        default=None,
+        description="Specific power consumption"
     )
-    cost_analysis: Optional[Dict[str, Any]] = Field(
+    efficiency_indicators: Optional[Dict[str, Limits]] = Field(
         default_factory=dict,
-        description="Economic aspects of waste management",
-        example={
-            "handling_cost": {"value": 200, "unit": "USD/ton"},
-            "treatment_cost": {"value": 1500, "unit": "USD/ton"},
-            "transportation_cost": {"value": 300, "unit": "USD/ton"},
-            "recovery_value": {"value": 5000, "unit": "USD/ton"},
-            "net_cost": {"value": -3000, "unit": "USD/ton"}
-        }
+        description="Efficiency indicators with targets"
     )
-    tracking_records: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Waste generation and disposal tracking",
-        example=[
-            {
-                "date": "2024-01-15",
-                "quantity": {"value": 1000, "unit": "kg"},
-                "disposal_contractor": "Metal Recovery Services Inc.",
-                "manifest_number": "MAN-2024-001",
-                "disposal_location": "Recovery Facility Alpha"
-            }
-        ]
+
+class MaintenanceRequirement(BaseModel):
+    """Recurring maintenance requirement"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    item: str = Field(
+        description="Maintained item"
+    )
+    frequency: Optional[InternedStr] = Field(
+        default=None,
+        description="Frequency"
+    )
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Type of work"
+    )
+    procedure: OptionalStr = Field(
+        description="Procedure reference"
+    )
+    parameters: StrListField = Field(
+        description="Monitored parameters"
     )
 
-class ProductSpecification(BaseModel):
-    """Model for product specifications and quality requirements"""
+class CoolingSystem(BaseModel):
+    """Model for industrial cooling water systems and cooling circuits"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Unique product specification identifier",
-        example="SPEC-2024-REF-001"  # Specification for Reformate Product
+        description="Unique cooling system identifier"
     )
-    name: str = Field(
-        description="Product name or designation",
-        example="High Octane Reformate"
+    type: Literal["closed_loop", "open_loop", "once_through", "hybrid"] = Field(
+        description="Type of cooling system configuration"
     )
-    grade: Optional[str] = Field(
+    description: Optional[str] = Field(
         default=None,
-        description="Product grade or quality level",
-        example="Premium Grade"
+        description="Detailed description of cooling system and its purpose"
     )
-    description: Optional[str] = Field(
+    equipment_served: Optional[List[str]] = Field(
         default=None,
-        description="Detailed product description",
-        example="High octane reformate for premium gasoline blending, produced by catalytic reforming"
+        description="List of equipment IDs served by this cooling system"
     )
-    physical_properties: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Physical properties and specifications",
-        example={
-            "density": {
-                "target": {"value": 0.775, "unit": "g/cm3"},
-                "range": {"min": 0.770, "max": 0.780, "unit": "g/cm3"},
-                "test_method": "ASTM D4052",
-                "frequency": "per_batch"
-            },
-            "vapor_pressure": {
-                "target": {"value": 7.5, "unit": "psi"},
-                "range": {"min": 7.0, "max": 8.0, "unit": "psi"},
-                "test_method": "ASTM D323",
-                "frequency": "daily"
-            },
-            "distillation": {
-                "IBP": {"target": 40, "range": {"min": 35, "max": 45}, "unit": "°C"},
-                "T50": {"target": 105, "range": {"min": 100, "max": 110}, "unit": "°C"},
-                "FBP": {"target": 180, "range": {"min": 175, "max": 185}, "unit": "°C"},
-                "test_method": "ASTM D86"
-            }
-        }
+    water_parameters: Optional[List[WaterParameter]] = Field(
+        default=None,
+        description="Critical cooling water parameters and specifications"
     )
-    chemical_properties: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Chemical properties and composition specifications",
-        example={
-            "octane_number": {
-                "RON": {
-                    "target": 98,
-                    "minimum": 97,
-                    "test_method": "ASTM D2699"
-                },
-                "MON": {
-                    "target": 87,
-                    "minimum": 86,
-                    "test_method": "ASTM D2700"
-                }
-            },
-            "aromatics": {
-                "total": {"max": 65, "unit": "vol%"},
-                "benzene": {"max": 1.0, "unit": "vol%"},
-                "test_method": "ASTM D5580"
-            },
-            "sulfur": {
-                "max": 1.0,
-                "unit": "ppm",
-                "test_method": "ASTM D5453"
-            }
-        }
+    water_treatment: Optional[WaterTreatment] = Field(
+        default=None,
+        description="Water treatment system specifications and requirements"
     )
-    quality_requirements: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Critical quality parameters and requirements",
-        example=[
-            {
-                "parameter": "color",
-                "specification": "clear_and_bright",
-                "test_method": "visual",
-                "frequency": "per_batch"
-            },
-            {
-                "parameter": "copper_corrosion",
-                "specification": "class_1",
-                "test_method": "ASTM D130",
-                "frequency": "daily"
-            }
-        ]
+    cooling_tower: Optional[CoolingTower] = Field(
+        default=None,
+        description="Cooling tower specifications and operating parameters"
     )
-    contaminant_limits: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Maximum allowable contaminant levels",
-        example={
-            "water": {"max": 50, "unit": "ppm", "test_method": "ASTM D6304"},
-            "chlorides": {"max": 1, "unit": "ppm", "test_method": "ASTM D4929"},
-            "metals": {
-                "lead": {"max": 0.5, "unit": "ppm"},
-                "iron": {"max": 0.1, "unit": "ppm"}
-            }
-        }
+    pumps: Optional[List[PumpSpec]] = Field(
+        default=None,
+        description="Cooling water circulation pump specifications"
     )
-    storage_requirements: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Product storage specifications",
-        example={
-            "temperature": {"max": 35, "unit": "°C"},
-            "pressure": {"max": 1.5, "unit": "barg"},
-            "inert_blanket": "nitrogen",
-            "tank_materials": ["carbon_steel", "epoxy_lined"],
-            "special_precautions": [
-                "prevent_water_ingress",
-                "minimize_light_exposure"
-            ]
-        }
+    heat_exchangers: Optional[List[CooledExchanger]] = Field(
+        default=None,
+        description="Heat exchangers in the cooling system"
     )
-    handling_requirements: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Product handling requirements",
-        example={
-            "loading_temperature": {"range": {"min": 15, "max": 30}, "unit": "°C"},
-            "loading_rate": {"max": 1000, "unit": "m3/h"},
-            "ppe_requirements": ["chemical_resistant_gloves", "safety_glasses"],
-            "special_procedures": ["static_electricity_prevention", "vapor_recovery"]
-        }
+    operational_limits: Optional[CoolingLimits] = Field(
+        default=None,
+        description="System operational limits and constraints"
     )
-    testing_requirements: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Quality testing requirements and procedures",
-        example=[
-            {
-                "test": "octane_number",
-                "frequency": "per_batch",
-                "method": "ASTM D2699",
-                "sampling_point": "product_tank",
-                "sample_size": {"value": 1, "unit": "liter"}
-            },
-            {
-                "test": "composition_analysis",
-                "frequency": "daily",
-                "method": "GC_analysis",
-                "critical_components": ["benzene", "toluene", "xylenes"]
-            }
-        ]
+    quality_parameters: Optional[List[QualityParameter]] = Field(
+        default=None,
+        description="Water quality monitoring parameters"
     )
-    certification_requirements: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Product certification requirements",
-        example={
-            "required_certificates": ["certificate_of_analysis", "safety_data_sheet"],
-            "approvals_needed": ["quality_manager", "laboratory_manager"],
-            "retention_samples": {"duration": 90, "unit": "days"},
-            "documentation_retention": {"duration": 5, "unit": "years"}
-        }
+    makeup_parameters: Optional[MakeupWater] = Field(
+        default=None,
+        description="Makeup water specifications and requirements"
     )
-    regulatory_compliance: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Regulatory requirements and standards",
-        example={
-            "specifications": ["ASTM D4814", "EN 228"],
-            "environmental_regulations": ["EPA_MSAT", "EU_Fuels_Directive"],
-            "reporting_requirements": ["quarterly_quality_report", "annual_compliance_report"]
-        }
+    blowdown_parameters: Optional[Blowdown] = Field(
+        default=None,
+        description="Blowdown specifications and control parameters"
+    )
+    energy_efficiency: Optional[CoolingEfficiency] = Field(
+        default=None,
+        description="Energy efficiency parameters and monitoring"
+    )
+    maintenance_requirements: Optional[List[MaintenanceRequirement]] = Field(
+        default=None,
+        description="Maintenance requirements and schedules"
     )
 
-class ProcessDescription(BaseModel):
-    """Model for detailed process unit and operation descriptions"""
+class MaintenanceTask(BaseModel):
+    """Model for individual maintenance tasks"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Unique process description identifier",
-        example="PD-2024-UNIT100"  # Process Description for Unit 100
-    )
-    name: str = Field(
-        description="Name of the process unit or operation",
-        example="Catalytic Reforming Unit"
+        validation_alias=AliasChoices("id", "task_id"),
+        description="Unique task identifier"
     )
     description: Optional[str] = Field(
         default=None,
-        description="General description of the process",
-        example="Continuous catalytic reforming process for converting low-octane naphtha to high-octane reformate"
+        description="Task description"
     )
-    process_stages: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Sequential stages of the process",
-        example=[
-            {
-                "stage_id": "STAGE-001",
-                "name": "feed_pretreatment",
-                "description": "Hydrodesulfurization of naphtha feed",
-                "equipment": ["R-101", "E-101", "V-101"],
-                "key_parameters": [
-                    {
-                        "name": "reactor_temperature",
-                        "normal": {"value": 320, "unit": "°C"},
-                        "range": {"min": 300, "max": 340, "unit": "°C"}
-                    }
-                ],
-                "critical_controls": ["TIC-101", "PIC-101"]
-            },
-            {
-                "stage_id": "STAGE-002",
-                "name": "reforming_reaction",
-                "description": "Catalytic reforming in multiple fixed-bed reactors",
-                "equipment": ["R-201", "R-202", "R-203"],
-                "key_parameters": [
-                    {
-                        "name": "reactor_pressure",
-                        "normal": {"value": 15, "unit": "barg"},
-                        "range": {"min": 14, "max": 16, "unit": "barg"}
-                    }
-                ]
-            }
-        ]
+    duration: Optional[float] = Field(
+        default=None,
+        description="Task duration"
     )
-    process_chemistry: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Chemical reactions and transformations",
-        example={
-            "main_reactions": [
-                {
-                    "type": "dehydrogenation",
-                    "description": "Conversion of naphthenes to aromatics",
-                    "example": "Cyclohexane → Benzene + 3H2",
-                    "heat_of_reaction": {"value": 75, "unit": "kJ/mol"}
-                },
-                {
-                    "type": "isomerization",
-                    "description": "Rearrangement of paraffins",
-                    "example": "n-Hexane → iso-Hexane",
-                    "heat_of_reaction": {"value": -5, "unit": "kJ/mol"}
-                }
-            ],
-            "catalysts": [
-                {
-                    "name": "platinum_alumina",
-                    "composition": "0.3% Pt on Al2O3",
-                    "form": "spherical_pellets",
-                    "regeneration_cycle": {"value": 12, "unit": "months"}
-                }
-            ]
-        }
+    duration_unit: Optional[str] = Field(
+        default=None,
+        description="Duration unit"
     )
-    operating_conditions: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Normal operating conditions and ranges",
-        example={
-            "temperature_regime": {
-                "inlet": {"value": 495, "unit": "°C"},
-                "outlet": {"value": 515, "unit": "°C"},
-                "control_range": {"min": 490, "max": 520, "unit": "°C"}
-            },
-            "pressure_regime": {
-                "inlet": {"value": 15, "unit": "barg"},
-                "outlet": {"value": 14, "unit": "barg"},
-                "control_range": {"min": 13, "max": 16, "unit": "barg"}
-            },
-            "flow_regime": {
-                "feed_rate": {"value": 100, "unit": "m3/h"},
-                "recycle_ratio": {"value": 3, "unit": "mol/mol"}
-            }
-        }
+    required_personnel: Optional[List[str]] = Field(
+        default=None,
+        description="Required personnel"
     )
-    process_controls: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Critical process control systems",
-        example=[
-            {
-                "parameter": "reactor_temperature",
-                "control_strategy": "cascade",
-                "primary_controller": "TIC-201",
-                "secondary_controller": "FIC-201",
-                "critical_limits": {
-                    "high_high": {"value": 530, "unit": "°C"},
-                    "low_low": {"value": 480, "unit": "°C"}
-                }
-            }
-        ]
+    required_skills: Optional[List[str]] = Field(
+        default=None,
+        description="Required skills"
     )
-    safety_considerations: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Process safety considerations",
-        example=[
-            {
-                "hazard": "high_temperature",
-                "risk": "thermal_expansion",
-                "mitigation": "temperature_monitoring_and_control",
-                "critical_limits": {"max": {"value": 530, "unit": "°C"}},
-                "protective_systems": ["high_temperature_shutdown"]
-            },
-            {
-                "hazard": "hydrogen_handling",
-                "risk": "leakage_and_fire",
-                "mitigation": "leak_detection_and_prevention",
-                "protective_systems": ["gas_detection", "fire_suppression"]
-            }
-        ]
+    tools_equipment: Optional[List[str]] = Field(
+        default=None,
+        description="Required tools and equipment"
     )
-    quality_requirements: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Product quality specifications",
-        example={
-            "reformate": {
-                "octane_number": {"min": 95},
-                "benzene_content": {"max": {"value": 1, "unit": "vol%"}},
-                "sulfur": {"max": {"value": 0.5, "unit": "ppm"}}
-            }
-        }
+    tools_required: Optional[List[str]] = Field(
+        default=None,
+        description="Required tools"
     )
-    utilities_required: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Required process utilities",
-        example=[
-            {
-                "utility": "steam",
-                "pressure": {"value": 40, "unit": "barg"},
-                "consumption": {"value": 10, "unit": "tons/h"},
-                "purpose": "reboiler_heating"
-            },
-            {
-                "utility": "cooling_water",
-                "temperature": {"value": 30, "unit": "°C"},
-                "consumption": {"value": 1000, "unit": "m3/h"},
-                "purpose": "product_cooling"
-            }
-        ]
+    safety_requirements: Optional[List[str]] = Field(
+        default=None,
+        description="Safety requirements"
     )
-    environmental_aspects: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Environmental considerations and impacts",
-        example={
-            "emissions": [
-                {
-                    "type": "CO2",
-                    "source": "fired_heater",
-                    "quantity": {"value": 10, "unit": "tons/day"}
-                }
-            ],
-            "waste_streams": [
-                {
-                    "type": "spent_catalyst",
-                    "quantity": {"value": 50, "unit": "tons/year"},
-                    "disposal_method": "regeneration"
-                }
-            ]
-        }
+    steps: Optional[List[str]] = Field(
+        default=None,
+        description="Task steps"
+    )
+    acceptance_criteria: Optional[List[str]] = Field(
+        default=None,
+        description="Acceptance criteria"
     )
 
-class MaterialBalance(BaseModel):
-    """Model for process material balance calculations and tracking"""
-    id: str = Field(
-        description="Unique material balance identifier",
-        example="MB-2024-UNIT100"  # Material Balance for Unit 100 in 2024
+    @model_validator(mode="before")
+    @classmethod
+    def _split_duration_quantity(cls, data: Any) -> Any:
+        """Accept duration given as {"value", "unit"}, as in Maintenance.tasks."""
+        return split_quantity(data, "duration")
+
+class ScheduleFlexibility(BaseModel):
+    """Allowed deviation from the scheduled date"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    early: OptionalStr = Field(
+        description="Allowed advance"
     )
-    stage_id: str = Field(
-        description="Process stage or unit operation identifier",
-        example="UNIT-100"  # Process Unit 100
+    late: OptionalStr = Field(
+        description="Allowed delay"
     )
-    period: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Time period for material balance",
-        example={
-            "start_time": "2024-01-01T00:00:00",
-            "end_time": "2024-01-31T23:59:59",
-            "duration": {"value": 31, "unit": "days"},
-            "type": "monthly_balance"
-        }
+
+class MaintenanceSchedule(BaseModel):
+    """Model for maintenance scheduling"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    frequency: Optional[float] = Field(
+        default=None,
+        description="Maintenance frequency"
     )
-    input_streams: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Input process streams and their quantities",
-        example=[
-            {
-                "stream_id": "F-101",
-                "name": "fresh_feed",
-                "type": "raw_material",
-                "quantity": {"value": 1000, "unit": "tons"},
-                "composition": [
-                    {"component": "n-hexane", "value": 85, "unit": "wt%"},
-                    {"component": "n-heptane", "value": 15, "unit": "wt%"}
-                ],
-                "conditions": {
-                    "temperature": {"value": 25, "unit": "°C"},
-                    "pressure": {"value": 1, "unit": "barg"}
-                }
-            },
-            {
-                "stream_id": "F-102",
-                "name": "recycle_stream",
-                "type": "recycle",
-                "quantity": {"value": 500, "unit": "tons"},
-                "composition": [
-                    {"component": "n-hexane", "value": 90, "unit": "wt%"},
-                    {"component": "n-heptane", "value": 10, "unit": "wt%"}
-                ]
-            }
-        ]
+    frequency_unit: Optional[str] = Field(
+        default=None,
+        description="Frequency unit"
     )
-    output_streams: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Output process streams and their quantities",
-        example=[
-            {
-                "stream_id": "F-201",
-                "name": "main_product",
-                "type": "product",
-                "quantity": {"value": 1200, "unit": "tons"},
-                "composition": [
-                    {"component": "n-hexane", "value": 95, "unit": "wt%"},
-                    {"component": "n-heptane", "value": 5, "unit": "wt%"}
-                ]
-            },
-            {
-                "stream_id": "F-202",
-                "name": "waste_stream",
-                "type": "waste",
-                "quantity": {"value": 300, "unit": "tons"},
-                "composition": [
-                    {"component": "n-hexane", "value": 60, "unit": "wt%"},
-                    {"component": "n-heptane", "value": 40, "unit": "wt%"}
-                ]
-            }
-        ]
+    last_performed: Optional[NaiveDatetime] = Field(
+        default=None,
+        description="Last maintenance date"
     )
-    process_losses: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Process losses and their categorization",
-        example=[
-            {
-                "type": "evaporation_loss",
-                "quantity": {"value": 10, "unit": "tons"},
-                "location": "storage_tanks",
-                "prevention_measures": ["floating_roof", "vapor_recovery"]
-            },
-            {
-                "type": "purge_loss",
-                "quantity": {"value": 5, "unit": "tons"},
-                "location": "reactor_purge",
-                "reason": "inert_removal"
-            }
-        ]
+    next_due: Optional[NaiveDatetime] = Field(
+        default=None,
+        description="Next maintenance due date"
     )
-    conversion_yields: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Process conversion and yield calculations",
-        example={
-            "overall_conversion": {"value": 95, "unit": "percent"},
-            "product_yield": {"value": 92, "unit": "percent"},
-            "selectivity": {"value": 98, "unit": "percent"},
-            "mass_efficiency": {"value": 0.95, "unit": "ratio"}
-        }
+    flexibility: Optional[ScheduleFlexibility] = Field(
+        default=None,
+        description="Schedule flexibility"
     )
-    component_balances: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Individual component material balances",
-        example=[
-            {
-                "component": "n-hexane",
-                "input": {"value": 850, "unit": "tons"},
-                "output": {"value": 840, "unit": "tons"},
-                "accumulated": {"value": 5, "unit": "tons"},
-                "lost": {"value": 5, "unit": "tons"},
-                "closure": {"value": 99.5, "unit": "percent"}
-            }
-        ]
+
+class MaintenancePlan(BaseModel):
+    """Planned window and recurrence of a maintenance activity"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    planned_start: Optional[datetime] = Field(
+        default=None,
+        description="Planned start"
     )
-    balance_checks: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Material balance validation and checks",
-        example={
-            "total_mass_closure": {"value": 99.8, "unit": "percent"},
-            "component_closure": {"value": 99.5, "unit": "percent"},
-            "deviation_threshold": {"value": 2, "unit": "percent"},
-            "reconciliation_status": "within_limits"
-        }
+    planned_end: Optional[datetime] = Field(
+        default=None,
+        description="Planned end"
     )
-    inventory_changes: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Process inventory changes during balance period",
-        example=[
-            {
-                "location": "feed_tank",
-                "material": "raw_feed",
-                "initial": {"value": 100, "unit": "tons"},
-                "final": {"value": 95, "unit": "tons"},
-                "change": {"value": -5, "unit": "tons"}
-            }
-        ]
+    duration: Optional[Quantity] = Field(
+        default=None,
+        description="Planned duration"
     )
-    key_performance_indicators: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Material balance related performance indicators",
-        example={
-            "raw_material_efficiency": {"value": 0.95, "unit": "ratio"},
-            "product_recovery": {"value": 98, "unit": "percent"},
-            "waste_generation_rate": {"value": 0.25, "unit": "tons/ton_product"},
-            "recycle_ratio": {"value": 0.5, "unit": "ratio"}
-        }
+    frequency: Optional[Quantity] = Field(
+        default=None,
+        description="Recurrence interval"
     )
-    reconciliation_data: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Data reconciliation information",
-        example={
-            "method": "least_squares",
-            "constraints": ["total_mass", "component_mass"],
-            "adjustments": [
-                {"stream": "F-101", "adjustment": {"value": 2, "unit": "percent"}},
-                {"stream": "F-201", "adjustment": {"value": -1, "unit": "percent"}}
-            ],
-            "confidence_level": {"value": 95, "unit": "percent"}
-        }
+    last_performed: Optional[datetime] = Field(
+        default=None,
+        description="Last performed date"
+    )
+    next_due: Optional[datetime] = Field(
+        default=None,
+        description="Next due date"
     )
 
-class ProcessControl(BaseModel):
-    """Model for process control systems and control strategies"""
-    id: str = Field(
-        description="Unique process control identifier",
-        example="PC-2024-UNIT100-01"  # Process Control for Unit 100, loop 01
+class PersonnelRequirement(BaseModel):
+    """Personnel needed for maintenance"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    role: str = Field(
+        description="Role"
     )
-    parameter: str = Field(
-        description="Process parameter being controlled",
-        example="reactor_temperature"  # pressure, flow, level, composition
+    quantity: Optional[int] = Field(
+        default=None,
+        description="Number of persons"
     )
-    method: str = Field(
-        description="Control method or strategy",
-        example="cascade_control"  # PID, feedforward, ratio, override
+    hours: Optional[float] = Field(
+        default=None,
+        description="Hours per person"
     )
-    description: Optional[str] = Field(
+
+class ResourceItem(BaseModel):
+    """Equipment or material needed for maintenance"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    item: str = Field(
+        description="Item name"
+    )
+    quantity: Optional[Union[Quantity, float]] = Field(
         default=None,
-        description="Detailed description of control strategy",
-        example="Cascade control of reactor temperature using jacket temperature as secondary loop"
+        description="Required quantity, as a count or with a unit"
     )
-    control_objective: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Control objectives and requirements",
-        example={
-            "primary_objective": "maintain_reaction_temperature",
-            "setpoint": {"value": 120, "unit": "°C"},
-            "allowable_deviation": {"value": 2, "unit": "°C"},
-            "response_time": {"value": 30, "unit": "seconds"},
-            "stability_criteria": "minimum_oscillation"
-        }
+    duration: Optional[Quantity] = Field(
+        default=None,
+        description="Required duration of use"
     )
-    control_configuration: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Control loop configuration details",
-        example={
-            "control_type": "cascade",
-            "primary_loop": {
-                "controlled_variable": "reactor_temperature",
-                "manipulated_variable": "jacket_temperature_setpoint",
-                "controller": "TIC-101",
-                "parameters": {
-                    "kp": 2.5,
-                    "ti": 300,
-                    "td": 0
-                }
-            },
-            "secondary_loop": {
-                "controlled_variable": "jacket_temperature",
-                "manipulated_variable": "cooling_water_flow",
-                "controller": "TIC-102",
-                "parameters": {
-                    "kp": 1.0,
-                    "ti": 60,
-                    "td": 0
-                }
-            }
-        }
+    specification: OptionalStr = Field(
+        description="Item specification"
     )
-    instruments: Optional[List[Dict[str, Any]]] = Field(
+
+class MaintenanceResources(BaseModel):
+    """Resources required for maintenance"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    personnel: List[PersonnelRequirement] = Field(
         default_factory=list,
-        description="Control instruments and devices",
-        example=[
-            {
-                "tag": "TT-101",
-                "type": "temperature_transmitter",
-                "location": "reactor_outlet",
-                "range": {"min": 0, "max": 200, "unit": "°C"},
-                "accuracy": {"value": 0.1, "unit": "°C"},
-                "response_time": {"value": 5, "unit": "seconds"}
-            },
-            {
-                "tag": "TCV-101",
-                "type": "control_valve",
-                "service": "cooling_water_control",
-                "size": {"value": 4, "unit": "inches"},
-                "characteristic": "equal_percentage",
-                "rangeability": 50
-            }
-        ]
-    )
-    operating_ranges: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Operating ranges and limits",
-        example={
-            "process_variable": {
-                "min": {"value": 100, "unit": "°C"},
-                "max": {"value": 140, "unit": "°C"},
-                "normal": {"value": 120, "unit": "°C"}
-            },
-            "manipulated_variable": {
-                "min": {"value": 0, "unit": "percent"},
-                "max": {"value": 100, "unit": "percent"},
-                "normal": {"value": 45, "unit": "percent"}
-            }
-        }
+        description="Personnel"
     )
-    alarms: Optional[List[Dict[str, Any]]] = Field(
+    equipment: List[ResourceItem] = Field(
         default_factory=list,
-        description="Associated alarms and alerts",
-        example=[
-            {
-                "tag": "TAH-101",
-                "type": "high_temperature_alarm",
-                "setpoint": {"value": 130, "unit": "°C"},
-                "priority": "high",
-                "action": "operator_notification"
-            },
-            {
-                "tag": "TAL-101",
-                "type": "low_temperature_alarm",
-                "setpoint": {"value": 110, "unit": "°C"},
-                "priority": "medium",
-                "action": "operator_notification"
-            }
-        ]
+        description="Equipment"
     )
-    interlocks: Optional[List[Dict[str, Any]]] = Field(
+    materials: List[ResourceItem] = Field(
         default_factory=list,
-        description="Safety interlocks and trips",
-        example=[
-            {
-                "tag": "TAHH-101",
-                "type": "high_high_temperature_trip",
-                "setpoint": {"value": 140, "unit": "°C"},
-                "action": "reactor_shutdown",
-                "voting_logic": "2oo3",
-                "response_time": {"value": 2, "unit": "seconds"}
-            }
-        ]
+        description="Materials"
+    )
+
+class DocumentReference(BaseModel):
+    """Reference to a procedure or work instruction"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    document_id: str = Field(
+        description="Document identifier"
+    )
+    title: OptionalStr = Field(
+        description="Document title"
+    )
+    revision: OptionalStr = Field(
+        description="Document revision"
+    )
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Document type"
+    )
+    relevance: OptionalStr = Field(
+        description="Why the document is referenced"
+    )
+
+class SafetyPrecaution(BaseModel):
+    """Safety requirement for maintenance work"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    requirement: str = Field(
+        description="Requirement"
+    )
+    permit_type: Optional[InternedStr] = Field(
+        default=None,
+        description="Required work permit"
+    )
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Type of precaution"
+    )
+    ppe: StrListField = Field(
+        description="Personal protective equipment"
+    )
+    monitoring: StrListField = Field(
+        description="Monitored hazards"
     )
-    performance_metrics: Optional[Dict[str, Any]] = Field(
+    points: StrListField = Field(
+        description="Isolation points"
+    )
+    verification: OptionalStr = Field(
+        description="Verification method"
+    )
+
+class QualityCheck(BaseModel):
+    """Quality control check and acceptance criteria"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    check: str = Field(
+        description="Checked property"
+    )
+    method: OptionalStr = Field(
+        description="Test method"
+    )
+    acceptance_criteria: Optional[Limits] = Field(
+        default=None,
+        description="Acceptance criteria"
+    )
+    sampling: OptionalStr = Field(
+        description="Sampling extent"
+    )
+    hold_time: Optional[Quantity] = Field(
+        default=None,
+        description="Test hold time"
+    )
+
+class CostTracking(BaseModel):
+    """Maintenance budget and actual costs"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    budget: Optional[Quantity] = Field(
+        default=None,
+        description="Budget"
+    )
+    actual_costs: Optional[Dict[str, Quantity]] = Field(
         default_factory=dict,
-        description="Control performance indicators",
-        example={
-            "setpoint_tracking": {
-                "rise_time": {"value": 45, "unit": "seconds"},
-                "overshoot": {"value": 5, "unit": "percent"},
-                "settling_time": {"value": 180, "unit": "seconds"}
-            },
-            "disturbance_rejection": {
-                "maximum_deviation": {"value": 3, "unit": "°C"},
-                "recovery_time": {"value": 120, "unit": "seconds"}
-            },
-            "control_quality": {
-                "variance": {"value": 0.5, "unit": "°C"},
-                "integral_absolute_error": 125
-            }
+        description="Actual costs per cost element"
+    )
+    variance: Optional[Quantity] = Field(
+        default=None,
+        description="Budget variance"
+    )
+
+class MaintenanceRecord(BaseModel):
+    """Historical maintenance record"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    date: Optional[datetime] = Field(
+        default=None,
+        description="Date performed"
+    )
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Maintenance type"
+    )
+    findings: OptionalStr = Field(
+        description="Findings"
+    )
+    work_performed: OptionalStr = Field(
+        description="Work performed"
+    )
+    cost: Optional[Quantity] = Field(
+        default=None,
+        description="Cost"
+    )
+
+class Maintenance(BaseModel):
+    """Model for maintenance activities and maintenance management"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    id: str = Field(
+        description="Unique maintenance activity identifier"
+    )
+    type: Literal["preventive_maintenance", "corrective_maintenance", "predictive_maintenance", "condition_based"] = Field(
+        description="Type of maintenance activity"
+    )
+    category: Literal["mechanical", "electrical", "instrumentation", "civil", "inspection"] = Field(
+        description="Category of maintenance work"
+    )
+    equipment_id: str = Field(
+        description="Equipment identifier for maintenance target"
+    )
+    description: Optional[str] = Field(
+        default=None,
+        description="Detailed description of maintenance activity"
+    )
+    schedule: Optional[MaintenancePlan] = Field(
+        default=None,
+        description="Maintenance scheduling information"
+    )
+    tasks: Optional[List[MaintenanceTask]] = Field(
+        default=None,
+        description="Detailed maintenance tasks to be performed"
+    )
+    resources: Optional[MaintenanceResources] = Field(
+        default=None,
+        description="Resources required for maintenance"
+    )
+    procedures: Optional[List[DocumentReference]] = Field(
+        default=None,
+        description="Reference procedures and work instructions"
+    )
+    safety_requirements: Optional[List[SafetyPrecaution]] = Field(
+        default=None,
+        description="Safety requirements and precautions"
+    )
+    quality_checks: Optional[List[QualityCheck]] = Field(
+        default=None,
+        description="Quality control and acceptance criteria"
+    )
+    cost_tracking: Optional[CostTracking] = Field(
+        default=None,
+        description="Cost tracking and budget information"
+    )
+    history: Optional[List[MaintenanceRecord]] = Field(
+        default=None,
+        description="Historical maintenance records"
+    )
+    performance_metrics: PerformanceMetrics = Field(
+        description="Maintenance performance indicators"
+    )
+
+class NamedParameter(BaseModel):
+    """Named technical parameter with its value"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    name: str = Field(
+        description="Parameter name"
+    )
+    value: Optional[float] = Field(
+        default=None,
+        description="Parameter value"
+    )
+    unit: Optional[InternedStr] = Field(
+        default=None,
+        description="Unit of measurement"
+    )
+    notes: OptionalStr = Field(
+        description="Notes"
+    )
+
+class CleaningParameter(NamedParameter):
+    """Critical process parameter of a cleaning method"""
+    critical_max: Optional[float] = Field(
+        default=None,
+        description="Critical maximum value"
+    )
+    minimum: Optional[float] = Field(
+        default=None,
+        description="Minimum value"
+    )
+    acceptable_range: Optional[Limits] = Field(
+        default=None,
+        description="Acceptable range"
+    )
+    monitoring_frequency: OptionalStr = Field(
+        description="Monitoring frequency"
+    )
+
+class CleaningChemical(BaseModel):
+    """Chemical agent used for cleaning"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    name: str = Field(
+        description="Chemical name"
+    )
+    concentration: OptionalStr = Field(
+        description="Concentration"
+    )
+    quantity: OptionalStr = Field(
+        description="Required quantity"
+    )
+    supplier: OptionalStr = Field(
+        description="Supplier"
+    )
+    safety_class: OptionalStr = Field(
+        description="Safety class"
+    )
+    purpose: OptionalStr = Field(
+        description="Purpose of the chemical"
+    )
+
+class CleaningMethod(BaseModel):
+    """Model for industrial cleaning methods and procedures"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    type: Literal["chemical_cleaning", "mechanical_cleaning", "hydraulic_cleaning", "pneumatic_cleaning", "steam_cleaning", "ultrasonic_cleaning", "solvent_cleaning", "combined_cleaning"] = Field(
+        description="Type of cleaning method used in industrial equipment"
+    )
+    duration: float = Field(  # Только добавили тип float
+        description="Expected duration of the cleaning procedure",  # hours
+        default=0.0  # Добавили default для валидации
+    )
+    description: str = Field(
+        description="Detailed description of the cleaning method and its application"
+    )
+    chemicals: Optional[List[CleaningChemical]] = Field(
+        default=None,
+        description="Chemical agents used in the cleaning process with their specifications"
+    )
+    parameters: Optional[List[CleaningParameter]] = Field(
+        default_factory=list,
+        description="Critical process parameters for the cleaning method"
+    )
+    duration_unit: InternedStr = Field(
+        description="Unit of measurement for cleaning duration"  # Other examples: days, minutes
+    )
+    restrictions: StrTupleField = Field(
+        description="Operating restrictions and limitations during cleaning"
+    )
+    safety_measures: StrTupleField = Field(
+        description="Required safety measures and precautions during cleaning"
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def _split_duration_quantity(cls, data: Any) -> Any:
+        """Accept duration given as {"value", "unit"}."""
+        return split_quantity(data, "duration")
+
+class CleaningStep(BaseModel):
+    """Step of a cleaning procedure"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    step: Optional[int] = Field(
+        default=None,
+        description="Step number"
+    )
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Cleaning method of the step"
+    )
+    description: OptionalStr = Field(
+        description="Step description"
+    )
+    duration: OptionalStr = Field(
+        description="Step duration"
+    )
+    temperature: OptionalStr = Field(
+        description="Step temperature"
+    )
+
+class MaterialRequirement(BaseModel):
+    """Material or chemical required for cleaning"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    name: str = Field(
+        description="Material name"
+    )
+    concentration: OptionalStr = Field(
+        description="Concentration"
+    )
+    quantity: Optional[float] = Field(
+        default=None,
+        description="Required quantity"
+    )
+    unit: Optional[InternedStr] = Field(
+        default=None,
+        description="Quantity unit"
+    )
+    specification: OptionalStr = Field(
+        description="Material specification"
+    )
+
+class WasteHandling(BaseModel):
+    """Waste handling and disposal requirements"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    waste_type: OptionalStr = Field(
+        description="Waste type"
+    )
+    estimated_volume: Optional[float] = Field(
+        default=None,
+        description="Estimated waste volume"
+    )
+    unit: Optional[InternedStr] = Field(
+        default=None,
+        description="Volume unit"
+    )
+    disposal_method: OptionalStr = Field(
+        description="Disposal method"
+    )
+    neutralization_requirements: OptionalStr = Field(
+        description="Neutralization requirements"
+    )
+    special_handling: OptionalStr = Field(
+        description="Special handling"
+    )
+
+class CleaningLogEntry(BaseModel):
+    """Historical cleaning record"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    date: Optional[datetime] = Field(
+        default=None,
+        description="Cleaning date (ISO 8601)"
+    )
+    type: OptionalStr = Field(
+        description="Cleaning type"
+    )
+    effectiveness: OptionalStr = Field(
+        description="Assessed effectiveness"
+    )
+    contractor: OptionalStr = Field(
+        description="Cleaning contractor"
+    )
+    cost: Optional[float] = Field(
+        default=None,
+        description="Cleaning cost"
+    )
+    findings: OptionalStr = Field(
+        description="Findings"
+    )
+
+class CleaningProcedure(BaseModel):
+    """Model for detailed industrial cleaning procedures and protocols"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    id: str = Field(
+        description="Unique identifier for the cleaning procedure"
+    )
+    equipment_id: str = Field(
+        description="Identifier of equipment requiring cleaning"  # Heat Exchanger 101
+    )
+    description: Optional[str] = Field(
+        default=None,
+        description="Comprehensive description of the cleaning procedure"
+    )
+    cleaning_methods: Optional[List[CleaningStep]] = Field(
+        default_factory=list,
+        description="Sequence of cleaning methods to be applied"
+    )
+    trigger_conditions: StrTupleField = Field(
+        description="Conditions that trigger the need for cleaning"
+    )
+    acceptance_criteria: StrTupleField = Field(
+        description="Criteria for successful cleaning completion"
+    )
+    operational_limits: Optional[Dict[InternedStr, Limits]] = Field(
+        default_factory=dict,
+        description="Operating limitations during cleaning process"
+    )
+    preparation_steps: StrTupleField = Field(
+        description="Required preparation steps before cleaning"
+    )
+    required_materials: Optional[List[MaterialRequirement]] = Field(
+        default_factory=list,
+        description="Materials and chemicals required for cleaning"
+    )
+    safety_requirements: StrTupleField = Field(
+        description="Safety requirements and precautions"
+    )
+    environmental_measures: StrTupleField = Field(
+        description="Environmental protection measures"
+    )
+    waste_handling: Optional[WasteHandling] = Field(
+        default=None,
+        description="Waste handling and disposal requirements"
+    )
+    cleaning_history: Optional[List[CleaningLogEntry]] = Field(
+        default_factory=list,
+        description="Historical cleaning records"
+    )
+    effectiveness_metrics: Optional[Dict[str, str]] = Field(
+        default=None,
+        description="Metrics for measuring cleaning effectiveness"
+    )
+
+class CostDriver(BaseModel):
+    """Major cost contributing factor"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    driver: str = Field(
+        description="Cost driver"
+    )
+    contribution: Optional[Quantity] = Field(
+        default=None,
+        description="Share of total cost"
+    )
+    trend: Optional[InternedStr] = Field(
+        default=None,
+        description="Cost trend"
+    )
+    control_measures: StrTupleField = Field(
+        description="Cost control measures"
+    )
+
+class CostSavingOpportunity(BaseModel):
+    """Identified cost optimization opportunity"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    opportunity: str = Field(
+        description="Opportunity"
+    )
+    potential_savings: Optional[Quantity] = Field(
+        default=None,
+        validation_alias=AliasChoices("potential_savings", "potential_saving"),
+        description="Potential savings"
+    )
+    implementation_cost: Optional[Quantity] = Field(
+        default=None,
+        description="Implementation cost"
+    )
+    payback_period: Optional[Quantity] = Field(
+        default=None,
+        description="Payback period"
+    )
+    status: Optional[InternedStr] = Field(
+        default=None,
+        description="Evaluation status"
+    )
+
+class FinancialRisk(BaseModel):
+    """Financial risk and its mitigation"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    risk: str = Field(
+        description="Risk"
+    )
+    impact: Optional[InternedStr] = Field(
+        default=None,
+        description="Impact level"
+    )
+    probability: Optional[InternedStr] = Field(
+        default=None,
+        description="Probability level"
+    )
+    mitigation_measures: StrTupleField = Field(
+        description="Mitigation measures"
+    )
+    contingency: Optional[Quantity] = Field(
+        default=None,
+        description="Contingency allowance"
+    )
+
+class BudgetTracking(BaseModel):
+    """Budget versus actual cost"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    period: OptionalStr = Field(
+        description="Tracking period"
+    )
+    budget: Optional[Quantity] = Field(
+        default=None,
+        description="Budget"
+    )
+    actual: Optional[Quantity] = Field(
+        default=None,
+        description="Actual cost"
+    )
+    variance: Optional[Quantity] = Field(
+        default=None,
+        description="Variance"
+    )
+    variance_explanation: OptionalStr = Field(
+        description="Explanation of the variance"
+    )
+
+class CostBenchmark(BaseModel):
+    """Cost metric compared to industry data"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    metric: str = Field(
+        description="Benchmarked metric"
+    )
+    actual: Optional[Quantity] = Field(
+        default=None,
+        description="Actual value"
+    )
+    industry_average: Optional[Quantity] = Field(
+        default=None,
+        description="Industry average"
+    )
+    percentile: Optional[float] = Field(
+        default=None,
+        description="Percentile rank"
+    )
+    comments: OptionalStr = Field(
+        description="Comments"
+    )
+
+@columnar
+class Economics(BaseModel):
+    """Model for economic metrics and financial analysis of process equipment and operations"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    id: str = Field(
+        description="Unique economic metric identifier"
+    )
+    equipment_id: Optional[str] = Field(
+        default=None,
+        description="Equipment identifier for specific equipment analysis"  # Heat Exchanger 101
+    )
+    metric_type: Literal["capital_cost", "operating_cost", "maintenance_cost", "energy_cost", "total_cost_of_ownership"] = Field(
+        description="Type of economic metric being tracked"
+    )
+    period: Optional[str] = Field(
+        default=None,
+        description="Time period for economic analysis"  # annual, monthly, quarterly
+    )
+    capital_costs: QuantityMap = Field(
+        description="Capital investment and fixed costs"
+    )
+    operating_costs: Optional[Dict[InternedStr, Union[Quantity, Dict[InternedStr, Quantity]]]] = Field(
+        default_factory=dict,
+        description="Operating and variable costs"
+    )
+    maintenance_costs: QuantityMap = Field(
+        description="Maintenance and repair costs"
+    )
+    performance_metrics: PerformanceMetrics = Field(
+        description="Economic performance indicators"
+    )
+    lifecycle_analysis: QuantityMap = Field(
+        description="Lifecycle cost analysis"
+    )
+    efficiency_metrics: QuantityMap = Field(
+        description="Economic efficiency indicators"
+    )
+    cost_drivers: Optional[List[CostDriver]] = Field(
+        default_factory=list,
+        description="Major cost contributing factors"
+    )
+    optimization_opportunities: Optional[List[CostSavingOpportunity]] = Field(
+        default_factory=list,
+        description="Identified cost optimization opportunities"
+    )
+    financial_risks: Optional[List[FinancialRisk]] = Field(
+        default_factory=list,
+        description="Identified financial risks and mitigation measures"
+    )
+    budget_tracking: Optional[BudgetTracking] = Field(
+        default=None,
+        description="Budget versus actual cost tracking"
+    )
+    benchmarking: Optional[List[CostBenchmark]] = Field(
+        default_factory=list,
+        description="Cost benchmarking against industry standards"
+    )
+
+class EnergyAmount(BaseModel):
+    """Amount of energy with its unit"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    amount: Optional[float] = Field(
+        default=None,
+        description="Energy amount"
+    )
+    unit: Optional[InternedStr] = Field(
+        default=None,
+        description="Unit of measurement"
+    )
+
+class EnergyLoss(BaseModel):
+    """Energy loss source and quantity"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    source: str = Field(
+        description="Loss source"
+    )
+    value: Optional[EnergyAmount] = Field(
+        default=None,
+        description="Lost energy"
+    )
+    percentage: Optional[float] = Field(
+        default=None,
+        description="Share of total consumption"
+    )
+    mitigation: OptionalStr = Field(
+        description="Mitigation"
+    )
+
+class EfficiencyReading(BaseModel):
+    """Energy efficiency monitoring measurement"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    timestamp: Optional[datetime] = Field(
+        default=None,
+        description="Measurement time (ISO 8601)"
+    )
+    parameter: Optional[InternedStr] = Field(
+        default=None,
+        description="Monitored parameter"
+    )
+    value: Optional[ReferenceComparison] = Field(
+        default=None,
+        description="Current and design values"
+    )
+    efficiency_impact: Optional[Quantity] = Field(
+        default=None,
+        description="Impact on efficiency"
+    )
+
+class EnergySavingOpportunity(BaseModel):
+    """Identified energy efficiency improvement"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    opportunity: str = Field(
+        description="Opportunity"
+    )
+    potential_saving: Optional[Quantity] = Field(
+        default=None,
+        description="Potential energy saving"
+    )
+    investment_required: Optional[Quantity] = Field(
+        default=None,
+        description="Required investment"
+    )
+    payback_period: Optional[Quantity] = Field(
+        default=None,
+        description="Payback period"
+    )
+    implementation_status: Optional[InternedStr] = Field(
+        default=None,
+        description="Implementation status"
+    )
+
+class MaintenanceImpact(BaseModel):
+    """Impact of maintenance on energy efficiency"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    last_cleaning: Optional[datetime] = Field(
+        default=None,
+        description="Last cleaning date (ISO 8601)"
+    )
+    efficiency_improvement: Optional[Quantity] = Field(
+        default=None,
+        description="Efficiency improvement"
+    )
+    energy_saving: Optional[Quantity] = Field(
+        default=None,
+        description="Energy saving"
+    )
+    next_maintenance_due: Optional[datetime] = Field(
+        default=None,
+        description="Next maintenance due date (ISO 8601)"
+    )
+
+class EnergyBenchmark(BaseModel):
+    """Energy intensity compared to industry data"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    industry_average: Optional[Quantity] = Field(
+        default=None,
+        description="Industry average"
+    )
+    best_practice: Optional[Quantity] = Field(
+        default=None,
+        description="Best practice"
+    )
+    current_performance: Optional[Quantity] = Field(
+        default=None,
+        description="Current performance"
+    )
+    ranking_percentile: Optional[float] = Field(
+        default=None,
+        description="Percentile rank"
+    )
+
+class OptimizationControl(BaseModel):
+    """Energy optimization control measure"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    control_type: str = Field(
+        description="Control type"
+    )
+    variables: StrTupleField = Field(
+        description="Manipulated variables"
+    )
+    objective: OptionalStr = Field(
+        description="Control objective"
+    )
+    constraints: StrTupleField = Field(
+        description="Constraints"
+    )
+    savings_achieved: Optional[Quantity] = Field(
+        default=None,
+        description="Achieved savings"
+    )
+
+@columnar
+class EnergyEfficiency(BaseModel):
+    """Model for tracking and analyzing energy efficiency in process equipment and systems"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    id: str = Field(
+        description="Unique energy efficiency record identifier"
+    )
+    equipment_id: Optional[str] = Field(
+        default=None,
+        description="Equipment identifier for specific equipment analysis"  # Heat Exchanger 101
+    )
+    energy_type: str = Field(
+        description="Type of energy consumption being monitored"  # electrical, mechanical, combined
+    )
+    consumption: Optional[float] = Field(
+        default=None,
+        description="Measured energy consumption value"  # kW or appropriate unit
+    )
+    consumption_unit: Optional[InternedStr] = Field(
+        default=None,
+        description="Unit of energy consumption measurement"  # kWh, MJ, GJ
+    )
+    performance_metrics: PerformanceMetrics = Field(
+        description="Key energy performance indicators"
+    )
+    operating_parameters: QuantityMap = Field(
+        description="Current operating parameters affecting energy efficiency"
+    )
+    design_parameters: QuantityMap = Field(
+        description="Design energy efficiency parameters"
+    )
+    energy_losses: Optional[List[EnergyLoss]] = Field(
+        default_factory=list,
+        description="Identified energy loss sources and quantities"
+    )
+    monitoring_data: Optional[List[EfficiencyReading]] = Field(
+        default_factory=list,
+        description="Energy efficiency monitoring measurements"
+    )
+    improvement_opportunities: Optional[List[EnergySavingOpportunity]] = Field(
+        default_factory=list,
+        description="Identified energy efficiency improvement opportunities"
+    )
+    maintenance_impact: Optional[MaintenanceImpact] = Field(
+        default=None,
+        description="Impact of maintenance activities on energy efficiency"
+    )
+    economic_analysis: QuantityMap = Field(
+        description="Economic aspects of energy efficiency"
+    )
+    benchmarking: Optional[EnergyBenchmark] = Field(
+        default=None,
+        description="Energy efficiency benchmarking data"
+    )
+    optimization_controls: Optional[List[OptimizationControl]] = Field(
+        default_factory=list,
+        description="Energy efficiency control and optimization measures"
+    )
+    environmental_impact: QuantityMap = Field(
+        description="Environmental impact of energy consumption"
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def _split_consumption_quantity(cls, data: Any) -> Any:
+        """Accept consumption given as {"value", "unit"}."""
+        return split_quantity(data, "consumption")
+
+class DowntimeTiming(BaseModel):
+    """Timing details of a downtime event"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    start_time: Optional[datetime] = Field(
+        default=None,
+        description="Start time (ISO 8601)"
+    )
+    end_time: Optional[datetime] = Field(
+        default=None,
+        description="End time (ISO 8601)"
+    )
+    planned_duration: Optional[Quantity] = Field(
+        default=None,
+        description="Planned duration"
+    )
+    actual_duration: Optional[Quantity] = Field(
+        default=None,
+        description="Actual duration"
+    )
+    deviation: Optional[Quantity] = Field(
+        default=None,
+        description="Deviation from plan"
+    )
+
+class DowntimeCause(BaseModel):
+    """Root cause of a downtime event"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    primary_cause: OptionalStr = Field(
+        description="Primary cause"
+    )
+    contributing_factors: StrTupleField = Field(
+        description="Contributing factors"
+    )
+    detection_method: OptionalStr = Field(
+        description="How the cause was detected"
+    )
+    verification: OptionalStr = Field(
+        description="Verification of the cause"
+    )
+
+class ProductionLoss(BaseModel):
+    """Lost production and its cost"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    quantity: Optional[Quantity] = Field(
+        default=None,
+        description="Lost production quantity"
+    )
+    cost: Optional[Quantity] = Field(
+        default=None,
+        description="Cost of the lost production"
+    )
+
+class DowntimeImpact(BaseModel):
+    """Assessment of downtime impact"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    production_loss: Optional[ProductionLoss] = Field(
+        default=None,
+        description="Production loss"
+    )
+    quality_impact: Optional[InternedStr] = Field(
+        default=None,
+        description="Impact on product quality"
+    )
+    customer_impact: Optional[InternedStr] = Field(
+        default=None,
+        description="Impact on customers"
+    )
+    environmental_impact: Optional[InternedStr] = Field(
+        default=None,
+        description="Environmental impact"
+    )
+    safety_impact: Optional[InternedStr] = Field(
+        default=None,
+        description="Safety impact"
+    )
+
+class AffectedSystem(BaseModel):
+    """System affected by a downtime"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    system_id: str = Field(
+        description="System identifier"
+    )
+    impact_level: Optional[InternedStr] = Field(
+        default=None,
+        description="Impact level"
+    )
+    status: Optional[InternedStr] = Field(
+        default=None,
+        description="System status"
+    )
+
+class MitigationAction(BaseModel):
+    """Action taken to mitigate downtime impact"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    action: str = Field(
+        description="Action"
+    )
+    timing: Optional[datetime] = Field(
+        default=None,
+        description="Time of the action (ISO 8601)"
+    )
+    effectiveness: Optional[InternedStr] = Field(
+        default=None,
+        description="Effectiveness"
+    )
+    details: OptionalStr = Field(
+        description="Details"
+    )
+
+class MaintenanceDetails(BaseModel):
+    """Maintenance work performed during a downtime"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    work_order: OptionalStr = Field(
+        description="Work order reference"
+    )
+    maintenance_type: Optional[InternedStr] = Field(
+        default=None,
+        description="Maintenance type"
+    )
+    tasks_completed: StrTupleField = Field(
+        description="Completed tasks"
+    )
+    spare_parts_used: List[ResourceItem] = Field(
+        default_factory=list,
+        description="Spare parts used"
+    )
+    personnel_involved: List[PersonnelRequirement] = Field(
+        default_factory=list,
+        description="Personnel involved"
+    )
+
+class CostAnalysis(BaseModel):
+    """Financial impact of a downtime"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    direct_costs: QuantityMap = Field(
+        description="Direct costs per cost element"
+    )
+    indirect_costs: QuantityMap = Field(
+        description="Indirect costs per cost element"
+    )
+    total_impact: Optional[Quantity] = Field(
+        default=None,
+        description="Total financial impact"
+    )
+
+class LessonLearned(BaseModel):
+    """Lesson learned and resulting recommendation"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    category: Optional[InternedStr] = Field(
+        default=None,
+        description="Category"
+    )
+    finding: OptionalStr = Field(
+        description="Finding"
+    )
+    recommendation: OptionalStr = Field(
+        description="Recommendation"
+    )
+    priority: Optional[InternedStr] = Field(
+        default=None,
+        description="Priority"
+    )
+    status: Optional[InternedStr] = Field(
+        default=None,
+        description="Implementation status"
+    )
+
+class RecordReference(BaseModel):
+    """Reference to a related record or document"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Record type"
+    )
+    reference: str = Field(
+        description="Record reference"
+    )
+    description: OptionalStr = Field(
+        description="Record description"
+    )
+
+@columnar
+class Downtime(BaseModel):
+    """Model for tracking and analyzing equipment and process downtimes"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    id: str = Field(
+        description="Unique downtime event identifier"
+    )
+    equipment_id: str = Field(
+        description="Equipment identifier affected by downtime"  # Pump 101
+    )
+    type: Literal["planned_maintenance", "unplanned_failure", "emergency_shutdown", "operational_delay"] = Field(
+        description="Type of downtime event"
+    )
+    description: Optional[str] = Field(
+        default=None,
+        description="Detailed description of downtime event"
+    )
+    duration: Optional[float] = Field(
+        default=None,
+        description="Duration of downtime"  # hours
+    )
+    duration_unit: Optional[InternedStr] = Field(
+        default=None,
+        description="Unit of duration measurement"  # days, minutes
+    )
+    timing: Optional[DowntimeTiming] = Field(
+        default=None,
+        description="Timing details of the downtime event"
+    )
+    root_cause: Optional[DowntimeCause] = Field(
+        default=None,
+        description="Root cause analysis of the downtime"
+    )
+    impact_assessment: Optional[DowntimeImpact] = Field(
+        default=None,
+        description="Assessment of downtime impact"
+    )
+    affected_systems: Optional[List[AffectedSystem]] = Field(
+        default_factory=list,
+        description="Systems affected by the downtime"
+    )
+    mitigation_actions: Optional[List[MitigationAction]] = Field(
+        default_factory=list,
+        description="Actions taken to mitigate downtime impact"
+    )
+    maintenance_details: Optional[MaintenanceDetails] = Field(
+        default=None,
+        description="Details of maintenance activities during downtime"
+    )
+    cost_analysis: Optional[CostAnalysis] = Field(
+        default=None,
+        description="Financial impact analysis of downtime"
+    )
+    lessons_learned: Optional[List[LessonLearned]] = Field(
+        default_factory=list,
+        description="Lessons learned and recommendations"
+    )
+    documentation: Optional[List[RecordReference]] = Field(
+        default_factory=list,
+        description="Related documentation and records"
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def _split_duration_quantity(cls, data: Any) -> Any:
+        """Accept duration given as {"value", "unit"}."""
+        return split_quantity(data, "duration")
+
+class Interlock(BaseModel):
+    """Safety or operational interlock"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    type: InternedStr = Field(
+        description="Interlock type"
+    )
+    setpoint: Optional[float] = Field(
+        default=None,
+        description="Trip setpoint"
+    )
+    unit: Optional[InternedStr] = Field(
+        default=None,
+        description="Setpoint unit"
+    )
+    action: OptionalStr = Field(
+        description="Action on trip"
+    )
+    priority: Optional[InternedStr] = Field(
+        default=None,
+        description="Priority"
+    )
+
+class Bypass(BaseModel):
+    """Model for bypass lines in process equipment and systems"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    id: str = Field(
+        description="Unique bypass line identifier in the system"
+    )
+    type: Literal["process_bypass", "maintenance_bypass", "safety_bypass", "startup_bypass"] = Field(
+        description="Type of bypass line"
+    )
+    from_equipment: str = Field(
+        description="Equipment identifier where bypass line starts"
+    )
+    to_equipment: str = Field(
+        description="Equipment identifier where bypass line ends"
+    )
+    description: Optional[str] = Field(
+        default=None,
+        description="Detailed description of bypass line purpose and characteristics"
+    )
+    purpose: Optional[str] = Field(
+        default=None,
+        description="Primary purpose and function of the bypass line in the process"
+    )
+    operation_conditions: StrTupleField = Field(
+        description="List of operating conditions and limitations for bypass usage"
+    )
+    restrictions: StrTupleField = Field(
+        description="Usage restrictions and limitations for the bypass line"
+    )
+    safety_requirements: StrTupleField = Field(
+        description="Safety requirements and precautions for bypass operation"
+    )
+    parameters: Optional[List[NamedParameter]] = Field(
+        default_factory=list,
+        description="Technical parameters and design characteristics of the bypass"
+    )
+    valves: StrTupleField = Field(
+        description="List of valve identifiers associated with the bypass line"
+    )
+    interlocks: Optional[List[Interlock]] = Field(
+        default_factory=list,
+        description="Safety and operational interlocks for bypass operation"
+    )
+    source_text: Optional[str] = Field(
+        default=None,
+        description="Original text from technical documentation describing the bypass"
+    )
+    language: Optional[str] = Field(
+        default=None,
+        description="Language of the source documentation and descriptions"
+    )
+    dynamic_properties: ListOfDictsField = Field(
+        description="Additional dynamic properties and characteristics extracted from documentation"
+    )
+
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> 'Bypass':
+        """Parse and validate a raw JSON document in one pydantic-core pass.
+
+        For a JSON array of records use BypassList.validate_json(raw).
+        """
+        return cls.model_validate_json(raw)
+
+class PriceComponent(Quantity):
+    """Price component with its basis"""
+    basis: OptionalStr = Field(
+        description="Basis of the component"
+    )
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Component type"
+    )
+
+class TimePeriod(BaseModel):
+    """Time period of a record"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    start_date: Optional[datetime] = Field(
+        default=None,
+        description="Start date (ISO 8601)"
+    )
+    end_date: Optional[datetime] = Field(
+        default=None,
+        description="End date (ISO 8601)"
+    )
+    duration: Optional[Quantity] = Field(
+        default=None,
+        description="Period duration"
+    )
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Period type"
+    )
+    review_frequency: OptionalStr = Field(
+        description="Review frequency"
+    )
+
+class PriceFactor(BaseModel):
+    """Adjustment factor of a price formula"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    factor: str = Field(
+        description="Factor name"
+    )
+    value: Optional[float] = Field(
+        default=None,
+        description="Factor value"
+    )
+    application: Optional[InternedStr] = Field(
+        default=None,
+        description="How the factor is applied"
+    )
+
+class PriceFormula(BaseModel):
+    """Formula for price calculation"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    base_component: OptionalStr = Field(
+        description="Base price component or index"
+    )
+    multiplier: Optional[float] = Field(
+        default=None,
+        description="Multiplier"
+    )
+    adjustments: Optional[List[PriceFactor]] = Field(
+        default=None,
+        description="Adjustment factors"
+    )
+    currency_basis: Optional[InternedStr] = Field(
+        default=None,
+        description="Currency"
+    )
+
+class VolumeTier(BaseModel):
+    """Volume-based pricing tier"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    tier: Optional[int] = Field(
+        default=None,
+        description="Tier number"
+    )
+    volume_range: Optional[Limits] = Field(
+        default=None,
+        description="Volume range of the tier"
+    )
+    price: Optional[Quantity] = Field(
+        default=None,
+        description="Price in the tier"
+    )
+    discount: Optional[Quantity] = Field(
+        default=None,
+        description="Discount in the tier"
+    )
+
+class PriceAdjustment(BaseModel):
+    """Condition for a price adjustment"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    trigger: str = Field(
+        description="Adjustment trigger"
+    )
+    threshold: Optional[Quantity] = Field(
+        default=None,
+        description="Trigger threshold"
+    )
+    adjustment_mechanism: OptionalStr = Field(
+        description="Adjustment mechanism"
+    )
+    notice_period: Optional[Quantity] = Field(
+        default=None,
+        description="Notice period"
+    )
+    currency_pair: OptionalStr = Field(
+        description="Currency pair"
+    )
+
+class PaymentTerms(BaseModel):
+    """Payment and billing terms"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    payment_deadline: Optional[Quantity] = Field(
+        default=None,
+        description="Payment deadline"
+    )
+    early_payment_discount: Optional[Quantity] = Field(
+        default=None,
+        description="Early payment discount"
+    )
+    late_payment_penalty: Optional[Quantity] = Field(
+        default=None,
+        description="Late payment penalty"
+    )
+    billing_frequency: OptionalStr = Field(
+        description="Billing frequency"
+    )
+    payment_method: OptionalStr = Field(
+        description="Payment method"
+    )
+
+class MarketReference(BaseModel):
+    """Market reference price or index"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    index: str = Field(
+        description="Index name"
+    )
+    source: OptionalStr = Field(
+        description="Index source"
+    )
+    frequency: OptionalStr = Field(
+        description="Publication frequency"
+    )
+    correlation: Optional[Quantity] = Field(
+        default=None,
+        description="Correlation with the price"
+    )
+    weight: Optional[Quantity] = Field(
+        default=None,
+        description="Weight in the price"
+    )
+
+class PricePoint(BaseModel):
+    """Historical price observation"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    date: Optional[datetime] = Field(
+        default=None,
+        description="Observation date (ISO 8601)"
+    )
+    price: Optional[Quantity] = Field(
+        default=None,
+        description="Price"
+    )
+    volume: Optional[Quantity] = Field(
+        default=None,
+        description="Traded volume"
+    )
+    market_conditions: OptionalStr = Field(
+        description="Market conditions"
+    )
+
+class PriceOutlook(BaseModel):
+    """Price forecast for one horizon"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    horizon: Optional[Quantity] = Field(
+        default=None,
+        description="Forecast horizon"
+    )
+    expected_price: Optional[Quantity] = Field(
+        default=None,
+        description="Expected price"
+    )
+    confidence_interval: Optional[Limits] = Field(
+        default=None,
+        description="Confidence interval"
+    )
+    trend: Optional[InternedStr] = Field(
+        default=None,
+        description="Price trend"
+    )
+    annual_growth: Optional[Quantity] = Field(
+        default=None,
+        description="Annual growth"
+    )
+
+class PriceRisk(BaseModel):
+    """Price risk assessment"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    volatility: Optional[Quantity] = Field(
+        default=None,
+        description="Price volatility"
+    )
+    key_risk_factors: StrTupleField = Field(
+        description="Key risk factors"
+    )
+    hedging_strategy: OptionalStr = Field(
+        description="Hedging strategy"
+    )
+    contingency_plans: StrTupleField = Field(
+        description="Contingency plans"
+    )
+
+class ResourcePrice(BaseModel):
+    """Model for resource pricing and cost tracking"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    id: str = Field(
+        description="Unique resource price record identifier"
+    )
+    resource_id: str = Field(
+        description="Reference to the resource being priced"
+    )
+    type: str = Field(
+        description="Type of pricing arrangement"  # contract_price, spot_price, index_linked, formula_based
+    )
+    price_components: Optional[Dict[InternedStr, PriceComponent]] = Field(
+        default=None,
+        description="Breakdown of price components"
+    )
+    validity_period: Optional[TimePeriod] = Field(
+        default=None,
+        description="Price validity period"
+    )
+    price_formula: Optional[PriceFormula] = Field(
+        default=None,
+        description="Formula for price calculation"
+    )
+    volume_tiers: Optional[List[VolumeTier]] = Field(
+        default=None,
+        description="Volume-based pricing tiers"
+    )
+    price_adjustments: Optional[List[PriceAdjustment]] = Field(
+        default=None,
+        description="Conditions for price adjustments"
+    )
+    payment_terms: Optional[PaymentTerms] = Field(
+        default=None,
+        description="Payment and billing terms"
+    )
+    market_references: Optional[List[MarketReference]] = Field(
+        default=None,
+        description="Market reference prices and indices"
+    )
+    historical_prices: Optional[List[PricePoint]] = Field(
+        default=None,
+        description="Historical price data"
+    )
+    price_forecast: Optional[Dict[InternedStr, PriceOutlook]] = Field(
+        default=None,
+        description="Price forecasts and projections"
+    )
+    risk_assessment: Optional[PriceRisk] = Field(
+        default=None,
+        description="Price risk assessment"
+    )
+
+    def price_series(self) -> Dict[str, List[Any]]:
+        """historical_prices as columns: {"date": [...], "price": [...], "volume": [...]}.
+
+        Prices and volumes are plain floats (None where absent), so analytics
+        over a long history walk three flat lists instead of the PricePoint
+        objects; the columns can be handed to numpy.asarray as they are.
+        """
+        points = self.historical_prices or ()
+        return {
+            "date": [p.date for p in points],
+            "price": [p.price.value if p.price else None for p in points],
+            "volume": [p.volume.value if p.volume else None for p in points],
         }
+
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> 'ResourcePrice':
+        """Parse and validate a raw JSON document in one pydantic-core pass.
+
+        For a JSON array of records use ResourcePriceList.validate_json(raw).
+        """
+        return cls.model_validate_json(raw)
+
+class ConsumptionProfile(BaseModel):
+    """Consumption rates of a resource"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    normal_rate: Optional[Quantity] = Field(
+        default=None,
+        description="Normal consumption rate"
+    )
+    peak_rate: Optional[Quantity] = Field(
+        default=None,
+        description="Peak consumption rate"
+    )
+    annual_consumption: Optional[Quantity] = Field(
+        default=None,
+        description="Annual consumption"
+    )
+    lifetime: Optional[Quantity] = Field(
+        default=None,
+        description="Service life"
+    )
+    replacement_criteria: StrTupleField = Field(
+        description="Replacement criteria"
+    )
+
+class InventoryLevels(BaseModel):
+    """Inventory control parameters"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    minimum_stock: Optional[Quantity] = Field(
+        default=None,
+        description="Minimum stock"
+    )
+    maximum_stock: Optional[Quantity] = Field(
+        default=None,
+        description="Maximum stock"
+    )
+    reorder_point: Optional[Quantity] = Field(
+        default=None,
+        description="Reorder point"
+    )
+    order_quantity: Optional[Quantity] = Field(
+        default=None,
+        description="Order quantity"
+    )
+    lead_time: Optional[Quantity] = Field(
+        default=None,
+        description="Delivery lead time"
+    )
+
+class StorageRequirements(BaseModel):
+    """Storage conditions"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    container_type: OptionalStr = Field(
+        description="Container type"
+    )
+    temperature: Optional[Limits] = Field(
+        default=None,
+        description="Storage temperature"
+    )
+    humidity: Optional[Limits] = Field(
+        default=None,
+        description="Storage humidity"
+    )
+    stack_height: Optional[Limits] = Field(
+        default=None,
+        description="Stack height"
+    )
+    segregation: OptionalStr = Field(
+        description="Segregation requirement"
+    )
+    special_conditions: StrTupleField = Field(
+        description="Special storage conditions"
+    )
+
+class HandlingRequirements(BaseModel):
+    """Handling and safety requirements"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    ppe_required: StrTupleField = Field(
+        description="Required personal protective equipment"
+    )
+    special_equipment: StrTupleField = Field(
+        description="Special handling equipment"
+    )
+    procedures: StrTupleField = Field(
+        description="Handling procedures"
+    )
+    safety_precautions: StrTupleField = Field(
+        description="Safety precautions"
+    )
+
+class Supplier(BaseModel):
+    """Approved supplier of a resource"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    name: str = Field(
+        description="Supplier name"
+    )
+    qualification_status: Optional[InternedStr] = Field(
+        default=None,
+        description="Qualification status"
+    )
+    contract_number: OptionalStr = Field(
+        description="Contract number"
+    )
+    lead_time: Optional[Quantity] = Field(
+        default=None,
+        description="Delivery lead time"
+    )
+    minimum_order: Optional[Quantity] = Field(
+        default=None,
+        description="Minimum order quantity"
+    )
+    quality_certification: StrTupleField = Field(
+        description="Quality certificates"
+    )
+
+class ResourceCost(BaseModel):
+    """Cost information of a resource"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    unit_cost: Optional[Quantity] = Field(
+        default=None,
+        description="Unit cost"
+    )
+    delivery_cost: Optional[Quantity] = Field(
+        default=None,
+        description="Delivery cost"
+    )
+    disposal_cost: Optional[Quantity] = Field(
+        default=None,
+        description="Disposal cost"
+    )
+    total_lifecycle_cost: Optional[Quantity] = Field(
+        default=None,
+        description="Total lifecycle cost"
+    )
+    cost_drivers: StrTupleField = Field(
+        description="Main cost drivers"
+    )
+
+class DocumentRecord(BaseModel):
+    """Document or certificate kept for a record"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Document type"
+    )
+    number: OptionalStr = Field(
+        description="Document number"
+    )
+    revision: OptionalStr = Field(
+        description="Document revision"
+    )
+    date: Optional[datetime] = Field(
+        default=None,
+        description="Document date (ISO 8601)"
+    )
+    validity: OptionalStr = Field(
+        description="Validity period"
+    )
+    frequency: OptionalStr = Field(
+        description="Issue frequency"
+    )
+    retention_period: Optional[Quantity] = Field(
+        default=None,
+        description="Retention period"
+    )
+
+class Resource(BaseModel):
+    """Model for process resources and utilities management"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    id: str = Field(
+        description="Unique resource identifier"
+    )
+    name: str = Field(
+        description="Resource name or designation"
+    )
+    category: str = Field(
+        description="Resource category or type"  # process_catalyst, utility, chemical, consumable
+    )
+    description: Optional[str] = Field(
+        default=None,
+        description="Detailed description of the resource"
+    )
+    specifications: Optional[Dict[InternedStr, Dict[InternedStr, SpecValue]]] = Field(
+        default=None,
+        description="Technical specifications grouped by kind: property -> quantity, limits or plain value"
+    )
+    quality_requirements: Optional[Dict[InternedStr, Dict[InternedStr, Limits]]] = Field(
+        default=None,
+        description="Quality requirements and acceptance criteria"
+    )
+    consumption_data: Optional[ConsumptionProfile] = Field(
+        default=None,
+        description="Consumption patterns and rates"
+    )
+    inventory_management: Optional[InventoryLevels] = Field(
+        default=None,
+        description="Inventory control parameters"
+    )
+    storage_requirements: Optional[StorageRequirements] = Field(
+        default=None,
+        description="Storage conditions and requirements"
+    )
+    handling_requirements: Optional[HandlingRequirements] = Field(
+        default=None,
+        description="Handling and safety requirements"
+    )
+    suppliers: Optional[List[Supplier]] = Field(
+        default=None,
+        description="Approved suppliers and vendor information"
+    )
+    cost_information: Optional[ResourceCost] = Field(
+        default=None,
+        description="Cost and economic information"
+    )
+    documentation: Optional[List[DocumentRecord]] = Field(
+        default=None,
+        description="Required documentation and certificates"
+    )
+
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> 'Resource':
+        """Parse and validate a raw JSON document in one pydantic-core pass.
+
+        For a JSON array of records use ResourceList.validate_json(raw).
+        """
+        return cls.model_validate_json(raw)
+
+class InventoryImpact(BaseModel):
+    """Impact of consumption on inventory"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    opening_stock: Optional[Quantity] = Field(
+        default=None,
+        description="Opening stock"
+    )
+    closing_stock: Optional[Quantity] = Field(
+        default=None,
+        description="Closing stock"
+    )
+    minimum_level: Optional[Quantity] = Field(
+        default=None,
+        description="Minimum stock level"
+    )
+    reorder_point: Optional[Quantity] = Field(
+        default=None,
+        description="Reorder point"
+    )
+    stock_status: Optional[InternedStr] = Field(
+        default=None,
+        description="Stock status"
+    )
+
+class ConsumptionPattern(BaseModel):
+    """Analysis of consumption patterns"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    trend: Optional[InternedStr] = Field(
+        default=None,
+        description="Consumption trend"
+    )
+    variability: Optional[Quantity] = Field(
+        default=None,
+        description="Variability"
+    )
+    seasonality: OptionalStr = Field(
+        description="Seasonality"
+    )
+    peak_factors: StrTupleField = Field(
+        description="Factors causing peaks"
+    )
+    pattern_type: Optional[InternedStr] = Field(
+        default=None,
+        description="Pattern type"
+    )
+
+class QualityTrend(BaseModel):
+    """Change of a quality parameter over a period"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    parameter: str = Field(
+        description="Quality parameter"
+    )
+    initial: Optional[Quantity] = Field(
+        default=None,
+        description="Initial value"
+    )
+    final: Optional[Quantity] = Field(
+        default=None,
+        description="Final value"
+    )
+    decline_rate: Optional[Quantity] = Field(
+        default=None,
+        description="Decline rate"
+    )
+    impact: OptionalStr = Field(
+        description="Impact"
+    )
+
+class ConsumptionForecast(BaseModel):
+    """Consumption forecast"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    next_period: Optional[Quantity] = Field(
+        default=None,
+        description="Forecast for the next period"
+    )
+    annual_forecast: Optional[Quantity] = Field(
+        default=None,
+        description="Annual forecast"
+    )
+    replacement_date: Optional[datetime] = Field(
+        default=None,
+        description="Expected replacement date (ISO 8601)"
+    )
+    confidence_level: Optional[Quantity] = Field(
+        default=None,
+        description="Confidence level"
+    )
+
+class ResourceConsumption(BaseModel):
+    """Model for tracking and analyzing resource consumption patterns"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    id: str = Field(
+        description="Unique resource consumption record identifier"
+    )
+    resource_id: str = Field(
+        description="Reference to the resource being consumed"
+    )
+    equipment_id: Optional[str] = Field(
+        default=None,
+        description="Equipment or unit consuming the resource"
+    )
+    period: Optional[TimePeriod] = Field(
+        default=None,
+        description="Time period for consumption measurement"
+    )
+    consumption_data: QuantityMap = Field(
+        description="Actual consumption measurements"
+    )
+    operating_conditions: Optional[Dict[InternedStr, Limits]] = Field(
+        default=None,
+        description="Process conditions during consumption"
+    )
+    performance_metrics: Optional[Dict[InternedStr, Annotated[Union[Quantity, Dict[InternedStr, Union[float, InternedStr]]], Field(union_mode="left_to_right")]]] = Field(
+        default=None,
+        description="Performance indicators related to consumption"
+    )
+    cost_analysis: QuantityMap = Field(
+        description="Economic analysis of consumption"
+    )
+    inventory_impact: Optional[InventoryImpact] = Field(
+        default=None,
+        description="Impact on inventory levels"
+    )
+    consumption_pattern: Optional[ConsumptionPattern] = Field(
+        default=None,
+        description="Analysis of consumption patterns"
+    )
+    quality_parameters: Optional[List[QualityTrend]] = Field(
+        default=None,
+        description="Quality aspects affecting consumption"
+    )
+    optimization_opportunities: Optional[List[CostSavingOpportunity]] = Field(
+        default=None,
+        description="Identified consumption optimization opportunities"
+    )
+    environmental_impact: QuantityMap = Field(
+        description="Environmental aspects of consumption"
+    )
+    forecasting: Optional[ConsumptionForecast] = Field(
+        default=None,
+        description="Consumption forecasts and predictions"
+    )
+    documentation: Optional[List[DocumentRecord]] = Field(
+        default=None,
+        description="Related consumption documentation"
+    )
+
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> 'ResourceConsumption':
+        """Parse and validate a raw JSON document in one pydantic-core pass.
+
+        For a JSON array of records use ResourceConsumptionList.validate_json(raw).
+        """
+        return cls.model_validate_json(raw)
+
+class WasteComponent(BaseModel):
+    """Model for waste components"""
+    model_config = ConfigDict(defer_build=True, frozen=True, json_schema_extra=_inject_examples)
+
+    name: str = Field(
+        description="Component name"
+    )
+    concentration: RangeOrScalar = Field(
+        default_factory=ScalarValue,
+        description="Component concentration or range"
+    )
+    unit: str = Field(
+        description="Concentration unit"
+    )
+    description: Optional[str] = Field(
+        default=None,
+        description="Component description"
+    )
+
+class WasteNorm(BaseModel):
+    """Model for waste generation norms"""
+    model_config = ConfigDict(defer_build=True, frozen=True, json_schema_extra=_inject_examples)
+
+    value: float = Field(
+        default=0.0,  # Добавили default
+        description="Norm value"
+    )
+    unit: str = Field(
+        description="Norm unit"
+    )
+    basis: str = Field(
+        description="Norm basis"
+    )
+    type: str = Field(
+        default="project",
+        description="Norm type"
+    )
+    date: Optional[datetime] = Field(
+        default=None,
+        description="Norm effective date (ISO 8601)"
+    )
+    notes: Optional[str] = Field(
+        default=None,
+        description="Additional notes"
+    )
+
+class WasteSource(BaseModel):
+    """Origin of a waste stream"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    equipment_id: OptionalStr = Field(
+        description="Source equipment"
+    )
+    process_stage: OptionalStr = Field(
+        description="Process stage"
+    )
+    generation_point: OptionalStr = Field(
+        description="Generation point"
+    )
+    generation_mechanism: OptionalStr = Field(
+        description="Generation mechanism"
+    )
+
+class WasteClassification(BaseModel):
+    """Waste classification"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    hazard_class: Optional[InternedStr] = Field(
+        default=None,
+        description="Hazard class"
+    )
+    regulatory_category: OptionalStr = Field(
+        description="Regulatory category"
+    )
+    disposal_category: OptionalStr = Field(
+        description="Disposal category"
+    )
+    environmental_risk: Optional[InternedStr] = Field(
+        default=None,
+        description="Environmental risk"
+    )
+    handling_requirements: OptionalStr = Field(
+        description="Handling requirements"
+    )
+
+class WasteConstituent(BaseModel):
+    """Constituent of a waste stream"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    component: str = Field(
+        description="Component name"
+    )
+    concentration: Optional[Quantity] = Field(
+        default=None,
+        description="Concentration"
+    )
+    form: OptionalStr = Field(
+        description="Physical or chemical form"
+    )
+    recoverable: Optional[bool] = Field(
+        default=None,
+        description="Whether the component is recoverable"
+    )
+
+class WastePhysicalProperties(BaseModel):
+    """Physical properties of a waste stream"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    phase: Optional[InternedStr] = Field(
+        default=None,
+        description="Phase"
+    )
+    particle_size: Optional[Quantity] = Field(
+        default=None,
+        description="Particle size"
+    )
+    bulk_density: Optional[Quantity] = Field(
+        default=None,
+        description="Bulk density"
+    )
+    moisture_content: Optional[Quantity] = Field(
+        default=None,
+        description="Moisture content"
+    )
+
+class GenerationRate(BaseModel):
+    """Waste generation characteristics"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    normal_rate: Optional[Quantity] = Field(
+        default=None,
+        description="Normal generation rate"
+    )
+    peak_rate: Optional[Quantity] = Field(
+        default=None,
+        description="Peak generation rate"
+    )
+    variability: OptionalStr = Field(
+        description="Variability"
+    )
+    frequency: OptionalStr = Field(
+        description="Generation frequency"
+    )
+    factors_affecting_rate: StrTupleField = Field(
+        description="Factors affecting the rate"
+    )
+
+class WasteHandlingRequirements(BaseModel):
+    """Waste handling and storage requirements"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    ppe_requirements: StrTupleField = Field(
+        description="Required personal protective equipment"
+    )
+    storage_conditions: Optional[StorageRequirements] = Field(
+        default=None,
+        description="Storage conditions"
+    )
+    special_precautions: StrTupleField = Field(
+        description="Special precautions"
+    )
+
+class TreatmentResidual(BaseModel):
+    """Residual stream of a waste treatment"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Residual type"
+    )
+    quantity: Optional[Quantity] = Field(
+        default=None,
+        description="Residual quantity"
+    )
+    disposal: OptionalStr = Field(
+        description="Residual disposal"
+    )
+
+class TreatmentProcess(BaseModel):
+    """Waste treatment process"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    method: OptionalStr = Field(
+        description="Treatment method"
+    )
+    steps: StrTupleField = Field(
+        description="Treatment steps"
+    )
+    efficiency: Optional[Quantity] = Field(
+        default=None,
+        description="Treatment efficiency"
+    )
+    residuals: Optional[List[TreatmentResidual]] = Field(
+        default=None,
+        description="Residual streams"
+    )
+
+class RegulatoryCompliance(BaseModel):
+    """Regulatory requirements"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    permits_required: StrTupleField = Field(
+        description="Required permits"
+    )
+    reporting_requirements: StrTupleField = Field(
+        description="Reporting requirements"
+    )
+    applicable_regulations: StrTupleField = Field(
+        description="Applicable regulations"
+    )
+    monitoring_requirements: StrTupleField = Field(
+        description="Monitoring requirements"
+    )
+
+class ImpactAspect(BaseModel):
+    """Significance of one environmental impact aspect"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    significance: Optional[InternedStr] = Field(
+        default=None,
+        description="Significance level"
+    )
+
+class WasteShipment(BaseModel):
+    """Waste generation and disposal record"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    date: Optional[datetime] = Field(
+        default=None,
+        description="Record date (ISO 8601)"
+    )
+    quantity: Optional[Quantity] = Field(
+        default=None,
+        description="Waste quantity"
+    )
+    disposal_contractor: OptionalStr = Field(
+        description="Disposal contractor"
+    )
+    manifest_number: OptionalStr = Field(
+        description="Manifest number"
+    )
+    disposal_location: OptionalStr = Field(
+        description="Disposal location"
+    )
+
+class ProcessWaste(BaseModel):
+    """Model for process waste streams and waste management"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    id: str = Field(
+        description="Unique waste stream identifier"
+    )
+    name: Optional[str] = Field(
+        default=None,
+        description="Descriptive name of waste stream"
+    )
+    type: str = Field(
+        description="Type of process waste"  # spent_catalyst, chemical_waste, biological_waste, hazardous_waste
+    )
+    source: Optional[WasteSource] = Field(
+        default=None,
+        description="Origin and source of waste"
+    )
+    classification: Optional[WasteClassification] = Field(
+        default=None,
+        description="Waste classification and categorization"
+    )
+    composition: Optional[List[WasteConstituent]] = Field(
+        default=None,
+        description="Chemical composition of waste"
+    )
+    physical_properties: Optional[WastePhysicalProperties] = Field(
+        default=None,
+        description="Physical properties of waste"
+    )
+    generation_rate: Optional[GenerationRate] = Field(
+        default=None,
+        description="Waste generation characteristics"
+    )
+    handling_requirements: Optional[WasteHandlingRequirements] = Field(
+        default=None,
+        description="Waste handling and storage requirements"
+    )
+    disposal_method: str = Field(
+        description="Primary method of waste disposal or treatment"  # metal_recovery, incineration, landfill, biological_treatment
+    )
+    treatment_process: Optional[TreatmentProcess] = Field(
+        default=None,
+        description="Waste treatment process details"
+    )
+    regulatory_compliance: Optional[RegulatoryCompliance] = Field(
+        default=None,
+        description="Regulatory requirements and compliance"
+    )
+    environmental_impact: Optional[Dict[InternedStr, ImpactAspect]] = Field(
+        default=None,
+        description="Environmental impact assessment"
+    )
+    cost_analysis: QuantityMap = Field(
+        description="Economic aspects of waste management"
+    )
+    tracking_records: Optional[List[WasteShipment]] = Field(
+        default=None,
+        description="Waste generation and disposal tracking"
+    )
+
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> 'ProcessWaste':
+        """Parse and validate a raw JSON document in one pydantic-core pass.
+
+        For a JSON array of records use ProcessWasteList.validate_json(raw).
+        """
+        return cls.model_validate_json(raw)
+
+class QuantityRange(BaseModel):
+    """Range whose bounds are plain numbers or quantities with units"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    min: Optional[Union[float, Quantity]] = Field(
+        default=None,
+        description="Lower bound"
+    )
+    max: Optional[Union[float, Quantity]] = Field(
+        default=None,
+        description="Upper bound"
+    )
+    normal: Optional[Union[float, Quantity]] = Field(
+        default=None,
+        description="Normal value"
+    )
+    unit: Optional[InternedStr] = Field(
+        default=None,
+        description="Unit of measurement of plain-number bounds"
+    )
+
+class PropertySpec(Limits):
+    """Specified property: target, acceptable range and test method"""
+    target: Optional[Union[float, Quantity]] = Field(
+        default=None,
+        description="Target value"
+    )
+    range: Optional[Limits] = Field(
+        default=None,
+        description="Acceptable range"
+    )
+    test_method: Optional[InternedStr] = Field(
+        default=None,
+        description="Test method"
+    )
+    frequency: Optional[InternedStr] = Field(
+        default=None,
+        description="Testing frequency"
+    )
+
+class UtilityRequirement(BaseModel):
+    """Utility consumed by a process"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    utility: str = Field(
+        description="Utility name"
+    )
+    pressure: Optional[Quantity] = Field(
+        default=None,
+        description="Supply pressure"
+    )
+    temperature: Optional[Quantity] = Field(
+        default=None,
+        description="Supply temperature"
+    )
+    consumption: Optional[Quantity] = Field(
+        default=None,
+        description="Consumption rate"
+    )
+    purpose: OptionalStr = Field(
+        description="Purpose of use"
+    )
+
+class QualityRequirement(BaseModel):
+    """Qualitative product quality requirement"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    parameter: str = Field(
+        description="Quality parameter"
+    )
+    specification: OptionalStr = Field(
+        description="Required result"
+    )
+    test_method: Optional[InternedStr] = Field(
+        default=None,
+        description="Test method"
+    )
+    frequency: Optional[InternedStr] = Field(
+        default=None,
+        description="Testing frequency"
+    )
+
+class ProductStorage(BaseModel):
+    """Product storage conditions"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    temperature: Optional[Limits] = Field(
+        default=None,
+        description="Storage temperature limits"
+    )
+    pressure: Optional[Limits] = Field(
+        default=None,
+        description="Storage pressure limits"
+    )
+    inert_blanket: OptionalStr = Field(
+        description="Inert blanketing gas"
+    )
+    tank_materials: VocabTupleField = Field(
+        description="Acceptable tank materials"
+    )
+    special_precautions: StrTupleField = Field(
+        description="Special storage precautions"
+    )
+
+class ProductHandling(BaseModel):
+    """Product handling conditions"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    loading_temperature: Optional[PropertySpec] = Field(
+        default=None,
+        description="Loading temperature"
+    )
+    loading_rate: Optional[Limits] = Field(
+        default=None,
+        description="Loading rate limits"
+    )
+    ppe_requirements: VocabTupleField = Field(
+        description="Required personal protective equipment"
+    )
+    special_procedures: StrTupleField = Field(
+        description="Special handling procedures"
+    )
+
+class TestRequirement(BaseModel):
+    """Quality test to be performed on the product"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    test: str = Field(
+        description="Test name"
+    )
+    frequency: Optional[InternedStr] = Field(
+        default=None,
+        description="Testing frequency"
+    )
+    method: Optional[InternedStr] = Field(
+        default=None,
+        description="Test method"
+    )
+    sampling_point: OptionalStr = Field(
+        description="Sampling point"
+    )
+    sample_size: Optional[Quantity] = Field(
+        default=None,
+        description="Sample size"
+    )
+    critical_components: StrTupleField = Field(
+        description="Components to be reported"
+    )
+
+class RetentionPeriod(BaseModel):
+    """How long samples or records are kept"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    duration: Optional[float] = Field(
+        default=None,
+        description="Retention duration"
+    )
+    unit: Optional[InternedStr] = Field(
+        default=None,
+        description="Unit of the duration"
+    )
+
+class CertificationRequirements(BaseModel):
+    """Product certification requirements"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    required_certificates: VocabTupleField = Field(
+        description="Certificates issued with the product"
+    )
+    approvals_needed: StrTupleField = Field(
+        description="Required approvals"
+    )
+    retention_samples: Optional[RetentionPeriod] = Field(
+        default=None,
+        description="Retention of product samples"
+    )
+    documentation_retention: Optional[RetentionPeriod] = Field(
+        default=None,
+        description="Retention of documentation"
+    )
+
+class ProductCompliance(BaseModel):
+    """Standards and regulations a product must meet"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    specifications: VocabTupleField = Field(
+        description="Product standards"
+    )
+    environmental_regulations: VocabTupleField = Field(
+        description="Environmental regulations"
+    )
+    reporting_requirements: StrTupleField = Field(
+        description="Required reports"
+    )
+
+class StageParameter(BaseModel):
+    """Key parameter of a process stage"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    name: str = Field(
+        description="Parameter name"
+    )
+    normal: Optional[Quantity] = Field(
+        default=None,
+        description="Normal value"
+    )
+    range: Optional[Limits] = Field(
+        default=None,
+        description="Operating range"
+    )
+
+class ProcessStage(BaseModel):
+    """Stage of a process"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    stage_id: OptionalStr = Field(
+        description="Stage identifier"
+    )
+    name: str = Field(
+        description="Stage name"
+    )
+    description: OptionalStr = Field(
+        description="Stage description"
+    )
+    equipment: StrTupleField = Field(
+        description="Equipment of the stage"
+    )
+    key_parameters: Optional[List[StageParameter]] = Field(
+        default=None,
+        description="Key operating parameters"
+    )
+    critical_controls: StrTupleField = Field(
+        description="Critical control loops"
+    )
+
+class Reaction(BaseModel):
+    """Chemical reaction of a process"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    type: InternedStr = Field(
+        description="Reaction type"
+    )
+    description: OptionalStr = Field(
+        description="Reaction description"
+    )
+    example: OptionalStr = Field(
+        description="Example equation"
+    )
+    heat_of_reaction: Optional[Quantity] = Field(
+        default=None,
+        description="Heat of reaction"
+    )
+
+class CatalystSpec(BaseModel):
+    """Catalyst used by a process"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    name: str = Field(
+        description="Catalyst name"
+    )
+    composition: OptionalStr = Field(
+        description="Catalyst composition"
+    )
+    form: Optional[InternedStr] = Field(
+        default=None,
+        description="Physical form"
+    )
+    regeneration_cycle: Optional[Quantity] = Field(
+        default=None,
+        description="Regeneration cycle length"
+    )
+
+class ProcessChemistry(BaseModel):
+    """Reactions and catalysts of a process"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    main_reactions: Optional[List[Reaction]] = Field(
+        default=None,
+        description="Main reactions"
+    )
+    catalysts: Optional[List[CatalystSpec]] = Field(
+        default=None,
+        description="Catalysts"
+    )
+
+class ControlPoint(BaseModel):
+    """Critical process control of a process description"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    parameter: str = Field(
+        description="Controlled parameter"
+    )
+    control_strategy: Optional[InternedStr] = Field(
+        default=None,
+        description="Control strategy"
+    )
+    primary_controller: OptionalStr = Field(
+        description="Primary controller tag"
+    )
+    secondary_controller: OptionalStr = Field(
+        description="Secondary controller tag"
+    )
+    critical_limits: QuantityMap = Field(
+        description="Critical limits (high_high, low_low, ...)"
+    )
+
+class HazardControl(BaseModel):
+    """Process hazard and its mitigation"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    hazard: str = Field(
+        description="Hazard"
+    )
+    risk: OptionalStr = Field(
+        description="Resulting risk"
+    )
+    mitigation: OptionalStr = Field(
+        description="Mitigation"
+    )
+    critical_limits: QuantityMap = Field(
+        description="Critical limits"
+    )
+    protective_systems: StrTupleField = Field(
+        description="Protective systems"
+    )
+
+class ProcessRelease(BaseModel):
+    """Emission or waste stream of a process"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    type: InternedStr = Field(
+        description="Release type"
+    )
+    source: OptionalStr = Field(
+        description="Source of the release"
+    )
+    quantity: Optional[Quantity] = Field(
+        default=None,
+        description="Released quantity"
+    )
+    disposal_method: OptionalStr = Field(
+        description="Disposal method"
+    )
+
+class EnvironmentalAspects(BaseModel):
+    """Emissions and waste streams of a process"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    emissions: Optional[List[ProcessRelease]] = Field(
+        default=None,
+        description="Emissions"
+    )
+    waste_streams: Optional[List[ProcessRelease]] = Field(
+        default=None,
+        description="Waste streams"
+    )
+
+class BalancePeriod(BaseModel):
+    """Time period of a material balance"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    start_time: Optional[datetime] = Field(
+        default=None,
+        description="Start of the period (ISO 8601)"
+    )
+    end_time: Optional[datetime] = Field(
+        default=None,
+        description="End of the period (ISO 8601)"
+    )
+    duration: Optional[Quantity] = Field(
+        default=None,
+        description="Period duration"
+    )
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Balance type"
+    )
+
+class ComponentFraction(Quantity):
+    """Share of one component in a stream"""
+    component: str = Field(
+        description="Component name"
+    )
+
+class BalanceStream(BaseModel):
+    """Process stream entering or leaving a balance envelope"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    stream_id: OptionalStr = Field(
+        description="Stream identifier"
+    )
+    name: OptionalStr = Field(
+        description="Stream name"
+    )
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Stream type"
+    )
+    quantity: Optional[Quantity] = Field(
+        default=None,
+        description="Stream quantity"
+    )
+    composition: Optional[List[ComponentFraction]] = Field(
+        default=None,
+        description="Stream composition"
+    )
+    conditions: QuantityMap = Field(
+        description="Stream conditions"
+    )
+
+    def composition_vector(self, components: List[str]) -> List[float]:
+        """Component values aligned to `components`, 0.0 for absent ones."""
+        values = {c.component: c.value for c in self.composition or ()}
+        return [values.get(name, 0.0) for name in components]
+
+class ProcessLoss(BaseModel):
+    """Process loss"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    type: InternedStr = Field(
+        description="Loss type"
+    )
+    quantity: Optional[Quantity] = Field(
+        default=None,
+        description="Lost quantity"
+    )
+    location: OptionalStr = Field(
+        description="Where the loss occurs"
+    )
+    reason: OptionalStr = Field(
+        description="Reason for the loss"
+    )
+    prevention_measures: StrTupleField = Field(
+        description="Prevention measures"
+    )
+
+class ComponentBalance(BaseModel):
+    """Material balance of one component"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    component: str = Field(
+        description="Component name"
+    )
+    input: Optional[Quantity] = Field(
+        default=None,
+        description="Input quantity"
+    )
+    output: Optional[Quantity] = Field(
+        default=None,
+        description="Output quantity"
+    )
+    accumulated: Optional[Quantity] = Field(
+        default=None,
+        description="Accumulated quantity"
+    )
+    lost: Optional[Quantity] = Field(
+        default=None,
+        description="Lost quantity"
+    )
+    closure: Optional[Quantity] = Field(
+        default=None,
+        description="Balance closure"
+    )
+
+class BalanceCheck(BaseModel):
+    """Validation of a material balance"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    total_mass_closure: Optional[Quantity] = Field(
+        default=None,
+        description="Total mass closure"
+    )
+    component_closure: Optional[Quantity] = Field(
+        default=None,
+        description="Component closure"
+    )
+    deviation_threshold: Optional[Quantity] = Field(
+        default=None,
+        description="Allowed deviation"
+    )
+    reconciliation_status: Optional[InternedStr] = Field(
+        default=None,
+        description="Reconciliation status"
+    )
+
+class InventoryChange(BaseModel):
+    """Inventory change over a balance period"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    location: OptionalStr = Field(
+        description="Inventory location"
+    )
+    material: OptionalStr = Field(
+        description="Material"
+    )
+    initial: Optional[Quantity] = Field(
+        default=None,
+        description="Initial inventory"
+    )
+    final: Optional[Quantity] = Field(
+        default=None,
+        description="Final inventory"
+    )
+    change: Optional[Quantity] = Field(
+        default=None,
+        description="Inventory change"
+    )
+
+class StreamAdjustment(BaseModel):
+    """Reconciliation adjustment of one stream"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    stream: str = Field(
+        description="Stream identifier"
+    )
+    adjustment: Optional[Quantity] = Field(
+        default=None,
+        description="Applied adjustment"
+    )
+
+class Reconciliation(BaseModel):
+    """Data reconciliation of a material balance"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    method: Optional[InternedStr] = Field(
+        default=None,
+        description="Reconciliation method"
+    )
+    constraints: StrTupleField = Field(
+        description="Balance constraints"
+    )
+    adjustments: Optional[List[StreamAdjustment]] = Field(
+        default=None,
+        description="Stream adjustments"
+    )
+    confidence_level: Optional[Quantity] = Field(
+        default=None,
+        description="Confidence level"
+    )
+
+class ControlObjective(BaseModel):
+    """Objective of a control loop"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    primary_objective: OptionalStr = Field(
+        description="Primary objective"
+    )
+    setpoint: Optional[Quantity] = Field(
+        default=None,
+        description="Setpoint"
+    )
+    allowable_deviation: Optional[Quantity] = Field(
+        default=None,
+        description="Allowable deviation"
+    )
+    response_time: Optional[Quantity] = Field(
+        default=None,
+        description="Required response time"
+    )
+    stability_criteria: OptionalStr = Field(
+        description="Stability criteria"
+    )
+
+class ControlLoop(BaseModel):
+    """Single control loop"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    controlled_variable: OptionalStr = Field(
+        description="Controlled variable"
+    )
+    manipulated_variable: OptionalStr = Field(
+        description="Manipulated variable"
+    )
+    controller: OptionalStr = Field(
+        description="Controller tag"
+    )
+    parameters: Optional[Dict[InternedStr, float]] = Field(
+        default=None,
+        description="Tuning parameters (kp, ti, td)"
+    )
+
+class ControlConfiguration(BaseModel):
+    """Configuration of a control scheme"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    control_type: Optional[InternedStr] = Field(
+        default=None,
+        description="Control type"
+    )
+    primary_loop: Optional[ControlLoop] = Field(
+        default=None,
+        description="Primary (master) loop"
+    )
+    secondary_loop: Optional[ControlLoop] = Field(
+        default=None,
+        description="Secondary (slave) loop"
+    )
+
+class ControlInstrument(BaseModel):
+    """Instrument or final element of a control loop"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    tag: str = Field(
+        description="Instrument tag"
+    )
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Instrument type"
+    )
+    location: OptionalStr = Field(
+        description="Installation location"
+    )
+    service: OptionalStr = Field(
+        description="Service"
+    )
+    range: Optional[Limits] = Field(
+        default=None,
+        description="Measuring range"
+    )
+    accuracy: Optional[Quantity] = Field(
+        default=None,
+        description="Accuracy"
+    )
+    response_time: Optional[Quantity] = Field(
+        default=None,
+        description="Response time"
+    )
+    size: Optional[Quantity] = Field(
+        default=None,
+        description="Size"
+    )
+    characteristic: Optional[InternedStr] = Field(
+        default=None,
+        description="Valve characteristic"
+    )
+    rangeability: Optional[float] = Field(
+        default=None,
+        description="Rangeability"
+    )
+
+class AlarmPoint(BaseModel):
+    """Alarm or trip of a control loop"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    tag: str = Field(
+        description="Alarm or trip tag"
+    )
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Alarm type"
+    )
+    setpoint: Optional[Quantity] = Field(
+        default=None,
+        description="Setpoint"
+    )
+    priority: Optional[InternedStr] = Field(
+        default=None,
+        description="Priority"
+    )
+    action: OptionalStr = Field(
+        description="Resulting action"
+    )
+    voting_logic: Optional[InternedStr] = Field(
+        default=None,
+        description="Voting logic (2oo3, ...)"
+    )
+    response_time: Optional[Quantity] = Field(
+        default=None,
+        description="Response time"
+    )
+
+class TuningRecord(BaseModel):
+    """Controller retuning"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    date: Optional[datetime] = Field(
+        default=None,
+        description="Tuning date (ISO 8601)"
+    )
+    reason: OptionalStr = Field(
+        description="Reason for retuning"
+    )
+    method: Optional[InternedStr] = Field(
+        default=None,
+        description="Tuning method"
+    )
+    parameters: Optional[Dict[InternedStr, float]] = Field(
+        default=None,
+        description="Resulting tuning parameters"
+    )
+    performance_improvement: Optional[Quantity] = Field(
+        default=None,
+        description="Achieved improvement"
+    )
+
+class ControlMaintenance(BaseModel):
+    """Maintenance task of a control system item"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    item: str = Field(
+        description="Maintained item"
+    )
+    task: OptionalStr = Field(
+        description="Task"
+    )
+    frequency: Optional[Quantity] = Field(
+        default=None,
+        description="Task interval"
+    )
+    acceptance_criteria: OptionalStr = Field(
+        description="Acceptance criteria"
+    )
+
+class RegimeParameter(BaseModel):
+    """Operating parameter of a technological regime"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    parameter: str = Field(
+        description="Parameter name"
+    )
+    target: Optional[Quantity] = Field(
+        default=None,
+        description="Target value"
+    )
+    range: Optional[QuantityRange] = Field(
+        default=None,
+        description="Allowed range"
+    )
+    criticality: Optional[InternedStr] = Field(
+        default=None,
+        description="Criticality"
+    )
+    control_method: Optional[InternedStr] = Field(
+        default=None,
+        description="Control method"
+    )
+    monitoring_frequency: Optional[InternedStr] = Field(
+        default=None,
+        description="Monitoring frequency"
+    )
+
+class RegimeFlow(BaseModel):
+    """Process flow of a technological regime"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    stream_id: OptionalStr = Field(
+        description="Stream identifier"
+    )
+    description: OptionalStr = Field(
+        description="Stream description"
+    )
+    flow_rate: Optional[PropertySpec] = Field(
+        default=None,
+        description="Flow rate target and range"
+    )
+    composition: QuantityMap = Field(
+        description="Stream composition"
+    )
+
+class EquipmentSetting(BaseModel):
+    """Settings of one equipment item"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    equipment_id: str = Field(
+        description="Equipment identifier"
+    )
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Equipment type"
+    )
+    settings: Optional[Dict[InternedStr, Union[Quantity, InternedStr]]] = Field(
+        default=None,
+        description="Setting values"
+    )
+
+class ControlSetpoint(BaseModel):
+    """Control loop setpoint of a regime"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    loop: OptionalStr = Field(
+        description="Control loop"
+    )
+    controller: OptionalStr = Field(
+        description="Controller tag"
+    )
+    setpoint: Optional[Quantity] = Field(
+        default=None,
+        description="Setpoint"
+    )
+    control_mode: Optional[InternedStr] = Field(
+        default=None,
+        description="Control mode"
+    )
+
+class OperatingConstraint(BaseModel):
+    """Constraint or interlock of a regime"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Constraint type"
+    )
+    condition: OptionalStr = Field(
+        description="Triggering condition"
+    )
+    limit: Optional[Quantity] = Field(
+        default=None,
+        description="Limit"
+    )
+    action: OptionalStr = Field(
+        description="Resulting action"
+    )
+
+class ControlStrategy(BaseModel):
+    """Control strategy of a regime"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    primary_controls: Optional[List[ControlSetpoint]] = Field(
+        default=None,
+        description="Primary control loops"
+    )
+    constraints: Optional[List[OperatingConstraint]] = Field(
+        default=None,
+        description="Operating constraints"
+    )
+    interlocks: Optional[List[OperatingConstraint]] = Field(
+        default=None,
+        description="Interlocks"
+    )
+
+class TransitionStep(BaseModel):
+    """Step of a regime transition"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    sequence: Optional[int] = Field(
+        default=None,
+        description="Step number"
+    )
+    action: OptionalStr = Field(
+        description="Action"
+    )
+    target: Optional[Quantity] = Field(
+        default=None,
+        description="Target value"
+    )
+    rate: Optional[Quantity] = Field(
+        default=None,
+        description="Rate of change"
+    )
+
+class RegimeTransition(BaseModel):
+    """Transition between two regimes"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    from_regime: Optional[InternedStr] = Field(
+        default=None,
+        description="Initial regime"
+    )
+    to_regime: Optional[InternedStr] = Field(
+        default=None,
+        description="Final regime"
+    )
+    conditions: StrTupleField = Field(
+        description="Required conditions"
+    )
+    steps: Optional[List[TransitionStep]] = Field(
+        default=None,
+        description="Transition steps"
+    )
+
+class MonitoringRequirement(BaseModel):
+    """Process monitoring requirement"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    parameter: str = Field(
+        description="Monitored parameter"
+    )
+    method: Optional[InternedStr] = Field(
+        default=None,
+        description="Monitoring method"
+    )
+    frequency: Optional[InternedStr] = Field(
+        default=None,
+        description="Monitoring frequency"
+    )
+    acceptance_criteria: QuantityMap = Field(
+        description="Acceptance criteria"
+    )
+
+class RawMaterialSupply(BaseModel):
+    """Raw material consumed in a regime"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    material: str = Field(
+        description="Material"
+    )
+    specification: OptionalStr = Field(
+        description="Material specification"
+    )
+    consumption: Optional[Quantity] = Field(
+        default=None,
+        description="Consumption rate"
+    )
+
+class RegimeMaterials(BaseModel):
+    """Materials and utilities of a regime"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    raw_materials: Optional[List[RawMaterialSupply]] = Field(
+        default=None,
+        description="Raw materials"
+    )
+    utilities: Optional[List[UtilityRequirement]] = Field(
+        default=None,
+        description="Utilities"
+    )
+
+class RecordRequirement(BaseModel):
+    """Record to be kept during a regime"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    document_type: InternedStr = Field(
+        description="Document type"
+    )
+    frequency: Optional[InternedStr] = Field(
+        default=None,
+        description="Recording frequency"
+    )
+    parameters: StrTupleField = Field(
+        description="Recorded parameters"
+    )
+    retention_period: Optional[Quantity] = Field(
+        default=None,
+        description="Retention period"
+    )
+
+class ProductSpecification(BaseModel):
+    """Model for product specifications and quality requirements"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    id: str = Field(
+        description="Unique product specification identifier"
+    )
+    name: str = Field(
+        description="Product name or designation"
+    )
+    grade: Optional[str] = Field(
+        default=None,
+        description="Product grade or quality level"
+    )
+    description: Optional[str] = Field(
+        default=None,
+        description="Detailed product description"
+    )
+    physical_properties: Optional[Dict[InternedStr, PropertySpec]] = Field(
+        default=None,
+        description="Physical properties and specifications"
+    )
+    chemical_properties: Optional[Dict[InternedStr, PropertySpec]] = Field(
+        default=None,
+        description="Chemical properties and composition specifications"
+    )
+    quality_requirements: Optional[List[QualityRequirement]] = Field(
+        default=None,
+        description="Critical quality parameters and requirements"
+    )
+    contaminant_limits: Optional[Dict[InternedStr, PropertySpec]] = Field(
+        default=None,
+        description="Maximum allowable contaminant levels"
+    )
+    storage_requirements: Optional[ProductStorage] = Field(
+        default=None,
+        description="Product storage specifications"
+    )
+    handling_requirements: Optional[ProductHandling] = Field(
+        default=None,
+        description="Product handling requirements"
+    )
+    testing_requirements: Optional[List[TestRequirement]] = Field(
+        default=None,
+        description="Quality testing requirements and procedures"
+    )
+    certification_requirements: Optional[CertificationRequirements] = Field(
+        default=None,
+        description="Product certification requirements"
+    )
+    regulatory_compliance: Optional[ProductCompliance] = Field(
+        default=None,
+        description="Regulatory requirements and standards"
+    )
+
+class ProcessDescription(BaseModel):
+    """Model for detailed process unit and operation descriptions"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    id: str = Field(
+        description="Unique process description identifier"
+    )
+    name: str = Field(
+        description="Name of the process unit or operation"
+    )
+    description: Optional[str] = Field(
+        default=None,
+        description="General description of the process"
+    )
+    process_stages: Optional[List[ProcessStage]] = Field(
+        default=None,
+        description="Sequential stages of the process"
+    )
+    process_chemistry: Optional[ProcessChemistry] = Field(
+        default=None,
+        description="Chemical reactions and transformations"
+    )
+    operating_conditions: Optional[Dict[InternedStr, Dict[InternedStr, QuantityOrLimits]]] = Field(
+        default=None,
+        description="Normal operating conditions and ranges"
+    )
+    process_controls: Optional[List[ControlPoint]] = Field(
+        default=None,
+        description="Critical process control systems"
+    )
+    safety_considerations: Optional[List[HazardControl]] = Field(
+        default=None,
+        description="Process safety considerations"
+    )
+    quality_requirements: Optional[Dict[InternedStr, Dict[InternedStr, QuantityRange]]] = Field(
+        default=None,
+        description="Product quality specifications"
+    )
+    utilities_required: Optional[List[UtilityRequirement]] = Field(
+        default=None,
+        description="Required process utilities"
+    )
+    environmental_aspects: Optional[EnvironmentalAspects] = Field(
+        default=None,
+        description="Environmental considerations and impacts"
+    )
+
+class MaterialBalance(BaseModel):
+    """Model for process material balance calculations and tracking"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    id: str = Field(
+        description="Unique material balance identifier"
+    )
+    stage_id: str = Field(
+        description="Process stage or unit operation identifier"
+    )
+    period: Optional[BalancePeriod] = Field(
+        default=None,
+        description="Time period for material balance"
+    )
+    input_streams: Optional[List[BalanceStream]] = Field(
+        default=None,
+        description="Input process streams and their quantities"
+    )
+    output_streams: Optional[List[BalanceStream]] = Field(
+        default=None,
+        description="Output process streams and their quantities"
+    )
+    process_losses: Optional[List[ProcessLoss]] = Field(
+        default=None,
+        description="Process losses and their categorization"
+    )
+    conversion_yields: QuantityMap = Field(
+        description="Process conversion and yield calculations"
+    )
+    component_balances: Optional[List[ComponentBalance]] = Field(
+        default=None,
+        description="Individual component material balances"
+    )
+    balance_checks: Optional[BalanceCheck] = Field(
+        default=None,
+        description="Material balance validation and checks"
+    )
+    inventory_changes: Optional[List[InventoryChange]] = Field(
+        default=None,
+        description="Process inventory changes during balance period"
+    )
+    key_performance_indicators: PerformanceMetrics = Field(
+        description="Material balance related performance indicators"
+    )
+    reconciliation_data: Optional[Reconciliation] = Field(
+        default=None,
+        description="Data reconciliation information"
+    )
+
+    def balance_columns(self) -> Dict[str, List[Any]]:
+        """component_balances as columns: {"component": [...], "input": [...], ...}.
+
+        input, output, accumulated, lost and closure are plain floats (None
+        where absent), so closure checks and reconciliation walk aligned flat
+        lists, or numpy.asarray of them, instead of the row objects.
+        """
+        rows = self.component_balances or ()
+        columns: Dict[str, List[Any]] = {"component": [r.component for r in rows]}
+        for name in ("input", "output", "accumulated", "lost", "closure"):
+            columns[name] = [getattr(getattr(r, name), "value", None) for r in rows]
+        return columns
+
+    def component_balance_matrix(
+        self, missing_flow: Optional[float] = None
+    ) -> Tuple[List[str], List[Optional[float]], List[List[float]]]:
+        """Dense (components, flows, compositions) of all input and output streams.
+
+        components is the first-seen order of component names; each row of
+        compositions is one stream's composition_vector over it. Input flows
+        are positive and output flows negative, so the per-column sums of
+        flow * row[j] (flows @ compositions with numpy) are input minus
+        output of each component. A stream without a quantity gets
+        `missing_flow` as is (None by default; pass e.g. 0.0 for numeric
+        use).
+        """
+        inputs, outputs = self.input_streams or (), self.output_streams or ()
+        streams = [*inputs, *outputs]
+        components = list(dict.fromkeys(c.component for s in streams for c in s.composition or ()))
+        flows = [
+            (sign * s.quantity.value if s.quantity else missing_flow)
+            for sign, group in ((1.0, inputs), (-1.0, outputs)) for s in group
+        ]
+        return components, flows, [s.composition_vector(components) for s in streams]
+
+    def closure_vector(self) -> List[Optional[float]]:
+        """Mass closure of each component balance in percent:
+        (output + accumulated + lost) / input * 100.
+
+        Missing accumulated / lost count as zero; the closure is None where
+        input or output is missing or input is zero.
+        """
+        cols = self.balance_columns()
+        return [
+            (out + (acc or 0.0) + (lost or 0.0)) / inp * 100 if inp and out is not None else None
+            for inp, out, acc, lost in zip(cols["input"], cols["output"], cols["accumulated"], cols["lost"])
+        ]
+
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> 'MaterialBalance':
+        """Parse and validate a raw JSON document in one pydantic-core pass.
+
+        Stream compositions are validated as typed ComponentFraction rows
+        while the JSON is parsed, with no intermediate dict tree. For a JSON
+        array of records use MaterialBalanceList.validate_json(raw).
+        """
+        return cls.model_validate_json(raw)
+
+class ProcessControl(BaseModel):
+    """Model for process control systems and control strategies"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    id: str = Field(
+        description="Unique process control identifier"  # PC-2024-UNIT100-01, Process Control for Unit 100, loop 01
+    )
+    parameter: str = Field(
+        description="Process parameter being controlled"  # reactor_temperature, pressure, flow, level, composition
+    )
+    method: InternedStr = Field(
+        description="Control method or strategy"  # cascade_control, PID, feedforward, ratio, override
+    )
+    description: Optional[str] = Field(
+        default=None,
+        description="Detailed description of control strategy"
+    )
+    control_objective: Optional[ControlObjective] = Field(
+        default=None,
+        description="Control objectives and requirements"
+    )
+    control_configuration: Optional[ControlConfiguration] = Field(
+        default=None,
+        description="Control loop configuration details"
+    )
+    instruments: Optional[List[ControlInstrument]] = Field(
+        default=None,
+        description="Control instruments and devices"
+    )
+    operating_ranges: Optional[Dict[InternedStr, QuantityRange]] = Field(
+        default=None,
+        description="Operating ranges and limits"
+    )
+    alarms: Optional[List[AlarmPoint]] = Field(
+        default=None,
+        description="Associated alarms and alerts"
+    )
+    interlocks: Optional[List[AlarmPoint]] = Field(
+        default=None,
+        description="Safety interlocks and trips"
+    )
+    performance_metrics: Optional[Dict[InternedStr, Dict[InternedStr, Union[Quantity, float]]]] = Field(
+        default=None,
+        description="Control performance indicators"
+    )
+    tuning_history: Optional[List[TuningRecord]] = Field(
+        default=None,
+        description="Controller tuning history"
+    )
+    maintenance_requirements: Optional[List[ControlMaintenance]] = Field(
+        default=None,
+        description="Control system maintenance requirements"
+    )
+
+class TechnologicalRegime(BaseModel):
+    """Model for process technological regimes and operating modes"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
+    id: str = Field(
+        description="Unique technological regime identifier"
+    )
+    name: str = Field(
+        description="Name of the technological regime"  # Normal Production Mode, startup_mode, turndown_mode, regeneration_mode
+    )
+    description: Optional[str] = Field(
+        default=None,
+        description="Detailed description of the technological regime"
+    )
+    operating_parameters: Optional[List[RegimeParameter]] = Field(
+        default=None,
+        description="Critical operating parameters for the regime"
+    )
+    process_flows: Optional[List[RegimeFlow]] = Field(
+        default=None,
+        description="Process flow specifications"
+    )
+    equipment_settings: Optional[List[EquipmentSetting]] = Field(
+        default=None,
+        description="Equipment-specific settings and configurations"
+    )
+    control_strategy: Optional[ControlStrategy] = Field(
+        default=None,
+        description="Process control strategy for the regime"
+    )
+    performance_targets: Optional[Dict[InternedStr, PropertySpec]] = Field(
+        default=None,
+        description="Performance targets and KPIs"
+    )
+    operational_limits: Optional[Dict[InternedStr, Dict[InternedStr, Quantity]]] = Field(
+        default=None,
+        description="Operating limits and constraints"
+    )
+    transition_requirements: Optional[List[RegimeTransition]] = Field(
+        default=None,
+        description="Requirements for regime transitions"
+    )
+    monitoring_requirements: Optional[List[MonitoringRequirement]] = Field(
+        default=None,
+        description="Process monitoring requirements"
+    )
+    material_requirements: Optional[RegimeMaterials] = Field(
+        default=None,
+        description="Material and utility requirements"
+    )
+    documentation_requirements: Optional[List[RecordRequirement]] = Field(
+        default=None,
+        description="Required documentation and records"
+    )
+
+    def limits_table(self) -> Tuple[List[str], List[Tuple[Optional[float], Optional[float], Optional[float]]]]:
+        """operating_parameters flattened to (names, [(target, min, max), ...]).
+
+        Bounds given as quantities are reduced to their numbers; None where
+        a value is absent.
+        """
+        names, rows = [], []
+        for p in self.operating_parameters or ():
+            bounds = p.range or QuantityRange()
+            names.append(p.parameter)
+            rows.append((
+                p.target.value if p.target else None,
+                getattr(bounds.min, "value", bounds.min),
+                getattr(bounds.max, "value", bounds.max),
+            ))
+        return names, rows
+
+    def check(self, readings: Dict[str, float]) -> Dict[str, Optional[bool]]:
+        """Whether each reading lies within its parameter's [min, max] range.
+
+        Open bounds are not checked; None for parameters without a reading.
+        """
+        names, rows = self.limits_table()
+        result: Dict[str, Optional[bool]] = {}
+        for name, (_, low, high) in zip(names, rows):
+            value = readings.get(name)
+            result[name] = None if value is None else (
+                (low is None or low <= value) and (high is None or value <= high)
+            )
+        return result
+
+class SafetyScope(BaseModel):
+    """Equipment, conditions and phases covered by a safety requirement"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    equipment_covered: StrTupleField = Field(
+        description="Covered equipment"
+    )
+    process_conditions: Optional[Dict[InternedStr, Limits]] = Field(
+        default=None,
+        description="Process condition ranges"
+    )
+    operational_phases: VocabTupleField = Field(
+        description="Covered operational phases"
+    )
+
+class ProtectionLayer(BaseModel):
+    """Independent layer of protection"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    layer: InternedStr = Field(
+        description="Protection layer"
+    )
+    description: OptionalStr = Field(
+        description="Layer description"
+    )
+    components: StrTupleField = Field(
+        description="Instruments and devices of the layer"
+    )
+    effectiveness: Optional[Quantity] = Field(
+        default=None,
+        description="Layer effectiveness"
+    )
+    response_time: Optional[Quantity] = Field(
+        default=None,
+        description="Response time"
+    )
+    setpoint: Optional[Quantity] = Field(
+        default=None,
+        description="Alarm or trip setpoint"
+    )
+    operator_response_time: Optional[Quantity] = Field(
+        default=None,
+        description="Required operator response time"
+    )
+    sil_level: Optional[InternedStr] = Field(
+        default=None,
+        validation_alias=AliasChoices("sil_level", "SIL_level"),
+        description="Safety integrity level"
+    )
+    test_interval: Optional[Quantity] = Field(
+        default=None,
+        description="Proof test interval"
+    )
+
+class CriticalParameter(BaseModel):
+    """Safety-critical process parameter"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    parameter: str = Field(
+        description="Parameter name"
+    )
+    normal_range: Optional[Limits] = Field(
+        default=None,
+        description="Normal operating range"
+    )
+    alarm_settings: QuantityMap = Field(
+        description="Alarm setpoints (high, high_high, ...)"
+    )
+    trip_point: Optional[Quantity] = Field(
+        default=None,
+        description="Trip setpoint"
+    )
+    relief_setting: Optional[Quantity] = Field(
+        default=None,
+        description="Relief setting"
+    )
+
+class SafetyDevice(BaseModel):
+    """Safety device such as a relief or shutdown valve"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    type: InternedStr = Field(
+        description="Device type"
+    )
+    tag: OptionalStr = Field(
+        description="Device tag"
+    )
+    capacity: Optional[Quantity] = Field(
+        default=None,
+        description="Relieving capacity"
+    )
+    set_pressure: Optional[Quantity] = Field(
+        default=None,
+        description="Set pressure"
+    )
+    certification: Optional[InternedStr] = Field(
+        default=None,
+        description="Certification code"
+    )
+    inspection_interval: Optional[Quantity] = Field(
+        default=None,
+        description="Inspection interval"
+    )
+    fail_position: Optional[InternedStr] = Field(
+        default=None,
+        description="Fail-safe position"
+    )
+    closure_time: Optional[Quantity] = Field(
+        default=None,
+        description="Closure time"
+    )
+    testing_frequency: Optional[Quantity] = Field(
+        default=None,
+        description="Testing interval"
+    )
+
+class OperatingProcedure(BaseModel):
+    """Operating procedure and its key steps"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    title: str = Field(
+        description="Procedure title"
+    )
+    document_number: OptionalStr = Field(
+        description="Procedure document number"
+    )
+    revision: OptionalStr = Field(
+        description="Procedure revision"
+    )
+    steps: StrTupleField = Field(
+        validation_alias=AliasChoices("steps", "key_steps"),
+        description="Procedure steps"
+    )
+    critical_parameters: StrTupleField = Field(
+        description="Parameters watched during the procedure"
+    )
+    required_training: Optional[InternedStr] = Field(
+        default=None,
+        description="Required training level"
+    )
+
+class SafetyMaintenanceTask(BaseModel):
+    """Maintenance task of a safety device"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    equipment: str = Field(
+        description="Maintained device"
+    )
+    task: OptionalStr = Field(
+        description="Task"
+    )
+    frequency: Optional[Quantity] = Field(
+        default=None,
+        description="Task interval"
+    )
+    acceptance_criteria: OptionalStr = Field(
+        description="Acceptance criteria"
+    )
+    required_certification: Optional[InternedStr] = Field(
+        default=None,
+        description="Certification required to perform the task"
+    )
+
+class TrainingCourse(BaseModel):
+    """Required training"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    course: OptionalStr = Field(
+        description="Course name"
+    )
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Training type"
+    )
+    frequency: Optional[InternedStr] = Field(
+        default=None,
+        description="Training frequency"
+    )
+    target_audience: OptionalStr = Field(
+        description="Target audience"
+    )
+    target_personnel: VocabTupleField = Field(
+        description="Target personnel groups"
+    )
+
+class PPEItem(BaseModel):
+    """Personal protective equipment requirement"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    type: InternedStr = Field(
+        description="PPE type"
+    )
+    specification: OptionalStr = Field(
+        description="PPE specification"
+    )
+    conditions_for_use: OptionalStr = Field(
+        description="When the PPE is required"
+    )
+
+class PersonnelSafety(BaseModel):
+    """Training, PPE and certifications required of personnel"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    training_requirements: Optional[List[TrainingCourse]] = Field(
+        default=None,
+        description="Required training"
+    )
+    ppe_requirements: Optional[List[PPEItem]] = Field(
+        default=None,
+        description="Required PPE"
+    )
+    certifications_required: VocabTupleField = Field(
+        description="Required certifications and permits"
+    )
+
+class EmergencyResponse(BaseModel):
+    """Emergency procedures, equipment and communication"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    emergency_procedures: StrTupleField = Field(
+        description="Emergency procedures"
+    )
+    emergency_equipment: StrTupleField = Field(
+        description="Emergency equipment"
+    )
+    communication_protocol: Optional[Dict[InternedStr, str]] = Field(
+        default=None,
+        description="Communication channels (primary, backup, ...)"
+    )
+
+class InspectionRequirement(BaseModel):
+    """Required inspection"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    type: InternedStr = Field(
+        description="Inspection type"
+    )
+    frequency: Optional[InternedStr] = Field(
+        default=None,
+        description="Inspection frequency"
+    )
+    authority: OptionalStr = Field(
+        description="Inspecting authority"
+    )
+
+class SafetyCompliance(BaseModel):
+    """Standards, permits and inspections a safety requirement must meet"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    standards: VocabTupleField = Field(
+        description="Applicable standards"
+    )
+    permits_required: VocabTupleField = Field(
+        description="Required permits"
+    )
+    inspections: Optional[List[InspectionRequirement]] = Field(
+        default=None,
+        description="Required inspections"
+    )
+
+class SafetyDocument(BaseModel):
+    """Controlled safety document"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    type: InternedStr = Field(
+        description="Document type"
+    )
+    document_number: OptionalStr = Field(
+        description="Document number"
+    )
+    revision: OptionalStr = Field(
+        description="Document revision"
+    )
+    review_frequency: Optional[InternedStr] = Field(
+        default=None,
+        description="Review frequency"
+    )
+
+class RevisionRecord(BaseModel):
+    """Entry of a document revision history"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    revision: str = Field(
+        description="Revision"
+    )
+    date: Optional[datetime] = Field(
+        default=None,
+        description="Revision date (ISO 8601)"
+    )
+    changes: OptionalStr = Field(
+        description="Summary of changes"
+    )
+    approved_by: OptionalStr = Field(
+        description="Approver"
+    )
+
+class RevisionControl(BaseModel):
+    """Revision status of a document"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    current_revision: OptionalStr = Field(
+        description="Current revision"
+    )
+    revision_date: Optional[datetime] = Field(
+        default=None,
+        description="Date of the current revision (ISO 8601)"
+    )
+    revision_history: Optional[List[RevisionRecord]] = Field(
+        default=None,
+        description="Revision history"
+    )
+    next_review_date: Optional[datetime] = Field(
+        default=None,
+        description="Next review date (ISO 8601)"
+    )
+
+class DocumentSection(BaseModel):
+    """Section of a document"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    number: OptionalStr = Field(
+        description="Section number"
+    )
+    title: str = Field(
+        description="Section title"
+    )
+    subsections: StrTupleField = Field(
+        description="Subsection headings"
+    )
+
+class ContentStructure(BaseModel):
+    """Table of contents of a document"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    sections: Optional[List[DocumentSection]] = Field(
+        default=None,
+        description="Sections"
+    )
+    appendices: StrTupleField = Field(
+        description="Appendices"
+    )
+
+class RelatedEquipment(BaseModel):
+    """Equipment described by a document"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    equipment_id: str = Field(
+        description="Equipment identifier"
+    )
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Equipment type"
+    )
+    description: OptionalStr = Field(
+        description="Equipment description"
+    )
+    related_systems: VocabTupleField = Field(
+        description="Related systems"
+    )
+
+class SafetyInformation(BaseModel):
+    """Hazards and protective measures"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    hazards: VocabTupleField = Field(
+        description="Hazards"
+    )
+    protective_measures: VocabTupleField = Field(
+        description="Protective measures"
+    )
+
+class TechnicalContent(BaseModel):
+    """Technical content of a document"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    design_basis: QuantityMap = Field(
+        description="Design basis values"
+    )
+    operating_procedures: Optional[List[OperatingProcedure]] = Field(
+        default=None,
+        description="Operating procedures"
+    )
+    safety_information: Optional[SafetyInformation] = Field(
+        default=None,
+        description="Safety information"
+    )
+
+class Approval(BaseModel):
+    """Approval of a document"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    name: str = Field(
+        description="Approver name"
+    )
+    role: OptionalStr = Field(
+        description="Approver role"
+    )
+    date: Optional[datetime] = Field(
+        default=None,
+        description="Approval date (ISO 8601)"
+    )
+
+class ApprovalStatus(BaseModel):
+    """Approval state of a document"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    status: Optional[InternedStr] = Field(
+        default=None,
+        description="Approval status"
+    )
+    approvers: Optional[List[Approval]] = Field(
+        default=None,
+        description="Approvals"
+    )
+    validity_period: Optional[Quantity] = Field(
+        default=None,
+        description="Validity period"
+    )
+
+class ControlledCopy(BaseModel):
+    """Controlled paper copy of a document"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    copy_number: OptionalStr = Field(
+        description="Copy number"
+    )
+    location: OptionalStr = Field(
+        description="Copy location"
+    )
+    holder: OptionalStr = Field(
+        description="Copy holder"
+    )
+
+class DistributionControl(BaseModel):
+    """Access and distribution of a document"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    access_level: Optional[InternedStr] = Field(
+        default=None,
+        description="Access level"
+    )
+    authorized_users: VocabTupleField = Field(
+        description="Authorized user groups"
+    )
+    controlled_copies: Optional[List[ControlledCopy]] = Field(
+        default=None,
+        description="Controlled copies"
+    )
+    electronic_access: Optional[Dict[InternedStr, str]] = Field(
+        default=None,
+        description="Electronic access settings (path, permissions)"
+    )
+
+class ChangeRequest(BaseModel):
+    """Change request against a document"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    request_id: str = Field(
+        description="Change request identifier"
+    )
+    description: OptionalStr = Field(
+        description="Requested change"
+    )
+    status: Optional[InternedStr] = Field(
+        default=None,
+        description="Request status"
+    )
+    date: Optional[datetime] = Field(
+        default=None,
+        description="Request date (ISO 8601)"
+    )
+
+class ChangeManagement(BaseModel):
+    """Management of changes to a document"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    change_procedure: OptionalStr = Field(
+        description="Change procedure"
+    )
+    change_requests: Optional[List[ChangeRequest]] = Field(
+        default=None,
+        description="Change requests"
+    )
+    verification_requirements: VocabTupleField = Field(
+        description="Required reviews"
+    )
+
+class CompetencyCheck(BaseModel):
+    """Verification of trained competency"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    method: Optional[InternedStr] = Field(
+        default=None,
+        description="Verification method"
+    )
+    passing_score: Optional[Quantity] = Field(
+        default=None,
+        description="Passing score"
+    )
+
+class TrainingPlan(BaseModel):
+    """Training required for a document"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    required_training: Optional[List[TrainingCourse]] = Field(
+        default=None,
+        description="Required training"
+    )
+    competency_verification: Optional[CompetencyCheck] = Field(
+        default=None,
+        description="Competency verification"
+    )
+
+class Attachment(BaseModel):
+    """File attached to a document"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    file_name: str = Field(
+        description="File name"
+    )
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Attachment type"
+    )
+    revision: OptionalStr = Field(
+        description="Attachment revision"
+    )
+    file_path: OptionalStr = Field(
+        description="Storage path"
+    )
+
+class SystemBoundaries(BaseModel):
+    """Boundaries of a process system"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    upstream_systems: StrTupleField = Field(
+        description="Upstream systems"
+    )
+    downstream_systems: StrTupleField = Field(
+        description="Downstream systems"
+    )
+    utility_systems: StrTupleField = Field(
+        description="Utility systems"
+    )
+    battery_limits: Optional[Dict[InternedStr, str]] = Field(
+        default=None,
+        description="Battery limits by direction"
+    )
+
+class Subsystem(BaseModel):
+    """Subsystem of a process system"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    id: OptionalStr = Field(
+        description="Subsystem identifier"
+    )
+    name: str = Field(
+        description="Subsystem name"
+    )
+    description: OptionalStr = Field(
+        description="Subsystem description"
+    )
+    equipment: StrTupleField = Field(
+        description="Subsystem equipment"
+    )
+    key_parameters: StrTupleField = Field(
+        description="Key parameters"
+    )
+
+class SystemFlow(BaseModel):
+    """Main process flow of a process system"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    id: OptionalStr = Field(
+        description="Flow identifier"
+    )
+    name: OptionalStr = Field(
+        description="Flow name"
+    )
+    type: Optional[InternedStr] = Field(
+        default=None,
+        description="Flow type"
+    )
+    from_id: OptionalStr = Field(
+        validation_alias=AliasChoices("from_id", "from"),
+        description="Source of the flow"
+    )
+    to_id: OptionalStr = Field(
+        validation_alias=AliasChoices("to_id", "to"),
+        description="Destination of the flow"
+    )
+    normal_flow: Optional[Quantity] = Field(
+        default=None,
+        description="Normal flow rate"
+    )
+
+class CriticalControl(BaseModel):
+    """Critical control of a process system"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    parameter: str = Field(
+        description="Controlled parameter"
+    )
+    strategy: Optional[InternedStr] = Field(
+        default=None,
+        description="Control strategy"
+    )
+    importance: Optional[InternedStr] = Field(
+        default=None,
+        description="Importance"
+    )
+
+class ControlPhilosophy(BaseModel):
+    """Control objectives and hierarchy of a process system"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    control_objectives: StrTupleField = Field(
+        description="Control objectives"
+    )
+    critical_controls: Optional[List[CriticalControl]] = Field(
+        default=None,
+        description="Critical controls"
+    )
+    control_hierarchy: Optional[Dict[InternedStr, str]] = Field(
+        default=None,
+        description="Control layers (regulatory, advanced, optimization)"
+    )
+
+class OperatingMode(BaseModel):
+    """Operating mode of a process system"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    mode: InternedStr = Field(
+        description="Mode name"
+    )
+    description: OptionalStr = Field(
+        description="Mode description"
+    )
+    key_setpoints: QuantityMap = Field(
+        description="Key setpoints of the mode"
+    )
+
+class SafetyFunction(BaseModel):
+    """Safety instrumented function of a process system"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    id: OptionalStr = Field(
+        description="Function identifier"
+    )
+    type: InternedStr = Field(
+        description="Function type"
+    )
+    coverage: OptionalStr = Field(
+        description="Covered area"
+    )
+    sil_level: Optional[InternedStr] = Field(
+        default=None,
+        description="Safety integrity level"
+    )
+    critical_actions: StrTupleField = Field(
+        description="Actions taken on demand"
+    )
+
+class IntegrationPoint(BaseModel):
+    """Interface of a process system with other systems"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    type: InternedStr = Field(
+        description="Interface type"
+    )
+    stream: OptionalStr = Field(
+        description="Exchanged stream"
+    )
+    service: OptionalStr = Field(
+        description="Exchanged service"
+    )
+    source: OptionalStr = Field(
+        description="Supplying system"
+    )
+    criticality: Optional[InternedStr] = Field(
+        default=None,
+        description="Criticality"
+    )
+    requirements: QuantityMap = Field(
+        description="Supply requirements"
+    )
+
+class MaintenanceStrategy(BaseModel):
+    """Maintenance philosophy of a process system"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    philosophy: Optional[InternedStr] = Field(
+        default=None,
+        description="Maintenance philosophy"
+    )
+    critical_equipment: StrTupleField = Field(
+        description="Critical equipment"
+    )
+    maintenance_intervals: QuantityMap = Field(
+        description="Maintenance intervals"
+    )
+
+class DepositAnalysis(BaseModel):
+    """Laboratory analysis of equipment deposits"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    last_analysis_date: Optional[datetime] = Field(
+        default=None,
+        description="Date of the last analysis (ISO 8601)"
+    )
+    composition: Optional[Dict[InternedStr, str]] = Field(
+        default=None,
+        description="Deposit composition as reported"
     )
-    tuning_history: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Controller tuning history",
-        example=[
-            {
-                "date": "2024-01-15",
-                "reason": "oscillatory_response",
-                "method": "lambda_tuning",
-                "parameters": {
-                    "kp": 2.5,
-                    "ti": 300,
-                    "td": 0
-                },
-                "performance_improvement": {"value": 30, "unit": "percent"}
-            }
-        ]
+    physical_properties: Optional[Dict[InternedStr, str]] = Field(
+        default=None,
+        description="Physical properties as reported"
     )
-    maintenance_requirements: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Control system maintenance requirements",
-        example=[
-            {
-                "item": "control_valve",
-                "task": "stroke_test",
-                "frequency": {"value": 6, "unit": "months"},
-                "acceptance_criteria": "full_stroke_5_seconds"
-            },
-            {
-                "item": "temperature_transmitter",
-                "task": "calibration",
-                "frequency": {"value": 12, "unit": "months"},
-                "acceptance_criteria": "accuracy_within_0.1_degree"
-            }
-        ]
+    chemical_analysis: Optional[Dict[InternedStr, Union[float, str]]] = Field(
+        default=None,
+        description="Chemical analysis results"
     )
 
-class TechnologicalRegime(BaseModel):
-    """Model for process technological regimes and operating modes"""
-    id: str = Field(
-        description="Unique technological regime identifier",
-        example="TR-2024-UNIT100-001"  # Technological Regime for Unit 100
-    )
-    name: str = Field(
-        description="Name of the technological regime",
-        example="Normal Production Mode"  # startup_mode, turndown_mode, regeneration_mode
+class FoulingDynamics(BaseModel):
+    """Fouling rate and its drivers"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    rate: Optional[Quantity] = Field(
+        default=None,
+        description="Fouling rate"
     )
-    description: Optional[str] = Field(
+    pattern: Optional[InternedStr] = Field(
         default=None,
-        description="Detailed description of the technological regime",
-        example="Standard operating regime for catalytic reforming unit at 100% design capacity"
+        description="Growth pattern"
     )
-    operating_parameters: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Critical operating parameters for the regime",
-        example=[
-            {
-                "parameter": "reactor_temperature",
-                "target": {"value": 510, "unit": "°C"},
-                "range": {
-                    "min": {"value": 500, "unit": "°C"},
-                    "max": {"value": 520, "unit": "°C"}
-                },
-                "criticality": "high",
-                "control_method": "cascade_control",
-                "monitoring_frequency": "continuous"
-            },
-            {
-                "parameter": "system_pressure",
-                "target": {"value": 15, "unit": "barg"},
-                "range": {
-                    "min": {"value": 14, "unit": "barg"},
-                    "max": {"value": 16, "unit": "barg"}
-                },
-                "criticality": "high",
-                "control_method": "direct_control",
-                "monitoring_frequency": "continuous"
-            }
-        ]
+    seasonal_factors: StrTupleField = Field(
+        description="Seasonal factors"
     )
-    process_flows: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Process flow specifications",
-        example=[
-            {
-                "stream_id": "F-101",
-                "description": "Fresh feed",
-                "flow_rate": {
-                    "target": {"value": 100, "unit": "m3/h"},
-                    "range": {"min": 90, "max": 110, "unit": "m3/h"}
-                },
-                "composition": {
-                    "naphtha": {"value": 98, "unit": "wt%"},
-                    "light_ends": {"value": 2, "unit": "wt%"}
-                }
-            }
-        ]
+    contributing_factors: StrTupleField = Field(
+        description="Contributing factors"
     )
-    equipment_settings: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Equipment-specific settings and configurations",
-        example=[
-            {
-                "equipment_id": "P-101",
-                "type": "centrifugal_pump",
-                "settings": {
-                    "speed": {"value": 3000, "unit": "rpm"},
-                    "minimum_flow": {"value": 20, "unit": "m3/h"},
-                    "seal_flush": "enabled"
-                }
-            },
-            {
-                "equipment_id": "E-101",
-                "type": "heat_exchanger",
-                "settings": {
-                    "bypass_position": {"value": 0, "unit": "percent"},
-                    "temperature_approach": {"value": 10, "unit": "°C"}
-                }
-            }
-        ]
+
+class CleaningEvent(BaseModel):
+    """Cleaning recorded in a cleanliness passport"""
+    model_config = ConfigDict(defer_build=True, extra="allow", json_schema_extra=_inject_examples)
+
+    date: Optional[datetime] = Field(
+        default=None,
+        description="Cleaning date (ISO 8601)"
     )
-    control_strategy: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Process control strategy for the regime",
-        example={
-            "primary_controls": [
-                {
-                    "loop": "temperature_control",
-                    "controller": "TIC-101",
-                    "setpoint": {"value": 510, "unit": "°C"},
-                    "control_mode": "cascade"
-                }
-            ],
-            "constraints": [
-                {
-                    "type": "maximum_temperature_rise",
-                    "limit": {"value": 50, "unit": "°C/h"},
-                    "action": "rate_limiting"
-                }
-            ],
-            "interlocks": [
-                {
-                    "condition": "high_temperature",
-                    "limit": {"value": 530, "unit": "°C"},
-                    "action": "emergency_shutdown"
-                }
-            ]
-        }
+    method: OptionalStr = Field(
+        description="Cleaning method"
     )
-    performance_targets: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Performance targets and KPIs",
-        example={
-            "conversion": {"target": 95, "unit": "percent"},
-            "selectivity": {"target": 90, "unit": "percent"},
-            "product_quality": {
-                "octane_number": {"target": 98, "minimum": 97},
-                "yield": {"target": 85, "unit": "percent"}
-            },
-            "energy_efficiency": {
-                "specific_consumption": {"target": 2.5, "unit": "GJ/ton"}
-            }
-        }
+    contractor: OptionalStr = Field(
+        description="Contractor"
     )
-    operational_limits: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Operating limits and constraints",
-        example={
-            "safety_limits": {
-                "maximum_pressure": {"value": 20, "unit": "barg"},
-                "maximum_temperature": {"value": 550, "unit": "°C"}
-            },
-            "equipment_limits": {
-                "maximum_throughput": {"value": 120, "unit": "m3/h"},
-                "minimum_turndown": {"value": 40, "unit": "percent"}
-            },
-            "quality_limits": {
-                "maximum_sulfur": {"value": 0.5, "unit": "ppm"},
-                "minimum_octane": {"value": 95, "unit": "RON"}
-            }
-        }
+    duration: OptionalStr = Field(
+        description="Duration as reported"
     )
-    transition_requirements: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Requirements for regime transitions",
-        example=[
-            {
-                "from_regime": "startup",
-                "to_regime": "normal_operation",
-                "conditions": [
-                    "reactor_temperature_stable",
-                    "product_quality_in_spec"
-                ],
-                "steps": [
-                    {
-                        "sequence": 1,
-                        "action": "increase_feed_rate",
-                        "target": {"value": 100, "unit": "m3/h"},
-                        "rate": {"value": 10, "unit": "m3/h/hour"}
-                    }
-                ]
-            }
-        ]
+    effectiveness: OptionalStr = Field(
+        description="Effectiveness as reported"
     )
-    monitoring_requirements: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Process monitoring requirements",
-        example=[
-            {
-                "parameter": "catalyst_activity",
-                "method": "temperature_profile",
-                "frequency": "hourly",
-                "acceptance_criteria": {
-                    "maximum_deviation": {"value": 5, "unit": "°C"}
-                }
-            }
-        ]
+    cost: Optional[float] = Field(
+        default=None,
+        description="Cleaning cost"
     )
-    material_requirements: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Material and utility requirements",
-        example={
-            "raw_materials": [
-                {
-                    "material": "naphtha",
-                    "specification": "low_sulfur",
-                    "consumption": {"value": 100, "unit": "m3/h"}
-                }
-            ],
-            "utilities": [
-                {
-                    "utility": "steam",
-                    "pressure": {"value": 40, "unit": "barg"},
-                    "consumption": {"value": 10, "unit": "tons/h"}
-                }
-            ]
-        }
+    observations: OptionalStr = Field(
+        description="Observations"
     )
-    documentation_requirements: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Required documentation and records",
-        example=[
-            {
-                "document_type": "operating_log",
-                "frequency": "per_shift",
-                "parameters": ["temperatures", "pressures", "flows"],
-                "retention_period": {"value": 5, "unit": "years"}
-            }
-        ]
+    post_cleaning_inspection: OptionalStr = Field(
+        description="Post-cleaning inspection result"
+    )
+    next_cleaning_due: Optional[datetime] = Field(
+        default=None,
+        description="Next cleaning due date (ISO 8601)"
     )
 
 class SafetyRequirement(BaseModel):
     """Model for process safety requirements and safety systems"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Unique safety requirement identifier",
-        example="SR-2024-R101-001"  # Safety Requirement for Reactor 101
+        description="Unique safety requirement identifier"
     )
     category: str = Field(
-        description="Category of safety requirement",
-        example="process_safety"  # personnel_safety, environmental_safety, equipment_protection
+        description="Category of safety requirement"  # process_safety, personnel_safety, environmental_safety, equipment_protection
     )
     description: Optional[str] = Field(
         default=None,
-        description="Detailed description of safety requirement",
-        example="High pressure protection system for reactor R-101 including pressure relief, emergency shutdown, and alarm systems"
+        description="Detailed description of safety requirement"
     )
-    scope: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Scope and applicability of safety requirement",
-        example={
-            "equipment_covered": ["R-101", "P-101", "E-101"],
-            "process_conditions": {
-                "pressure_range": {"max": 50, "unit": "barg"},
-                "temperature_range": {"max": 350, "unit": "°C"}
-            },
-            "operational_phases": [
-                "normal_operation",
-                "startup",
-                "shutdown",
-                "emergency"
-            ]
-        }
+    scope: Optional[SafetyScope] = Field(
+        default=None,
+        description="Scope and applicability of safety requirement"
     )
-    protection_layers: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Layers of protection analysis",
-        example=[
-            {
-                "layer": "basic_process_control",
-                "description": "Pressure control system",
-                "components": ["PIC-101", "PCV-101"],
-                "effectiveness": {"value": 99, "unit": "percent"},
-                "response_time": {"value": 30, "unit": "seconds"}
-            },
-            {
-                "layer": "alarm_system",
-                "description": "High pressure alarm",
-                "components": ["PAH-101"],
-                "setpoint": {"value": 45, "unit": "barg"},
-                "operator_response_time": {"value": 2, "unit": "minutes"}
-            },
-            {
-                "layer": "safety_instrumented_system",
-                "description": "Emergency shutdown system",
-                "components": ["PSH-101", "XV-101"],
-                "SIL_level": "SIL-2",
-                "test_interval": {"value": 6, "unit": "months"}
-            }
-        ]
+    protection_layers: Optional[List[ProtectionLayer]] = Field(
+        default=None,
+        description="Layers of protection analysis"
     )
-    critical_parameters: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Critical safety parameters and limits",
-        example=[
-            {
-                "parameter": "pressure",
-                "normal_range": {"min": 30, "max": 40, "unit": "barg"},
-                "alarm_settings": {
-                    "high": {"value": 45, "unit": "barg"},
-                    "high_high": {"value": 47, "unit": "barg"}
-                },
-                "trip_point": {"value": 48, "unit": "barg"},
-                "relief_setting": {"value": 50, "unit": "barg"}
-            }
-        ]
+    critical_parameters: Optional[List[CriticalParameter]] = Field(
+        default=None,
+        description="Critical safety parameters and limits"
     )
-    safety_systems: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Required safety systems and devices",
-        example=[
-            {
-                "type": "pressure_relief_valve",
-                "tag": "PSV-101",
-                "capacity": {"value": 50000, "unit": "kg/h"},
-                "set_pressure": {"value": 50, "unit": "barg"},
-                "certification": "ASME_VIII",
-                "inspection_interval": {"value": 2, "unit": "years"}
-            },
-            {
-                "type": "emergency_shutdown_valve",
-                "tag": "XV-101",
-                "fail_position": "closed",
-                "closure_time": {"value": 2, "unit": "seconds"},
-                "testing_frequency": {"value": 6, "unit": "months"}
-            }
-        ]
+    safety_systems: Optional[List[SafetyDevice]] = Field(
+        default=None,
+        description="Required safety systems and devices"
     )
-    operational_procedures: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Safety-related operational procedures",
-        example=[
-            {
-                "title": "Emergency Shutdown Procedure",
-                "document_number": "SOP-101-ESD",
-                "revision": "Rev.3",
-                "key_steps": [
-                    "Verify alarm condition",
-                    "Initiate emergency shutdown",
-                    "Isolate affected equipment"
-                ],
-                "required_training": "Level_2_Operator"
-            }
-        ]
+    operational_procedures: Optional[List[OperatingProcedure]] = Field(
+        default=None,
+        description="Safety-related operational procedures"
     )
-    maintenance_requirements: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Safety system maintenance requirements",
-        example=[
-            {
-                "equipment": "PSV-101",
-                "task": "relief_valve_testing",
-                "frequency": {"value": 2, "unit": "years"},
-                "acceptance_criteria": "pop_pressure_within_3_percent",
-                "required_certification": "pressure_relief_specialist"
-            }
-        ]
+    maintenance_requirements: Optional[List[SafetyMaintenanceTask]] = Field(
+        default=None,
+        description="Safety system maintenance requirements"
     )
-    personnel_requirements: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Personnel safety requirements",
-        example={
-            "training_requirements": [
-                {
-                    "type": "process_safety_training",
-                    "frequency": "annual",
-                    "target_personnel": ["operators", "maintenance"]
-                }
-            ],
-            "ppe_requirements": [
-                {
-                    "type": "chemical_protective_suit",
-                    "specification": "Level_B",
-                    "conditions_for_use": "during_chemical_handling"
-                }
-            ],
-            "certifications_required": [
-                "confined_space_entry",
-                "hot_work_permit"
-            ]
-        }
+    personnel_requirements: Optional[PersonnelSafety] = Field(
+        default=None,
+        description="Personnel safety requirements"
     )
-    emergency_response: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Emergency response requirements",
-        example={
-            "emergency_procedures": [
-                "activation_of_emergency_shutdown",
-                "area_evacuation",
-                "emergency_services_notification"
-            ],
-            "emergency_equipment": [
-                "fire_suppression_system",
-                "emergency_shower",
-                "escape_breathing_apparatus"
-            ],
-            "communication_protocol": {
-                "primary": "plant_radio",
-                "backup": "emergency_phones"
-            }
-        }
+    emergency_response: Optional[EmergencyResponse] = Field(
+        default=None,
+        description="Emergency response requirements"
     )
-    compliance_requirements: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Regulatory compliance requirements",
-        example={
-            "standards": ["OSHA_PSM", "API_521", "IEC_61511"],
-            "permits_required": ["hot_work", "confined_space"],
-            "inspections": [
-                {
-                    "type": "regulatory_inspection",
-                    "frequency": "annual",
-                    "authority": "state_safety_board"
-                }
-            ]
-        }
+    compliance_requirements: Optional[SafetyCompliance] = Field(
+        default=None,
+        description="Regulatory compliance requirements"
     )
-    documentation: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Required safety documentation",
-        example=[
-            {
-                "type": "safety_case",
-                "document_number": "SC-R101-001",
-                "revision": "Rev.2",
-                "review_frequency": "3_years"
-            },
-            {
-                "type": "risk_assessment",
-                "document_number": "RA-R101-001",
-                "revision": "Rev.1",
-                "review_frequency": "annual"
-            }
-        ]
+    documentation: Optional[List[SafetyDocument]] = Field(
+        default=None,
+        description="Required safety documentation"
     )
 
 class TechnicalDocumentation(BaseModel):
     """Model for technical documentation management"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Unique document identifier",
-        example="DOC-2024-R101-001"  # Document for Reactor 101
+        description="Unique document identifier"
     )
     type: str = Field(
-        description="Type of technical document",
-        example="operating_manual"  # process_description, P&ID, equipment_datasheet
+        description="Type of technical document"  # operating_manual, process_description, P&ID, equipment_datasheet
     )
     title: str = Field(
-        description="Document title",
-        example="Reactor R-101 Operating Manual"
+        description="Document title"
     )
     document_number: Optional[str] = Field(
         default=None,
-        description="Official document number in document management system",
-        example="OM-R101-2024-001"  # Operating Manual for R-101
+        description="Official document number in document management system"
     )
-    revision_control: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Document revision information",
-        example={
-            "current_revision": "Rev.3",
-            "revision_date": "2024-01-15",
-            "revision_history": [
-                {
-                    "revision": "Rev.3",
-                    "date": "2024-01-15",
-                    "changes": "Updated operating parameters",
-                    "approved_by": "John Smith"
-                },
-                {
-                    "revision": "Rev.2",
-                    "date": "2023-06-15",
-                    "changes": "Added safety procedures",
-                    "approved_by": "Jane Doe"
-                }
-            ],
-            "next_review_date": "2025-01-15"
-        }
+    revision_control: Optional[RevisionControl] = Field(
+        default=None,
+        description="Document revision information"
     )
-    content_structure: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Document content organization",
-        example={
-            "sections": [
-                {
-                    "number": "1.0",
-                    "title": "Introduction",
-                    "subsections": ["1.1 Purpose", "1.2 Scope"]
-                },
-                {
-                    "number": "2.0",
-                    "title": "Equipment Description",
-                    "subsections": ["2.1 Design", "2.2 Specifications"]
-                }
-            ],
-            "appendices": [
-                "A. Technical Drawings",
-                "B. Maintenance Procedures"
-            ]
-        }
+    content_structure: Optional[ContentStructure] = Field(
+        default=None,
+        description="Document content organization"
     )
-    related_equipment: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Equipment covered by the document",
-        example=[
-            {
-                "equipment_id": "R-101",
-                "type": "reactor",
-                "description": "Main reaction vessel",
-                "related_systems": ["cooling_system", "control_system"]
-            }
-        ]
+    related_equipment: Optional[List[RelatedEquipment]] = Field(
+        default=None,
+        description="Equipment covered by the document"
     )
-    technical_content: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Technical information and specifications",
-        example={
-            "design_basis": {
-                "capacity": {"value": 1000, "unit": "kg/h"},
-                "operating_pressure": {"value": 10, "unit": "barg"},
-                "design_temperature": {"value": 200, "unit": "°C"}
-            },
-            "operating_procedures": [
-                {
-                    "title": "Normal Startup",
-                    "steps": ["1. Verify utilities", "2. Pressurize system"],
-                    "critical_parameters": ["pressure", "temperature"]
-                }
-            ],
-            "safety_information": {
-                "hazards": ["high_pressure", "high_temperature"],
-                "protective_measures": ["pressure_relief", "temperature_control"]
-            }
-        }
+    technical_content: Optional[TechnicalContent] = Field(
+        default=None,
+        description="Technical information and specifications"
     )
-    references: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Referenced documents and standards",
-        example=[
-            {
-                "document_id": "STD-001",
-                "title": "Process Safety Standard",
-                "revision": "Rev.2",
-                "relevance": "Safety requirements"
-            },
-            {
-                "document_id": "DWG-101",
-                "title": "Reactor Assembly Drawing",
-                "revision": "Rev.1",
-                "relevance": "Equipment details"
-            }
-        ]
+    references: Optional[List[DocumentReference]] = Field(
+        default=None,
+        description="Referenced documents and standards"
     )
-    approval_status: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Document approval information",
-        example={
-            "status": "approved",
-            "approvers": [
-                {
-                    "name": "John Smith",
-                    "role": "Technical Manager",
-                    "date": "2024-01-15"
-                },
-                {
-                    "name": "Jane Doe",
-                    "role": "Operations Manager",
-                    "date": "2024-01-14"
-                }
-            ],
-            "validity_period": {"value": 2, "unit": "years"}
-        }
+    approval_status: Optional[ApprovalStatus] = Field(
+        default=None,
+        description="Document approval information"
     )
-    distribution_control: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Document distribution and access control",
-        example={
-            "access_level": "restricted",
-            "authorized_users": ["operations", "maintenance", "engineering"],
-            "controlled_copies": [
-                {
-                    "copy_number": "1",
-                    "location": "Control Room",
-                    "holder": "Shift Supervisor"
-                }
-            ],
-            "electronic_access": {
-                "path": "/technical_docs/operations/",
-                "permissions": "read_only"
-            }
-        }
+    distribution_control: Optional[DistributionControl] = Field(
+        default=None,
+        description="Document distribution and access control"
     )
-    change_management: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Document change control information",
-        example={
-            "change_procedure": "MOC-DOC-001",
-            "change_requests": [
-                {
-                    "request_id": "CR-2024-001",
-                    "description": "Update operating parameters",
-                    "status": "implemented",
-                    "date": "2024-01-15"
-                }
-            ],
-            "verification_requirements": [
-                "technical_review",
-                "safety_review",
-                "operational_review"
-            ]
-        }
+    change_management: Optional[ChangeManagement] = Field(
+        default=None,
+        description="Document change control information"
     )
-    training_requirements: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Training requirements related to document",
-        example={
-            "required_training": [
-                {
-                    "course": "Reactor Operations",
-                    "target_audience": "operators",
-                    "frequency": "annual"
-                }
-            ],
-            "competency_verification": {
-                "method": "written_test",
-                "passing_score": {"value": 80, "unit": "percent"}
-            }
-        }
+    training_requirements: Optional[TrainingPlan] = Field(
+        default=None,
+        description="Training requirements related to document"
     )
-    attachments: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Document attachments and supporting files",
-        example=[
-            {
-                "file_name": "reactor_diagram.pdf",
-                "type": "technical_drawing",
-                "revision": "Rev.2",
-                "file_path": "/attachments/R101/"
-            }
-        ]
+    attachments: Optional[List[Attachment]] = Field(
+        default=None,
+        description="Document attachments and supporting files"
     )
 
 class ProcessSystem(BaseModel):
     """Model for complete process system integration and overview"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Unique process system identifier",
-        example="PS-2024-UNIT100"  # Process System Unit 100
+        description="Unique process system identifier"
     )
     name: str = Field(
-        description="Name of the process system",
-        example="Catalytic Reforming Complex"
+        description="Name of the process system"
     )
     description: Optional[str] = Field(
         default=None,
-        description="General description of the process system",
-        example="Integrated catalytic reforming unit including feed preparation, reaction system, and product separation"
+        description="General description of the process system"
     )
-    system_boundaries: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="System boundaries and interfaces",
-        example={
-            "upstream_systems": ["naphtha_hydrotreater", "hydrogen_system"],
-            "downstream_systems": ["reformate_splitter", "hydrogen_distribution"],
-            "utility_systems": ["cooling_water", "steam", "power"],
-            "battery_limits": {
-                "north": "Unit_200",
-                "south": "Tank_farm",
-                "east": "Utility_area",
-                "west": "Pipe_rack"
-            }
-        }
+    system_boundaries: Optional[SystemBoundaries] = Field(
+        default=None,
+        description="System boundaries and interfaces"
     )
-    subsystems: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Major subsystems within the process system",
-        example=[
-            {
-                "id": "SUB-001",
-                "name": "feed_preparation",
-                "description": "Feed preheating and preparation system",
-                "equipment": ["E-101", "P-101", "V-101"],
-                "key_parameters": ["feed_temperature", "feed_pressure"]
-            },
-            {
-                "id": "SUB-002",
-                "name": "reaction_system",
-                "description": "Multi-bed catalytic reforming reactors",
-                "equipment": ["R-201", "R-202", "R-203"],
-                "key_parameters": ["reaction_temperature", "hydrogen_recycle_ratio"]
-            }
-        ]
+    subsystems: Optional[List[Subsystem]] = Field(
+        default=None,
+        description="Major subsystems within the process system"
     )
-    process_flows: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Major process flows within the system",
-        example=[
-            {
-                "id": "F-101",
-                "name": "fresh_feed",
-                "type": "process_feed",
-                "from": "naphtha_storage",
-                "to": "feed_preheater",
-                "normal_flow": {"value": 100, "unit": "m3/h"}
-            },
-            {
-                "id": "F-102",
-                "name": "hydrogen_recycle",
-                "type": "recycle",
-                "from": "recycle_compressor",
-                "to": "reactor_inlet",
-                "normal_flow": {"value": 50000, "unit": "Nm3/h"}
-            }
-        ]
+    process_flows: Optional[List[SystemFlow]] = Field(
+        default=None,
+        description="Major process flows within the system"
     )
-    control_philosophy: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="Overall control philosophy and strategy",
-        example={
-            "control_objectives": [
-                "maintain_product_quality",
-                "optimize_energy_efficiency",
-                "ensure_safe_operation"
-            ],
-            "critical_controls": [
-                {
-                    "parameter": "reactor_temperature",
-                    "strategy": "cascade_control",
-                    "importance": "critical"
-                }
-            ],
-            "control_hierarchy": {
-                "regulatory_control": "DCS",
-                "advanced_control": "MPC",
-                "optimization": "RTO"
-            }
-        }
+    control_philosophy: Optional[ControlPhilosophy] = Field(
+        default=None,
+        description="Overall control philosophy and strategy"
     )
-    operating_modes: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Different operating modes of the system",
-        example=[
-            {
-                "mode": "normal_operation",
-                "description": "Standard throughput operation",
-                "key_setpoints": {
-                    "feed_rate": {"value": 100, "unit": "m3/h"},
-                    "reactor_temperature": {"value": 510, "unit": "°C"}
-                }
-            },
-            {
-                "mode": "reduced_throughput",
-                "description": "Operation at reduced capacity",
-                "key_setpoints": {
-                    "feed_rate": {"value": 70, "unit": "m3/h"},
-                    "reactor_temperature": {"value": 505, "unit": "°C"}
-                }
-            }
-        ]
+    operating_modes: Optional[List[OperatingMode]] = Field(
+        default=None,
+        description="Different operating modes of the system"
     )
-    safety_systems: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Integrated safety systems",
-        example=[
-            {
-                "id": "SIS-001",
-                "type": "emergency_shutdown",
-                "coverage": "complete_unit",
-                "sil_level": "SIL-3",
-                "critical_actions": ["isolate_feed", "depressurize_reactors"]
-            }
-        ]
+    safety_systems: Optional[List[SafetyFunction]] = Field(
+        default=None,
+        description="Integrated safety systems"
     )
-    performance_metrics: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="System-wide performance indicators",
-        example={
-            "production": {
-                "throughput": {"target": 100, "unit": "m3/h"},
-                "yield": {"target": 0.92, "unit": "m3/m3"},
-                "quality": {"octane": {"target": 95, "unit": "RON"}}
-            },
-            "efficiency": {
-                "energy_consumption": {"target": 2.5, "unit": "GJ/m3"},
-                "hydrogen_efficiency": {"target": 0.95, "unit": "ratio"}
-            }
-        }
+    performance_metrics: Optional[Dict[InternedStr, Dict[InternedStr, PropertySpec]]] = Field(
+        default=None,
+        description="System-wide performance indicators"
     )
-    integration_points: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="Key integration points with other systems",
-        example=[
-            {
-                "type": "material",
-                "stream": "hydrogen_makeup",
-                "source": "hydrogen_plant",
-                "criticality": "high",
-                "requirements": {
-                    "pressure": {"value": 20, "unit": "barg"},
-                    "purity": {"value": 99.9, "unit": "mol%"}
-                }
-            },
-            {
-                "type": "energy",
-                "service": "steam_supply",
-                "source": "central_utility_plant",
-                "criticality": "medium",
-                "requirements": {
-                    "pressure": {"value": 40, "unit": "barg"},
-                    "temperature": {"value": 250, "unit": "°C"}
-                }
-            }
-        ]
+    integration_points: Optional[List[IntegrationPoint]] = Field(
+        default=None,
+        description="Key integration points with other systems"
     )
-    maintenance_strategy: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
-        description="System-wide maintenance approach",
-        example={
-            "philosophy": "reliability_centered_maintenance",
-            "critical_equipment": ["reactors", "compressors"],
-            "maintenance_intervals": {
-                "catalyst_regeneration": {"value": 12, "unit": "months"},
-                "major_turnaround": {"value": 4, "unit": "years"}
-            }
-        }
+    maintenance_strategy: Optional[MaintenanceStrategy] = Field(
+        default=None,
+        description="System-wide maintenance approach"
     )
-    documentation: Optional[List[Dict[str, Any]]] = Field(
-        default_factory=list,
-        description="System documentation references",
-        example=[
-            {
-                "type": "process_flow_diagram",
-                "number": "PFD-100-001",
-                "revision": "R3",
-                "date": "2024-01-15"
-            },
-            {
-                "type": "operating_manual",
-                "number": "OM-100-001",
-                "revision": "R2",
-                "date": "2024-01-15"
-            }
-        ]
+    documentation: Optional[List[DocumentRecord]] = Field(
+        default=None,
+        description="System documentation references"
     )
 
 class CleanlinessPassport(BaseModel):
     """Model for equipment cleanliness certification and monitoring documentation"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore", json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Unique identifier for cleanliness passport",
-        example="CP-2024-HE101"  # CP = Cleanliness Passport, HE101 = Heat Exchanger 101
+        description="Unique identifier for cleanliness passport"  # CP-2024-HE101, CP = Cleanliness Passport, HE101 = Heat Exchanger 101
     )
     equipment_id: str = Field(
-        description="Equipment identifier for which passport is issued",
-        example="HE-101"  # Heat Exchanger 101
+        description="Equipment identifier for which passport is issued"
     )
     cleanliness_class: str = Field(
-        description="Assigned cleanliness classification level",
-        example="CLASS_1"  # Other examples: CLASS_2, CLASS_3,  based on cleanliness requirements
+        description="Assigned cleanliness classification level"  # CLASS_1, CLASS_2, CLASS_3,  based on cleanliness requirements
     )
     monitoring_regime: str = Field(
-        description="Type of monitoring regime applied to the equipment",
-        example="ENHANCED"  # Other examples: STANDARD, CRITICAL, BASIC
+        description="Type of monitoring regime applied to the equipment"  # ENHANCED, STANDARD, CRITICAL, BASIC
     )
     technical_passport_link: Optional[str] = Field(
         default=None,
-        description="Reference to equipment technical passport document",
-        example="DOC-TP-HE101-2024"
+        description="Reference to equipment technical passport document"
     )
-    threshold_values: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="Threshold values for different parameters",
-        example={
-            "pressure_drop": {
-                "normal": {"min": 0.2, "max": 0.5, "unit": "bar"},
-                "warning": {"min": 0.5, "max": 0.8, "unit": "bar"},
-                "critical": {"value": 1.0, "unit": "bar"}
-            },
-            "heat_transfer_coefficient": {
-                "design": 850,
-                "minimum_acceptable": 680,
-                "unit": "W/m²K",
-                "monitoring_frequency": "daily"
-            },
-            "fouling_factor": {
-                "maximum": 0.0002,
-                "unit": "m²K/W",
-                "action_level": 0.00015
-            }
-        }
+    threshold_values: Optional[Dict[InternedStr, Dict[InternedStr, SpecValue]]] = Field(
+        default=None,
+        description="Threshold values for different parameters"
     )
     fouling_tendency: Optional[str] = Field(
         default=None,
-        description="Equipment's observed fouling characteristics",
-        example="HIGH_SCALING_TENDENCY"  # Other examples: MODERATE_FOULING, LOW_FOULING, SEVERE_BIOFOULING
-    )
-    deposit_analysis: Optional[Dict[str, Any]] = Field(
-        default=None,
-        description="Results from deposit analysis and characterization",
-        example={
-            "last_analysis_date": "2024-01-15",
-            "composition": {
-                "calcium_carbonate": "45%",
-                "iron_oxide": "30%",
-                "organic_matter": "15%",
-                "others": "10%"
-            },
-            "physical_properties": {
-                "thickness": "2.5 mm",
-                "hardness": "moderate",
-                "adhesion": "strong"
-            },
-            "chemical_analysis": {
-                "pH": 7.8,
-                "conductivity": "2500 µS/cm",
-                "chlorides": "150 ppm"
-            }
-        }
+        description="Equipment's observed fouling characteristics"  # HIGH_SCALING_TENDENCY, MODERATE_FOULING, LOW_FOULING, SEVERE_BIOFOULING
     )
-    fouling_dynamics: Optional[Dict[str, Any]] = Field(
-        default=None,
-        description="Observed fouling progression patterns",
-        example={
-            "rate": {"value": 0.1, "unit": "mm/month"},
-            "pattern": "linear",  # Other examples: exponential, asymptotic
-            "seasonal_factors": ["Summer peak", "Winter slowdown"],
-            "contributing_factors": [
-                "High inlet temperature",
-                "Calcium supersaturation",
-                "Low flow periods"
-            ]
-        }
+    deposit_analysis: Optional[DepositAnalysis] = Field(
+        default=None,
+        description="Results from deposit analysis and characterization"
     )
-    cleaning_history: List[Dict[str, Any]] = Field(
-        default_factory=list,
-        description="Historical cleaning operations and their results",
-        example=[
-            {
-                "date": "2024-01-15",
-                "method": "Chemical cleaning - HCl",
-                "contractor": "Industrial Cleaning Services Ltd",
-                "duration": "8 hours",
-                "effectiveness": "90%",
-                "cost": 15000,
-                "observations": "Heavy scale deposits successfully removed",
-                "post_cleaning_inspection": "Passed",
-                "next_cleaning_due": "2024-07-15"
-            }
-        ]
+    fouling_dynamics: Optional[FoulingDynamics] = Field(
+        default=None,
+        description="Observed fouling progression patterns"
+    )
+    cleaning_history: Optional[List[CleaningEvent]] = Field(
+        default=None,
+        description="Historical cleaning operations and their results"
     )
     equipment_cost: Optional[float] = Field(
         default=None,
-        description="Current equipment replacement cost for ROI calculations",
-        example=250000.00  # Currency in base units
+        description="Current equipment replacement cost for ROI calculations"  # Currency in base units
     )
-    cleaning_recommendations: List[str] = Field(
-        default_factory=list,
-        description="Recommended cleaning methods based on fouling history",
-        example=[
-            "Primary: Chemical cleaning with inhibited HCl",
-            "Alternative: High pressure water jetting",
-            "Emergency: Mechanical cleaning with soft scrapers",
-            "Frequency: Every 6 months or at dP > 0.8 bar",
-            "Special considerations: Use corrosion inhibitors during acid cleaning"
-        ]
+    cleaning_recommendations: StrTupleField = Field(
+        description="Recommended cleaning methods based on fouling history"
     )
     cleanliness_index: Optional[float] = Field(
         default=None,
-        description="Current cleanliness performance index (0-1 scale)",
-        example=0.85  # 85% clean relative to design conditions
+        description="Current cleanliness performance index (0-1 scale)"  # 85% clean relative to design conditions
     )
     target_cleanliness_index: Optional[float] = Field(
         default=None,
-        description="Target cleanliness index for optimal operation",
-        example=0.95  # 95% clean relative to design conditions
+        description="Target cleanliness index for optimal operation"  # 95% clean relative to design conditions
     )
-    preventive_measures: List[str] = Field(
-        default_factory=list,
-        description="Implemented fouling prevention measures",
-        example=[
-            "Automated chemical dosing system",
-            "Online fouling monitoring",
-            "Regular water quality monitoring",
-            "Flow rate optimization program",
-            "Temperature control optimization"
-        ]
+    preventive_measures: StrTupleField = Field(
+        description="Implemented fouling prevention measures"
     )
     last_update: datetime = Field(  # Уточнили тип
         default_factory=lambda: datetime.now(),
-        description="Timestamp of last passport update",
-        example="2024-01-20T14:30:00"
+        description="Timestamp of last passport update"
     )
 
 class MonitoringData(BaseModel):
     """Model for equipment monitoring data"""
+    model_config = ConfigDict(use_enum_values=True, json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Monitoring record identifier",
-        example="MON-001"
+        description="Monitoring record identifier"
     )
     equipment_id: str = Field(
-        description="Equipment identifier",
-        example="E-101"
+        description="Equipment identifier"
     )
     timestamp: datetime = Field(
         default_factory=lambda: datetime.now(),  # Добавили default_factory
-        description="Measurement timestamp",
-        example="2024-01-15T12:00:00"
+        description="Measurement timestamp"
     )
     parameters: Dict[str, Any] = Field(
         default_factory=dict,  # Добавили default_factory
-        description="Measured parameters",
-        example={
-            "temperature": 75.5,
-            "pressure": 5.2,
-            "flow_rate": 100.0
-        }
+        description="Measured parameters"
     )
     threshold_violations: Optional[List[Dict[str, Any]]] = Field(
         default=None,
-        description="Threshold violations",
-        example=[{
-            "parameter": "temperature",
-            "value": 85.0,
-            "threshold": 80.0,
-            "severity": "high"
-        }]
+        description="Threshold violations"
     )
     cleanliness_index: Optional[float] = Field(
         default=None,
-        description="Calculated cleanliness index",
-        example=0.85
+        description="Calculated cleanliness index"
     )
     notes: Optional[str] = Field(
         default=None,
-        description="Additional notes",
-        example="Increased fouling rate observed"
+        description="Additional notes"
     )
 
-    class Config:
-        use_enum_values = True
-
 class MonitoringParameter(BaseModel):
     """Model for monitoring parameters"""
+    model_config = ConfigDict(json_schema_extra=_inject_examples)
+
     name: str = Field(
-        description="Parameter name",
-        example="temperature"
+        description="Parameter name"
     )
     value: float = Field(
         default=0.0,  # Добавили default
-        description="Parameter value",
-        example=75.5
+        description="Parameter value"
     )
     unit: str = Field(
-        description="Measurement unit",
-        example="°C"
+        description="Measurement unit"
     )
     threshold_min: Optional[float] = Field(
         default=None,
-        description="Minimum threshold",
-        example=70.0
+        description="Minimum threshold"
     )
     threshold_max: Optional[float] = Field(
         default=None,
-        description="Maximum threshold",
-        example=80.0
+        description="Maximum threshold"
     )
     critical_min: Optional[float] = Field(
         default=None,
-        description="Critical minimum",
-        example=60.0
+        description="Critical minimum"
     )
     critical_max: Optional[float] = Field(
         default=None,
-        description="Critical maximum",
-        example=90.0
+        description="Critical maximum"
     )
 
 class FoulingAnalysis(BaseModel):
     """Model for fouling analysis"""
+    model_config = ConfigDict(json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Analysis identifier",
-        example="ANAL-001"
+        description="Analysis identifier"
     )
     equipment_id: str = Field(
-        description="Equipment identifier",
-        example="E-101"
+        description="Equipment identifier"
     )
     sample_date: datetime = Field(
         default_factory=lambda: datetime.now(),  # Добавили default_factory
-        description="Sample collection date",
-        example="2024-01-15T12:00:00"
+        description="Sample collection date"
     )
     location: str = Field(
-        description="Sampling location",
-        example="Heat exchanger tube inlet"
+        description="Sampling location"
     )
     
     # Физико-химический анализ
     physical_properties: Dict[str, Any] = Field(
         default_factory=dict,
-        description="Physical properties",
-        example={
-            "density": {"value": 1.2, "unit": "g/cm3"},
-            "particle_size": {"value": 0.5, "unit": "mm"}
-        }
+        description="Physical properties"
     )
     
     chemical_composition: Dict[str, Any] = Field(
         default_factory=dict,
-        description="Chemical composition",
-        example={
-            "Fe": {"value": 10, "unit": "%"},
-            "Ca": {"value": 5, "unit": "%"}
-        }
+        description="Chemical composition"
     )
     
     solubility_tests: Dict[str, Any] = Field(
         default_factory=dict,
-        description="Solubility test results",
-        example={
-            "water": "partially soluble",
-            "acid": "fully soluble"
-        }
+        description="Solubility test results"
     )
     
     thermal_analysis: Optional[Dict[str, Any]] = Field(
         default=None,
-        description="Thermal analysis results",
-        example={
-            "decomposition_temp": 400,
-            "phase_changes": ["105°C", "400°C", "600°C"]
-        }
+        description="Thermal analysis results"
     )
 
 class FoulingImpactAssessment(BaseModel):
     """Model for fouling impact assessment"""
+    model_config = ConfigDict(json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Assessment identifier",
-        example="IMP-001"
+        description="Assessment identifier"
     )
     equipment_id: str = Field(
-        description="Equipment identifier",
-        example="E-101"
+        description="Equipment identifier"
     )
     assessment_date: datetime = Field(
         default_factory=lambda: datetime.now(),  # Добавили только default_factory для валидации
-        description="Assessment date",
-        example="2024-01-15T12:00:00"
+        description="Assessment date"
     )
     
     # Экономическое влияние
     economic_impact: Dict[str, Any] = Field(
         default_factory=dict,
-        description="Economic impact assessment",
-        example={
-            "production_loss": {"value": 100000, "currency": "USD"},
-            "energy_efficiency_loss": {"value": 15, "unit": "%"},
-            "cleaning_costs": {"value": 50000, "currency": "USD"}
-        }
+        description="Economic impact assessment"
     )
     
     # Влияние на надежность
     reliability_impact: Dict[str, Any] = Field(
         default_factory=dict,
-        description="Reliability impact assessment",
-        example={
-            "equipment_lifetime_reduction": {"value": 20, "unit": "%"},
-            "failure_probability_increase": {"value": 30, "unit": "%"},
-            "maintenance_frequency_increase": {"value": 2, "unit": "times"}
-        }
+        description="Reliability impact assessment"
     )
     
     # Влияние на качество
     quality_impact: Dict[str, Any] = Field(
         default_factory=dict,
-        description="Quality impact assessment",
-        example={
-            "product_quality_deviation": {"value": 10, "unit": "%"},
-            "off_spec_products": {"value": 5, "unit": "%"}
-        }
+        description="Quality impact assessment"
     )
     
     # Влияние на экологию
     environmental_impact: Optional[Dict[str, Any]] = Field(
         default=None,
-        description="Environmental impact assessment",
-        example={
-            "emissions_increase": {"value": 15, "unit": "%"},
-            "waste_generation": {"value": 2000, "unit": "kg/year"}
-        }
+        description="Environmental impact assessment"
     )
 
 class FoulingRiskAssessment(BaseModel):
     """Model for fouling risk assessment"""
+    model_config = ConfigDict(json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Risk assessment identifier",
-        example="RISK-001"
+        description="Risk assessment identifier"
     )
     equipment_id: str = Field(
-        description="Equipment identifier",
-        example="E-101"
+        description="Equipment identifier"
     )
     assessment_date: datetime = Field(
         default_factory=lambda: datetime.now(),  # Добавили только default_factory для валидации
-        description="Assessment date",
-        example="2024-01-15T12:00:00"
+        description="Assessment date"
     )
     
     # Факторы риска
     risk_factors: List[Dict[str, Any]] = Field(
         default_factory=list,
-        description="Risk factors",
-        example=[{
-            "factor": "temperature_regime",
-            "current_value": 75,
-            "risk_level": "high",
-            "contribution_weight": 0.4
-        }]
+        description="Risk factors"
     )
     
     # Оценка вероятности
     probability_assessment: Dict[str, Any] = Field(
         default_factory=dict,
-        description="Probability assessment",
-        example={
-            "fouling_probability": 0.8,
-            "time_to_critical": {"value": 6, "unit": "months"},
-            "confidence_level": 0.9
-        }
+        description="Probability assessment"
     )
     
     # Меры по снижению рисков
     mitigation_measures: List[Dict[str, Any]] = Field(
         default_factory=list,
-        description="Risk mitigation measures",
-        example=[{
-            "measure": "temperature_optimization",
-            "effectiveness": 0.7,
-            "implementation_cost": 10000,
-            "priority": "high"
-        }]
+        description="Risk mitigation measures"
     )
     
     # Мониторинг рисков
     monitoring_requirements: List[Dict[str, Any]] = Field(
         default_factory=list,
-        description="Risk monitoring requirements",
-        example=[{
-            "parameter": "pressure_drop",
-            "frequency": "daily",
-            "threshold": {"value": 0.5, "unit": "bar"},
-            "action_required": "alert"
-        }]
+        description="Risk monitoring requirements"
     )
 
 class FoulingPrediction(BaseModel):
     """Model for fouling prediction"""
+    model_config = ConfigDict(use_enum_values=True, json_schema_extra=_inject_examples)
+
     id: str = Field(
-        description="Prediction identifier",
-        example="PRED-001"
+        description="Prediction identifier"
     )
     equipment_id: str = Field(
-        description="Equipment identifier",
-        example="E-101"
+        description="Equipment identifier"
     )
     prediction_date: datetime = Field(
         default_factory=lambda: datetime.now(),  # Добавили только default_factory для валидации
-        description="Prediction date",
-        example="2024-01-15T12:00:00"
+        description="Prediction date"
     )
     
     # Прогнозные модели
     fouling_rate_prediction: Dict[str, Any] = Field(
         default_factory=dict,
-        description="Fouling rate prediction",
-        example={
-            "current_rate": {"value": 0.1, "unit": "mm/month"},
-            "predicted_rate": {"value": 0.15, "unit": "mm/month"},
-            "confidence_interval": {"min": 0.12, "max": 0.18}
-        }
+        description="Fouling rate prediction"
     )
     
     time_predictions: Dict[str, Any] = Field(
         default_factory=dict,
-        description="Time-based predictions",
-        example={
-            "time_to_cleaning": {"value": 6, "unit": "months"},
-            "optimal_cleaning_interval": {"value": 8, "unit": "months"}
-        }
+        description="Time-based predictions"
     )
     
     impact_predictions: Dict[str, Any] = Field(
         default_factory=dict,
-        description="Impact predictions",
-        example={
-            "efficiency_loss": {"value": 20, "unit": "%"},
-            "cost_impact": {"value": 100000, "currency": "USD"}
-        }
+        description="Impact predictions"
     )
 
-    class Config:
-        use_enum_values = True
+
+# ============= Bulk Ingestion =============
+
+# Adapters for lists of records coming from the LLM extractor. Feeding raw JSON
+# bytes to validate_json parses and validates in a single pydantic-core pass,
+# without the json.loads dict tree and per-record Model(**d) calls.
+_LIST_ADAPTER_CONFIG = ConfigDict(defer_build=True)
+
+ActionList = TypeAdapter(List[Action], config=_LIST_ADAPTER_CONFIG)
+EquipmentList = TypeAdapter(List[Equipment], config=_LIST_ADAPTER_CONFIG)
+FlowList = TypeAdapter(List[Flow], config=_LIST_ADAPTER_CONFIG)
+ProcessRelationshipList = TypeAdapter(List[ProcessRelationship], config=_LIST_ADAPTER_CONFIG)
+CorrosionList = TypeAdapter(List[Corrosion], config=_LIST_ADAPTER_CONFIG)
+FoulingList = TypeAdapter(List[Fouling], config=_LIST_ADAPTER_CONFIG)
+CoolingSystemList = TypeAdapter(List[CoolingSystem], config=_LIST_ADAPTER_CONFIG)
+MaintenanceList = TypeAdapter(List[Maintenance], config=_LIST_ADAPTER_CONFIG)
+CleaningMethodList = TypeAdapter(List[CleaningMethod], config=_LIST_ADAPTER_CONFIG)
+CleaningProcedureList = TypeAdapter(List[CleaningProcedure], config=_LIST_ADAPTER_CONFIG)
+EconomicsList = TypeAdapter(List[Economics], config=_LIST_ADAPTER_CONFIG)
+EnergyEfficiencyList = TypeAdapter(List[EnergyEfficiency], config=_LIST_ADAPTER_CONFIG)
+DowntimeList = TypeAdapter(List[Downtime], config=_LIST_ADAPTER_CONFIG)
+BypassList = TypeAdapter(List[Bypass], config=_LIST_ADAPTER_CONFIG)
+ResourcePriceList = TypeAdapter(List[ResourcePrice], config=_LIST_ADAPTER_CONFIG)
+ResourceList = TypeAdapter(List[Resource], config=_LIST_ADAPTER_CONFIG)
+ResourceConsumptionList = TypeAdapter(List[ResourceConsumption], config=_LIST_ADAPTER_CONFIG)
+ProcessWasteList = TypeAdapter(List[ProcessWaste], config=_LIST_ADAPTER_CONFIG)
+ProductSpecificationList = TypeAdapter(List[ProductSpecification], config=_LIST_ADAPTER_CONFIG)
+ProcessDescriptionList = TypeAdapter(List[ProcessDescription], config=_LIST_ADAPTER_CONFIG)
+MaterialBalanceList = TypeAdapter(List[MaterialBalance], config=_LIST_ADAPTER_CONFIG)
+ProcessControlList = TypeAdapter(List[ProcessControl], config=_LIST_ADAPTER_CONFIG)
+TechnologicalRegimeList = TypeAdapter(List[TechnologicalRegime], config=_LIST_ADAPTER_CONFIG)
+
+# Row-level sub-models that also arrive on their own as JSON arrays (tier
+# tables, interlock lists, waste analyses). A single row needs no adapter:
+# Model.model_validate reuses the validator built once for the class.
+VolumeTierList = TypeAdapter(List[VolumeTier], config=_LIST_ADAPTER_CONFIG)
+InterlockList = TypeAdapter(List[Interlock], config=_LIST_ADAPTER_CONFIG)
+WasteConstituentList = TypeAdapter(List[WasteConstituent], config=_LIST_ADAPTER_CONFIG)
+
+
+def _keep_error(value: Any, handler: Any) -> Any:
+    """Wrap validator: return the ValidationError of an invalid item instead of raising."""
+    try:
+        return handler(value)
+    except ValidationError as e:
+        return e
+
+
+# One lenient list adapter per model, built on first use
+@functools.cache
+def _lenient(model: type) -> TypeAdapter:
+    """List adapter for `model` whose invalid items come back as their errors."""
+    return TypeAdapter(List[Annotated[model, WrapValidator(_keep_error)]], config=_LIST_ADAPTER_CONFIG)
+
+
+def validate_records(model: type, records: List[Any]):
+    """
+    Validate a list of raw `model` records with one adapter call.
+
+    Returns (valid_records, errors) where errors is a list of
+    (record_index, message) pairs; invalid records are skipped instead of
+    aborting the batch, and every record is validated exactly once. On the
+    success path no exception is constructed. Input that is not a list
+    raises ValidationError.
+    """
+    valid, errors = [], []
+    for index, item in enumerate(_lenient(model).validate_python(records)):
+        if not isinstance(item, ValidationError):
+            valid.append(item)
+            continue
+        messages = [
+            f"{'.'.join(str(part) for part in error['loc']) or '__root__'}: {error['msg']}"
+            for error in item.errors()
+        ]
+        errors.append((index, '; '.join(messages)))
+    return valid, errors
+
+
+def dump_records(adapter: TypeAdapter, records: List[Any], exclude_none: bool = True) -> bytes:
+    """
+    Serialize a list of models to JSON bytes with one adapter call
+    (e.g. dump_records(CorrosionList, items) for a bulk export).
+
+    The whole list is written by pydantic-core in one pass instead of a
+    model_dump() per record followed by json.dumps.
+    """
+    return adapter.dump_json(records, exclude_none=exclude_none)
 
 
 # ============= Base Functions =============
@@ -6287,6 +7573,20 @@ def get_all_models() -> List[str]:
         and obj.__module__ == current_module.__name__
     ])
 
+def warmup_models(names: Optional[List[str]] = None) -> None:
+    """Build validators of deferred models up front (e.g. at worker start-up)."""
+    current_module = sys.modules[__name__]
+    for name in names or get_all_models():
+        getattr(current_module, name).model_rebuild()
+
+@functools.cache
+def _cached_schema(model: type) -> Dict[str, Any]:
+    return model.model_json_schema()
+
+def model_schema(model: type) -> Dict[str, Any]:
+    """JSON schema of a model, built once per model and returned as a copy."""
+    return copy.deepcopy(_cached_schema(model))
+
 def get_all_classes() -> List[str]:
     """Get list of all class names in the module."""
     current_module = sys.modules[__name__]
@@ -6369,6 +7669,9 @@ def _generate_type_example(field_schema: Dict[str, Any]) -> Any:
         return False
     elif field_type == 'array':
         items = field_schema.get('items', {})
+        if '$ref' in items:
+            # Вложенные модели без примера не разворачиваем
+            return []
         return [_generate_type_example(items)]
     elif field_type == 'object':
         if 'properties' in field_schema:
@@ -6607,12 +7910,17 @@ def get_class_details(class_name: str) -> Dict[str, Any]:
             details['fields'] = fields
             
             try:
-                schema = class_obj.model_json_schema()
+                schema = model_schema(class_obj)
                 details['schema'] = schema
             except Exception as e:
                 logger.error(f"Error generating JSON schema for '{class_name}': {str(e)}")
                 raise
 
+            # Примеры из sidecar-файла попадают только в схему
+            for name, prop in schema.get('properties', {}).items():
+                if name in fields and 'example' in prop and 'example' not in fields[name]:
+                    fields[name]['example'] = prop['example']
+
             try:
                 details['example'] = _generate_example(details['schema'])
             except Exception as e:
@@ -6729,11 +8037,11 @@ def main():
             if not class_obj or not issubclass(class_obj, BaseModel):
                 raise ValueError(f"{args.class_name} is not a Pydantic model")
             
-            with open(args.file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(args.file, 'rb') as f:
+                raw = f.read()
             
-            validated = class_obj(**data)
-            result = {"validation": "success", "data": validated.model_dump()}
+            validated = class_obj.model_validate_json(raw)
+            result = {"validation": "success", "data": validated.model_dump(mode="json")}
 
         elif args.command == 'all':
             all_cls = get_all_classes()
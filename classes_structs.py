@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# classes_structs.py
+
+"""msgspec mirrors of the read-heavy models from classes.py.
+
+Bulk JSON (extractor / LLM output) is decoded straight into these frozen
+structs, which is much cheaper than running the pydantic validators of the
+full models. Only the top-level field types are checked: nested sub-records
+stay plain dicts/lists, and optional fields missing from the JSON are UNSET
+(not None), so the model's own defaults apply. Convert a struct to its
+pydantic model with to_model() only where the model API is needed.
+
+In the other direction, snapshot() copies a model into its struct. It
+caches nothing: each call dumps the model again. A caller that serves the
+same record repeatedly (cached reports) keeps the returned struct and
+re-encodes it with encode(); for one-off output model.model_dump_json() is
+the simpler path.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union, get_args, get_origin, get_type_hints
+
+import msgspec
+from msgspec import UNSET, UnsetType
+from pydantic import AwareDatetime, BaseModel, NaiveDatetime
+
+from classes import (
+    Corrosion, Economics, EnergyEfficiency, Fouling, MaintenanceSchedule, MaintenanceTask,
+    MaterialBalance, ProcessControl, ResourceConsumption, ResourcePrice,
+)
+
+
+class CorrosionS(msgspec.Struct, frozen=True, gc=False):
+    """Mirror of classes.Corrosion"""
+    id: str
+    type: Corrosion.model_fields['type'].annotation
+    equipment_id: str
+    location: Union[Optional[str], UnsetType] = UNSET
+    description: Union[Optional[str], UnsetType] = UNSET
+    rate: Union[Optional[float], UnsetType] = UNSET
+    rate_unit: Union[Optional[str], UnsetType] = UNSET
+    severity_assessment: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    monitoring_data: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    root_cause_analysis: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    environmental_conditions: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    material_data: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    mitigation_measures: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    inspection_requirements: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    repair_history: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    economic_impact: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    recommendations: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+
+
+class FoulingS(msgspec.Struct, frozen=True, gc=False):
+    """Mirror of classes.Fouling"""
+    id: str
+    type: Fouling.model_fields['type'].annotation
+    equipment_id: str
+    location: Union[Optional[str], UnsetType] = UNSET
+    description: Union[Optional[str], UnsetType] = UNSET
+    severity_assessment: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    monitoring_data: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    composition: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    operating_conditions: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    rate: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    cleaning_methods: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    prevention_measures: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    economic_impact: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    cleaning_history: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    recommendations: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+
+
+class MaintenanceTaskS(msgspec.Struct, frozen=True, gc=False):
+    """Mirror of classes.MaintenanceTask"""
+    id: str
+    description: Union[Optional[str], UnsetType] = UNSET
+    duration: Union[Optional[float], UnsetType] = UNSET
+    duration_unit: Union[Optional[str], UnsetType] = UNSET
+    required_personnel: Union[Optional[List[str]], UnsetType] = UNSET
+    required_skills: Union[Optional[List[str]], UnsetType] = UNSET
+    tools_equipment: Union[Optional[List[str]], UnsetType] = UNSET
+    tools_required: Union[Optional[List[str]], UnsetType] = UNSET
+    safety_requirements: Union[Optional[List[str]], UnsetType] = UNSET
+    steps: Union[Optional[List[str]], UnsetType] = UNSET
+    acceptance_criteria: Union[Optional[List[str]], UnsetType] = UNSET
+
+
+class MaintenanceScheduleS(msgspec.Struct, frozen=True, gc=False):
+    """Mirror of classes.MaintenanceSchedule"""
+    frequency: Union[Optional[float], UnsetType] = UNSET
+    frequency_unit: Union[Optional[str], UnsetType] = UNSET
+    last_performed: Union[Optional[datetime], UnsetType] = UNSET
+    next_due: Union[Optional[datetime], UnsetType] = UNSET
+    flexibility: Union[Optional[Dict[str, str]], UnsetType] = UNSET
+
+
+class EconomicsS(msgspec.Struct, frozen=True, gc=False):
+    """Mirror of classes.Economics"""
+    id: str
+    metric_type: Economics.model_fields['metric_type'].annotation
+    equipment_id: Union[Optional[str], UnsetType] = UNSET
+    period: Union[Optional[str], UnsetType] = UNSET
+    capital_costs: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    operating_costs: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    maintenance_costs: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    performance_metrics: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    lifecycle_analysis: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    efficiency_metrics: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    cost_drivers: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    optimization_opportunities: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    financial_risks: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    budget_tracking: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    benchmarking: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+
+
+class EnergyEfficiencyS(msgspec.Struct, frozen=True, gc=False):
+    """Mirror of classes.EnergyEfficiency"""
+    id: str
+    energy_type: str
+    equipment_id: Union[Optional[str], UnsetType] = UNSET
+    consumption: Union[Optional[float], UnsetType] = UNSET
+    consumption_unit: Union[Optional[str], UnsetType] = UNSET
+    performance_metrics: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    operating_parameters: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    design_parameters: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    energy_losses: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    monitoring_data: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    improvement_opportunities: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    maintenance_impact: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    economic_analysis: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    benchmarking: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    optimization_controls: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    environmental_impact: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+
+
+class ResourcePriceS(msgspec.Struct, frozen=True, gc=False):
+    """Mirror of classes.ResourcePrice"""
+    id: str
+    resource_id: str
+    type: str
+    price_components: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    validity_period: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    price_formula: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    volume_tiers: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    price_adjustments: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    payment_terms: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    market_references: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    historical_prices: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    price_forecast: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    risk_assessment: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+
+
+class ResourceConsumptionS(msgspec.Struct, frozen=True, gc=False):
+    """Mirror of classes.ResourceConsumption"""
+    id: str
+    resource_id: str
+    equipment_id: Union[Optional[str], UnsetType] = UNSET
+    period: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    consumption_data: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    operating_conditions: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    performance_metrics: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    cost_analysis: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    inventory_impact: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    consumption_pattern: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    quality_parameters: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    optimization_opportunities: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    environmental_impact: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    forecasting: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    documentation: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+
+
+class MaterialBalanceS(msgspec.Struct, frozen=True, gc=False):
+    """Mirror of classes.MaterialBalance"""
+    id: str
+    stage_id: str
+    period: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    input_streams: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    output_streams: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    process_losses: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    conversion_yields: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    component_balances: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    balance_checks: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    inventory_changes: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    key_performance_indicators: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    reconciliation_data: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+
+
+class ProcessControlS(msgspec.Struct, frozen=True, gc=False):
+    """Mirror of classes.ProcessControl"""
+    id: str
+    parameter: str
+    method: str
+    description: Union[Optional[str], UnsetType] = UNSET
+    control_objective: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    control_configuration: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    instruments: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    operating_ranges: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    alarms: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    interlocks: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    performance_metrics: Union[Optional[Dict[str, Dict[str, Any]]], UnsetType] = UNSET
+    tuning_history: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+    maintenance_requirements: Union[Optional[List[Dict[str, Any]]], UnsetType] = UNSET
+
+
+_MODELS = {
+    CorrosionS: Corrosion,
+    FoulingS: Fouling,
+    MaintenanceTaskS: MaintenanceTask,
+    MaintenanceScheduleS: MaintenanceSchedule,
+    EconomicsS: Economics,
+    EnergyEfficiencyS: EnergyEfficiency,
+    ResourcePriceS: ResourcePrice,
+    ResourceConsumptionS: ResourceConsumption,
+    MaterialBalanceS: MaterialBalance,
+    ProcessControlS: ProcessControl,
+}
+_STRUCTS = {model: struct for struct, model in _MODELS.items()}
+
+
+def _shape(annotation: Any) -> frozenset:
+    """JSON shape(s) of a field type: "object", "array", "number" or a scalar type name.
+
+    Mirrors keep nested records as plain dicts/lists, so only this top-level
+    shape is comparable between a struct field and its model field.
+    """
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _shape(get_args(annotation)[0])
+    if origin is Union:
+        members = (a for a in get_args(annotation) if a not in (type(None), UnsetType))
+        return frozenset().union(*map(_shape, members))
+    if origin is Literal:
+        return frozenset(type(v).__name__ for v in get_args(annotation))
+    if origin is dict or (isinstance(annotation, type) and issubclass(annotation, BaseModel)):
+        return frozenset({"object"})
+    if origin in (list, tuple):
+        return frozenset({"array"})
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return frozenset(type(m.value).__name__ for m in annotation)
+    if annotation in (int, float):
+        return frozenset({"number"})
+    if annotation in (NaiveDatetime, AwareDatetime) or (
+        isinstance(annotation, type) and issubclass(annotation, datetime)
+    ):
+        return frozenset({"datetime"})
+    return frozenset({getattr(annotation, "__name__", repr(annotation))})
+
+
+# The pydantic models are the single source of truth: fail at import if a
+# mirror drifts from its model's field set or a field's top-level shape.
+for _struct, _model in _MODELS.items():
+    _drift = set(_struct.__struct_fields__) ^ set(_model.model_fields)
+    if not _drift:
+        _hints = get_type_hints(_struct, include_extras=True)
+        _drift = {
+            name for name, field in _model.model_fields.items()
+            if _shape(_hints[name]) != _shape(field.annotation)
+        }
+    if _drift:
+        raise RuntimeError(f"{_struct.__name__} is out of sync with {_model.__name__}: {sorted(_drift)}")
+
+# Decoders are built once; reuse them for every JSON blob.
+CorrosionDecoder = msgspec.json.Decoder(CorrosionS)
+FoulingDecoder = msgspec.json.Decoder(FoulingS)
+MaintenanceTaskDecoder = msgspec.json.Decoder(MaintenanceTaskS)
+MaintenanceScheduleDecoder = msgspec.json.Decoder(MaintenanceScheduleS)
+CorrosionListDecoder = msgspec.json.Decoder(List[CorrosionS])
+FoulingListDecoder = msgspec.json.Decoder(List[FoulingS])
+EconomicsDecoder = msgspec.json.Decoder(EconomicsS)
+EnergyEfficiencyDecoder = msgspec.json.Decoder(EnergyEfficiencyS)
+ResourcePriceListDecoder = msgspec.json.Decoder(List[ResourcePriceS])
+ResourceConsumptionListDecoder = msgspec.json.Decoder(List[ResourceConsumptionS])
+MaterialBalanceListDecoder = msgspec.json.Decoder(List[MaterialBalanceS])
+ProcessControlListDecoder = msgspec.json.Decoder(List[ProcessControlS])
+
+encode = msgspec.json.Encoder().encode
+
+
+def to_model(struct: msgspec.Struct):
+    """Validate a decoded struct into its pydantic model.
+
+    The struct is turned back into builtins (UNSET fields are left out, so
+    the model's defaults apply) and validated in full, which gives exactly
+    the model that Model.model_validate_json() would build from the same
+    JSON. Keep the raw bytes and call model_validate_json() directly when
+    every record needs the model anyway; the structs only pay off when most
+    records never need it.
+    """
+    return _MODELS[type(struct)].model_validate(msgspec.to_builtins(struct))
+
+
+def snapshot(model) -> msgspec.Struct:
+    """Frozen struct copy of a pydantic model (a fresh model_dump() on every call).
+
+    Only worth it when the caller keeps the struct and encodes it many
+    times; otherwise use model.model_dump_json().
+    """
+    return _STRUCTS[type(model)](**model.model_dump(mode="json", warnings=False))
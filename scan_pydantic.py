@@ -3,7 +3,7 @@
 import logging
 import json
 import inspect
-from typing import Any, Dict, List, Optional, Union, get_origin, get_args
+from typing import Any, Dict, List, Literal, Optional, Union, get_origin, get_args
 from datetime import datetime, date
 from pydantic import BaseModel, ValidationError
 from classes import get_all_models, get_all_enums
@@ -43,6 +43,10 @@ def generate_test_value(annotation):
             if arg is not type(None):
                 return generate_test_value(arg)
     
+    # Обработка Literal: берем первое допустимое значение
+    if origin is Literal:
+        return args[0]
+    
     # Обработка списков
     if origin is list or origin is List:
         if args:
@@ -50,6 +54,12 @@ def generate_test_value(annotation):
             return [generate_test_value(args[0])]
         return []
     
+    # Обработка кортежей вида Tuple[X, ...]
+    if origin is tuple:
+        if args:
+            return [generate_test_value(args[0])]
+        return []
+    
     # Обработка словарей
     if origin is dict or origin is Dict:
         if len(args) >= 2:
@@ -1,10 +1,14 @@
 #!/usr/bin/env python
 import sys
 import traceback
+import json
 import logging
+from datetime import datetime
 
-from typing import Any, Dict
-from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+
+import msgspec
+from pydantic import BaseModel, ValidationError
 
 # ---------------------------
 # Импортируем ваши же функции:
@@ -16,75 +20,293 @@ from classes import (
     get_class_details,
     Action,
     ActionType,
+    AffectedSystem,
+    AlarmPoint,
+    Approval,
+    ApprovalStatus,
+    Attachment,
+    BalanceCheck,
+    BalancePeriod,
+    BalanceStream,
+    Blowdown,
+    BudgetTracking,
     Bypass,
     BypassType,
+    CatalystSpec,
+    CertificationRequirements,
+    ChangeManagement,
+    ChangeRequest,
+    ChemicalCleaningOption,
+    CleaningChemical,
+    CleaningEvent,
+    CleaningLogEntry,
     CleaningMethod,
+    CleaningOption,
+    CleaningParameter,
     CleaningProcedure,
+    CleaningRecord,
+    CleaningStep,
     CleaningType,
     CleanlinessClass,
     CleanlinessPassport,
+    CompetencyCheck,
+    ComponentBalance,
+    ComponentFraction,
     ComponentProperty,
     Connection,
+    ConsumptionForecast,
+    ConsumptionPattern,
+    ConsumptionProfile,
+    ContentStructure,
+    ControlAspects,
+    ControlConfiguration,
+    ControlInstrument,
+    ControlLoop,
+    ControlMaintenance,
+    ControlObjective,
+    ControlPhilosophy,
+    ControlPoint,
+    ControlSetpoint,
+    ControlStrategy,
+    ControlledCopy,
+    CooledExchanger,
+    CoolingEfficiency,
+    CoolingLimits,
     CoolingSystem,
     CoolingSystemType,
+    CoolingTower,
     Corrosion,
+    CorrosionEnvironment,
+    CorrosionReading,
+    CorrosionSeverity,
     CorrosionType,
+    CostAnalysis,
+    CostBenchmark,
+    CostDriver,
+    CostSavingOpportunity,
+    CostTracking,
+    CriticalControl,
+    CriticalParameter,
+    DepositAnalysis,
+    DepositComponent,
+    DesignParameters,
     DisposalMethod,
+    DistributionControl,
+    DocumentRecord,
+    DocumentReference,
+    DocumentSection,
     Downtime,
+    DowntimeCause,
+    DowntimeImpact,
+    DowntimeTiming,
     DowntimeType,
     EconomicMetricType,
     Economics,
+    EfficiencyReading,
+    EmergencyResponse,
+    EnergyAmount,
+    EnergyBenchmark,
     EnergyEfficiency,
+    EnergyLoss,
+    EnergySavingOpportunity,
     EnergyType,
+    EnvironmentalAspects,
     Equipment,
+    EquipmentSetting,
     Event,
     EventType,
+    FanDetails,
+    FinancialRisk,
     Flow,
     FlowType,
     Fouling,
     FoulingAnalysis,
+    FoulingConditions,
+    FoulingDynamics,
     FoulingImpactAssessment,
     FoulingPrediction,
+    FoulingRate,
+    FoulingReading,
     FoulingRiskAssessment,
+    FoulingSeverity,
     FoulingType,
+    GenerationRate,
+    HandlingRequirements,
+    HazardControl,
+    HeatTransferReading,
+    ImpactAspect,
     ImpactCategory,
     ImpactLevel,
+    InspectionRequirement,
+    InspectionRequirements,
     Instrument,
+    IntegrationPoint,
+    Interlock,
+    InventoryChange,
+    InventoryImpact,
+    InventoryLevels,
     KnowledgeType,
     Language,
+    LessonLearned,
+    Limits,
     Maintenance,
     MaintenanceCategory,
+    MaintenanceDetails,
+    MaintenanceImpact,
+    MaintenancePlan,
+    MaintenanceRecord,
+    MaintenanceRequirement,
+    MaintenanceResources,
     MaintenanceSchedule,
+    MaintenanceStrategy,
     MaintenanceTask,
     MaintenanceType,
+    MakeupWater,
+    MarketReference,
     MaterialBalance,
+    MaterialData,
+    MaterialRequirement,
+    MechanicalCleaningOption,
+    MitigationAction,
+    MitigationMeasure,
     MonitoringData,
     MonitoringParameter,
     MonitoringRegime,
+    MonitoringRequirement,
+    NamedParameter,
+    OperatingCondition,
+    OperatingConstraint,
+    OperatingMode,
+    OperatingParameters,
+    OperatingProcedure,
+    OptimizationControl,
+    OverrideCondition,
+    PPEItem,
     Parameter,
+    PaymentTerms,
+    PerformanceParameters,
+    PersonnelRequirement,
+    PersonnelSafety,
     PhaseState,
     PhysicalProperty,
+    PressureDropReading,
+    PreventionMeasure,
+    PriceAdjustment,
+    PriceComponent,
+    PriceFactor,
+    PriceFormula,
+    PriceOutlook,
+    PricePoint,
+    PriceRisk,
     PriceType,
+    ProcessChemistry,
     ProcessControl,
     ProcessDescription,
+    ProcessLoss,
     ProcessRelationship,
+    ProcessRelease,
+    ProcessStage,
     ProcessSystem,
     ProcessWaste,
+    ProductCompliance,
+    ProductHandling,
     ProductSpecification,
+    ProductStorage,
+    ProductionLoss,
+    PropertySpec,
+    ProtectionLayer,
+    PumpSpec,
+    QualityCheck,
+    QualityParameter,
+    QualityRequirement,
+    QualityTrend,
+    Quantity,
+    QuantityRange,
+    RangeValue,
+    RawMaterialSupply,
+    Reaction,
+    Recommendation,
+    Reconciliation,
+    RecordReference,
+    RecordRequirement,
+    ReferenceComparison,
+    RegimeFlow,
+    RegimeMaterials,
+    RegimeParameter,
+    RegimeTransition,
+    RegulatoryCompliance,
+    RelatedEquipment,
+    RelationshipNature,
+    RepairRecord,
     Resource,
     ResourceCategory,
     ResourceConsumption,
+    ResourceCost,
+    ResourceItem,
     ResourcePrice,
+    RetentionPeriod,
+    RevisionControl,
+    RevisionRecord,
     Risk,
     RiskSeverity,
     RiskType,
+    RootCauseAnalysis,
+    SafetyCompliance,
+    SafetyDevice,
+    SafetyDocument,
+    SafetyFunction,
+    SafetyInformation,
+    SafetyMaintenanceTask,
+    SafetyPrecaution,
     SafetyRequirement,
+    SafetyScope,
+    ScalarValue,
+    ScheduleFlexibility,
+    SideConditions,
+    SideQuantities,
+    StageParameter,
+    StorageRequirements,
+    StreamAdjustment,
+    Subsystem,
+    Supplier,
+    SystemBoundaries,
+    SystemFlow,
+    TechnicalContent,
     TechnicalDocumentation,
     TechnologicalRegime,
+    TestRequirement,
+    ThicknessReading,
+    TimePeriod,
+    TrainingCourse,
+    TrainingPlan,
+    TransitionStep,
+    TreatmentChemical,
+    TreatmentProcess,
+    TreatmentResidual,
+    TuningRecord,
+    UtilityRequirement,
+    VisualReading,
+    VolumeTier,
+    WallTemperature,
+    WasteClassification,
     WasteComponent,
+    WasteConstituent,
+    WasteHandling,
+    WasteHandlingRequirements,
     WasteNorm,
-    WasteType
+    WastePhysicalProperties,
+    WasteShipment,
+    WasteSource,
+    WasteType,
+    WaterParameter,
+    WaterTreatment
     )
+from classes import (
+    ActionList, MaterialBalanceList,
+    dump_records, model_schema, split_quantity, validate_records,
+)
+import classes
+import classes_structs
 
 
 logging.basicConfig(
@@ -155,6 +377,250 @@ def scan_all_pydantic_models() -> None:
     logger.info("========================\n")
 
 
+# ---------------------------
+# Точечные тесты (pytest)
+# ---------------------------
+
+def _fails(fn, *args, **kwargs) -> bool:
+    """True, если вызов отклонён валидацией"""
+    try:
+        fn(*args, **kwargs)
+    except (ValidationError, ValueError):
+        return True
+    return False
+
+
+def test_range_or_scalar_legacy_inputs():
+    make = lambda v: ComponentProperty(name="H2S", unit="%", concentration=v).concentration
+    assert make(0.9) == ScalarValue(value=0.9)
+    assert make("0.9") == ScalarValue(value=0.9)
+    assert make({"value": 0.9}) == ScalarValue(value=0.9)
+    assert make({"min": 0.1, "max": 0.5}) == RangeValue(min=0.1, max=0.5)
+    assert make({"max": 0.5}) == RangeValue(max=0.5)
+
+
+def test_range_or_scalar_rejects_unknown_shapes():
+    make = lambda v: ComponentProperty(name="H2S", unit="%", concentration=v)
+    assert _fails(make, "n/a")
+    assert _fails(make, {"average": 0.9})
+    assert _fails(make, {"min": 0.1, "avg": 0.3})
+
+
+def test_waste_component_concentration_legacy_inputs():
+    make = lambda v: WasteComponent(name="Нефтепродукты", unit="mg/l", concentration=v).concentration
+    assert make(12) == ScalarValue(value=12.0)
+    assert make("12.5") == ScalarValue(value=12.5)
+    assert make({"value": 12.5}) == ScalarValue(value=12.5)
+    assert make({"min": 5, "max": 20}) == RangeValue(min=5.0, max=20.0)
+    assert _fails(make, {"min": 5, "typical": 10})
+
+
+def _example(cls) -> Dict[str, Any]:
+    """Пример модели, собранный get_class_details() из examples/"""
+    return get_class_details(cls.__name__)["example"]
+
+
+def test_top_level_records_ignore_extra_keys_and_are_frozen():
+    records = (
+        Bypass, CleaningMethod, CleaningProcedure, CleanlinessPassport, CoolingSystem, Corrosion,
+        Downtime, Economics, EnergyEfficiency, Fouling, Maintenance, MaintenanceSchedule,
+        MaintenanceTask, MaterialBalance, ProcessControl, ProcessDescription, ProcessSystem,
+        ProcessWaste, ProductSpecification, Resource, ResourceConsumption, ResourcePrice,
+        SafetyRequirement, TechnicalDocumentation, TechnologicalRegime,
+    )
+    for cls in records:
+        example = _example(cls)
+        record = cls.model_validate({**example, "llm_comment": "лишний ключ"})
+        assert record.model_extra is None and record == cls.model_validate(example), cls.__name__
+        assert _fails(setattr, record, "id", "changed"), cls.__name__
+
+
+def test_component_balance_matrix_signs_outputs():
+    fractions = lambda h2, ch4: [{"component": "H2", "value": h2}, {"component": "CH4", "value": ch4}]
+    balance = MaterialBalance.model_validate({
+        "id": "MB-1",
+        "stage_id": "ST-1",
+        "input_streams": [
+            {"name": "feed", "quantity": {"value": 100, "unit": "t/h"}, "composition": fractions(0.2, 0.8)},
+            {"name": "recycle", "composition": fractions(0.5, 0.5)},
+        ],
+        "output_streams": [
+            {"name": "product", "quantity": {"value": 90, "unit": "t/h"}, "composition": fractions(0.1, 0.9)},
+        ],
+    })
+    components, flows, rows = balance.component_balance_matrix()
+    assert components == ["H2", "CH4"]
+    assert flows == [100.0, None, -90.0]
+    components, flows, rows = balance.component_balance_matrix(missing_flow=0.0)
+    net = [sum(f * row[j] for f, row in zip(flows, rows)) for j in range(len(components))]
+    assert net == [100 * 0.2 - 90 * 0.1, 100 * 0.8 - 90 * 0.9]
+
+
+def test_validate_records_mixed_batch():
+    good = _example(Action)
+    records = [good, {"description": "без id"}, {**good, "id": "ACT-002"}, "не запись"]
+    valid, errors = validate_records(Action, records)
+    assert valid == [Action.model_validate(good), Action.model_validate({**good, "id": "ACT-002"})]
+    assert [index for index, _ in errors] == [1, 3]
+    assert errors[0][1].startswith("id: ")
+    assert errors[1][1].startswith("__root__: ")
+    assert validate_records(Action, [good]) == ([Action.model_validate(good)], [])
+    assert _fails(validate_records, Action, {"id": "ACT-001"})
+
+
+def test_dump_records_round_trip():
+    records = [Action.model_validate(_example(Action)), Action(id="ACT-002", description="Замена прокладки")]
+    raw = dump_records(ActionList, records)
+    assert json.loads(raw) == [r.model_dump(mode="json", exclude_none=True) for r in records]
+    assert ActionList.validate_json(raw) == records
+
+
+def test_tagged_union_falls_back_to_other():
+    corrosion = Corrosion.model_validate({
+        "id": "COR-1",
+        "type": "pitting_corrosion",
+        "equipment_id": "E-101",
+        "monitoring_data": [
+            {"method": "ultrasonic_thickness", "location": "shell"},
+            {"method": "visual_inspection", "findings": "pits"},
+            {"method": "eddy_current"},
+            {"location": "nozzle"},
+        ],
+    })
+    kinds = [type(r) for r in corrosion.monitoring_data]
+    assert kinds == [ThicknessReading, VisualReading, CorrosionReading, CorrosionReading]
+
+
+def test_split_quantity():
+    data = {"id": "MT-1", "duration": {"value": 4, "unit": "h"}}
+    assert split_quantity(data, "duration") == {"id": "MT-1", "duration": 4, "duration_unit": "h"}
+    assert split_quantity({**data, "duration_unit": "min"}, "duration")["duration_unit"] == "min"
+    assert split_quantity({"duration": 4}, "duration") == {"duration": 4}
+    task = MaintenanceTask.model_validate(data)
+    assert (task.duration, task.duration_unit) == (4.0, "h")
+
+
+def test_columnar_batch():
+    example = _example(Economics)
+    records = [Economics.model_validate(example), Economics(id="EC-2", metric_type="capital_cost")]
+    batch = Economics.Batch()
+    batch.extend(records)
+    assert len(batch) == 2
+    assert batch.column("id") == [example["id"], "EC-2"]
+    equipment_cost = float(example["capital_costs"]["equipment_cost"]["value"])
+    assert batch.quantity_values("capital_costs", key="equipment_cost") == [equipment_cost, None]
+    assert list(batch.iter_rows()) == records
+
+
+def test_closure_vector():
+    q = lambda value: {"value": value, "unit": "t"}
+    balance = MaterialBalance.model_validate({
+        "id": "MB-1",
+        "stage_id": "ST-1",
+        "component_balances": [
+            {"component": "H2", "input": q(100), "output": q(90), "accumulated": q(5), "lost": q(3)},
+            {"component": "CH4", "input": q(50), "output": q(50)},
+            {"component": "N2", "input": q(0), "output": q(1)},
+            {"component": "CO", "output": q(1)},
+        ],
+    })
+    assert balance.balance_columns()["component"] == ["H2", "CH4", "N2", "CO"]
+    assert balance.closure_vector() == [98.0, 100.0, None, None]
+
+
+def test_technological_regime_check():
+    regime = TechnologicalRegime.model_validate({
+        "id": "TR-1",
+        "name": "Риформинг",
+        "operating_parameters": [
+            {"parameter": "temperature", "target": {"value": 495, "unit": "°C"},
+             "range": {"min": {"value": 480, "unit": "°C"}, "max": 510}},
+            {"parameter": "pressure", "range": {"max": 3.5}},
+            {"parameter": "flow"},
+        ],
+    })
+    assert regime.limits_table() == (
+        ["temperature", "pressure", "flow"],
+        [(495.0, 480.0, 510.0), (None, None, 3.5), (None, None, None)],
+    )
+    assert regime.check({"temperature": 520, "pressure": 3.0}) == {
+        "temperature": False, "pressure": True, "flow": None,
+    }
+
+
+def test_model_schema_is_cached_copy():
+    first = model_schema(ProcessSystem)
+    hits = classes._cached_schema.cache_info().hits
+    first["properties"].clear()
+    second = model_schema(ProcessSystem)
+    assert classes._cached_schema.cache_info().hits == hits + 1
+    assert second["properties"] and second == ProcessSystem.model_json_schema()
+    assert "example" in second["properties"]["subsystems"]
+
+
+def test_struct_snapshot_encode_round_trip():
+    for model, struct in classes_structs._STRUCTS.items():
+        record = model.model_validate(_example(model))
+        assert isinstance(classes_structs.snapshot(record), struct)
+        assert model.model_validate_json(classes_structs.encode(classes_structs.snapshot(record))) == record
+
+
+def _struct_round_trip(cls, payload: Dict[str, Any]):
+    """(to_model(decode(x)), cls.model_validate_json(x)) для одного JSON"""
+    raw = json.dumps(payload, ensure_ascii=False)
+    struct = classes_structs._STRUCTS[cls]
+    return classes_structs.to_model(msgspec.json.decode(raw, type=struct)), cls.model_validate_json(raw)
+
+
+def test_struct_to_model_matches_model_validate_json():
+    for cls in (Corrosion, Fouling, MaintenanceTask, MaintenanceSchedule):
+        converted, validated = _struct_round_trip(cls, _example(cls))
+        assert converted == validated, cls.__name__
+
+
+def test_struct_to_model_economics_and_energy_efficiency():
+    for cls in (Economics, EnergyEfficiency):
+        converted, validated = _struct_round_trip(cls, _example(cls))
+        assert converted == validated, cls.__name__
+    # Отсутствующие поля получают значения по умолчанию модели, а не None
+    converted, validated = _struct_round_trip(EnergyEfficiency, {"id": "EE-1", "energy_type": "steam"})
+    assert converted == validated
+
+
+def test_struct_to_model_resource_price_and_consumption():
+    for cls in (ResourcePrice, ResourceConsumption):
+        converted, validated = _struct_round_trip(cls, _example(cls))
+        assert converted == validated, cls.__name__
+    converted, _ = _struct_round_trip(ResourcePrice, _example(ResourcePrice))
+    assert all(isinstance(d, datetime) for d in converted.price_series()["date"])
+
+
+def test_struct_to_model_material_balance_and_process_control():
+    for cls in (MaterialBalance, ProcessControl):
+        converted, validated = _struct_round_trip(cls, _example(cls))
+        assert converted == validated, cls.__name__
+    balance, validated = _struct_round_trip(MaterialBalance, _example(MaterialBalance))
+    assert isinstance(balance.period.start_time, datetime)
+    assert balance.balance_columns() == validated.balance_columns()
+    assert balance.closure_vector() == validated.closure_vector()
+    control, _ = _struct_round_trip(ProcessControl, _example(ProcessControl))
+    assert all(isinstance(v, BaseModel) for v in control.operating_ranges.values())
+    assert all(isinstance(m, (BaseModel, float)) for g in control.performance_metrics.values() for m in g.values())
+    raw = json.dumps([_example(MaterialBalance)] * 2, ensure_ascii=False)
+    structs = classes_structs.MaterialBalanceListDecoder.decode(raw)
+    assert [classes_structs.to_model(s) for s in structs] == MaterialBalanceList.validate_json(raw)
+
+
+def test_struct_drift_check_compares_field_shapes():
+    shape = classes_structs._shape
+    period = MaterialBalance.model_fields["period"].annotation
+    assert shape(classes_structs.MaterialBalanceS.__annotations__["period"]) == shape(period)
+    assert shape(Optional[str]) != shape(period)
+    assert shape(Optional[List[Dict[str, Any]]]) != shape(period)
+    method = ProcessControl.model_fields["method"].annotation
+    assert shape(classes_structs.ProcessControlS.__annotations__["method"]) == shape(method)
+
+
 def main():
     logger.info("Начинаем сканирование классов для проверки Pydantic-моделей...")
     scan_all_pydantic_models()